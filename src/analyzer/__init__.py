@@ -8,12 +8,45 @@
 4. 合作关系分析
 5. 研究领域分析
 6. 影响力分析
+7. 超过内存数据的分块统计
 """
 
 from .base import BaseAnalyzer
 from .award import AwardAnalyzer
+from .impact import ImpactScorer
+from .cooccurrence import CooccurrenceMatrix
+from .network import NetworkMetrics
+from .cache import AnalysisCache, analysis_cache, frame_fingerprint
+from .runner import AnalysisRunner
+from .incremental import IncrementalAggregator, PairCounter
+from .chunked import ChunkedAnalyzer
+from .text import TextAnalysisService, get_text_service
+from .field import FieldAnalyzer
+from .region import RegionResolver, get_region_resolver
+from .cube import AggregateCube, get_store_cube
+from .loader import ExcelLoader, requires, declared_columns
 
 __all__ = [
     'BaseAnalyzer',
-    'AwardAnalyzer'
+    'AwardAnalyzer',
+    'ImpactScorer',
+    'CooccurrenceMatrix',
+    'NetworkMetrics',
+    'AnalysisCache',
+    'analysis_cache',
+    'frame_fingerprint',
+    'AnalysisRunner',
+    'IncrementalAggregator',
+    'PairCounter',
+    'ChunkedAnalyzer',
+    'TextAnalysisService',
+    'get_text_service',
+    'FieldAnalyzer',
+    'RegionResolver',
+    'get_region_resolver',
+    'AggregateCube',
+    'get_store_cube',
+    'ExcelLoader',
+    'requires',
+    'declared_columns'
 ] 
\ No newline at end of file
@@ -7,6 +7,21 @@ from loguru import logger
 import networkx as nx
 
 from .base import BaseAnalyzer
+from .impact import ImpactScorer
+from .cooccurrence import CooccurrenceMatrix
+from .network import NetworkMetrics, compute_metrics
+from .cache import memoized
+from .runner import AnalysisRunner
+from .incremental import IncrementalAggregator
+from .chunked import ChunkedAnalyzer
+from .text import get_text_service
+from .field import FieldAnalyzer
+from .region import get_region_resolver
+from .cube import AggregateCube
+from .loader import ExcelLoader, requires, declared_columns
+from config.config import NETWORK_CONFIG, ANALYSIS_CONFIG
+from storage.sqlite import AwardStore
+from storage.columnar import get_columnar_store
 
 class AwardAnalyzer(BaseAnalyzer):
     """奖项分析器"""
@@ -26,22 +41,72 @@ class AwardAnalyzer(BaseAnalyzer):
             }
         super().__init__(data)
         self.results = {}
+        self.config = {
+            'network_min_weight': NETWORK_CONFIG.get('min_weight', 2)
+        }
+        
+        # 最近一次 analyze() 中各项分析的耗时（秒）
+        self.timings = {}
     
-    def load_data(self, excel_path: str) -> None:
+    def load_data(self, excel_path: str, analyses: Optional[List[str]] = None) -> None:
         """
         从Excel文件加载数据
         
+        打开文件时只读取工作表名称，各数据表在首次使用时才读取，且只读取所需分析
+        声明的列（如奖项全文 content 不参与分析，不会读取）。
+        
         Args:
             excel_path: Excel文件路径
+            analyses: 将要执行的分析方法名，如 ['get_yearly_stats']，默认为全部分析
         """
         try:
             logger.info(f"从Excel文件加载数据: {excel_path}")
             
-            # 读取Excel文件中的所有sheet
-            data = {}
-            with pd.ExcelFile(excel_path) as xls:
-                for sheet_name in xls.sheet_names:
-                    data[sheet_name] = pd.read_excel(xls, sheet_name)
+            # Excel不保存列类型，各表读取后重新应用数据类型模式；旧文件缺少整数键时按名称补充
+            loader = ExcelLoader(excel_path)
+            columns = declared_columns(type(self), analyses)
+            self.set_loader(loader, columns)
+            
+            tables = ', '.join(sorted(columns)) if columns is not None else '全部'
+            logger.info(f"数据文件已打开，按需读取数据表: {tables}")
+            
+        except Exception as e:
+            logger.error(f"加载数据失败: {str(e)}")
+    
+    def load_columns(self, directory: str, analyses: Optional[List[str]] = None) -> None:
+        """
+        从列式缓存加载数据
+        
+        各列以内存映射方式读取，同一缓存在进程内共享、在进程间共享操作系统页缓存；
+        与 load_data 相同，数据表在首次使用时才读取，且只读取所需分析声明的列。
+        
+        Args:
+            directory: 列式缓存目录
+            analyses: 将要执行的分析方法名，默认为全部分析
+        """
+        try:
+            logger.info(f"从列式缓存加载数据: {directory}")
+            
+            store = get_columnar_store(directory)
+            if store is None:
+                raise FileNotFoundError(f"列式缓存不存在: {directory}")
+            self.set_loader(store, declared_columns(type(self), analyses))
+            
+        except Exception as e:
+            logger.error(f"从列式缓存加载数据失败: {str(e)}")
+    
+    def load_store(self, db_path: str = None, **filters) -> None:
+        """
+        从数据库加载数据
+        
+        Args:
+            db_path: 数据库文件路径，默认读取 STORAGE_CONFIG
+            **filters: 过滤条件（year/award_type/award_level）
+        """
+        try:
+            logger.info(f"从数据库加载数据: {filters or '全部'}")
+            
+            data = AwardStore(db_path).load_frames(**filters)
             
             # 更新DataFrame
             self.awards_df = data.get('awards', pd.DataFrame())
@@ -51,7 +116,7 @@ class AwardAnalyzer(BaseAnalyzer):
             logger.info(f"数据加载成功: {len(self.awards_df)} 条奖项, {len(self.projects_df)} 个项目, {len(self.winners_df)} 名获奖人")
             
         except Exception as e:
-            logger.error(f"加载数据失败: {str(e)}")
+            logger.error(f"从数据库加载数据失败: {str(e)}")
     
     def load_results(self, results_dir: str) -> None:
         """
@@ -97,27 +162,113 @@ class AwardAnalyzer(BaseAnalyzer):
     def analyze(self) -> None:
         """
         执行分析
+        
+        各项分析互不依赖，由 AnalysisRunner 并发执行；网络分析依赖合作网络的构建。
+        各项分析的耗时记录在 self.timings 中。
         """
         try:
             logger.info("开始执行分析")
             
+            # 预先计算数据指纹，避免各线程重复计算
+            self.data_fingerprint()
+            min_weight = self.config['network_min_weight']
+            
+            runner = AnalysisRunner()
+            runner.add('basic_stats', self.get_basic_stats)
+            runner.add('yearly_stats', self.get_yearly_stats)
+            runner.add('type_stats', self.get_type_stats)
+            runner.add('organization_stats', self.get_organization_stats)
+            runner.add('winner_stats', self.get_winner_stats)
+            runner.add('trend_analysis', self.get_trend_analysis)
+            runner.add('regional_analysis', self.get_regional_analysis)
+            runner.add('collaboration_analysis', self.get_collaboration_analysis)
+            runner.add('field_analysis', self.get_field_analysis)
+            runner.add('impact_analysis', self.get_impact_analysis)
+            runner.add('network_graph', lambda: self.build_network(min_weight))
+            if ANALYSIS_CONFIG.get('network_process', False):
+                # 网络指标为纯Python计算，受GIL限制，在工作进程中计算后再补充显示名称
+                runner.add('network_metrics', compute_metrics, depends=['network_graph'], process=True)
+                runner.add('network_analysis', self._label_network, depends=['network_metrics'])
+            else:
+                runner.add('network_analysis', lambda G: self.get_network_analysis(min_weight=min_weight),
+                           depends=['network_graph'])
+            runner.add('text_analysis', self.get_text_analysis)
+            
             # 执行各种分析
-            self.results['basic_stats'] = self.get_basic_stats()
-            self.results['yearly_stats'] = self.get_yearly_stats()
-            self.results['type_stats'] = self.get_type_stats()
-            self.results['organization_stats'] = self.get_organization_stats()
-            self.results['winner_stats'] = self.get_winner_stats()
-            self.results['trend_analysis'] = self.get_trend_analysis()
-            self.results['regional_analysis'] = self.get_regional_analysis()
-            self.results['collaboration_analysis'] = self.get_collaboration_analysis()
-            self.results['field_analysis'] = self.get_field_analysis()
-            self.results['impact_analysis'] = self.get_impact_analysis()
+            results = runner.run()
+            results.pop('network_graph', None)
+            results.pop('network_metrics', None)
+            self.results.update(results)
+            self.timings = runner.timings
             
             logger.info("分析完成")
             
         except Exception as e:
             logger.error(f"执行分析失败: {str(e)}")
     
+    def analyze_incremental(self, data: Dict[str, pd.DataFrame], state_file: str = None,
+                            db_path: str = None) -> Optional[IncrementalAggregator]:
+        """
+        增量执行分析
+        
+        将新增批次合并到已保存的计数状态中，只处理新数据即可得到与全量计算一致的
+        年度、类型、机构、获奖人统计和合作关系分析。重新抓取的奖项内容有变化时，
+        已合并的计数无法撤销，改为由数据库中的全部数据（须已写入本批）重建状态。
+        
+        Args:
+            data: 新增批次的DataFrame字典
+            state_file: 状态文件路径，默认读取 INCREMENTAL_CONFIG
+            db_path: 重建时读取的数据库文件路径，默认读取 STORAGE_CONFIG
+            
+        Returns:
+            合并后的增量统计（可取得合作网络），失败时返回None
+        """
+        try:
+            logger.info("开始执行增量分析")
+            
+            aggregator = IncrementalAggregator.load(state_file)
+            changed = aggregator.changed_awards(data)
+            if changed:
+                logger.info(f"重新抓取的奖项内容有变化: {len(changed)} 条，由数据库重建增量统计")
+                aggregator = IncrementalAggregator(state_file)
+                data = AwardStore(db_path).load_frames()
+            aggregator.update(data)
+            aggregator.save()
+            
+            self.results.update(aggregator.results())
+            
+            logger.info("增量分析完成")
+            return aggregator
+            
+        except Exception as e:
+            logger.error(f"执行增量分析失败: {str(e)}")
+            return None
+    
+    def analyze_chunked(self, db_path: str = None, chunk_size: int = None, **filters) -> None:
+        """
+        分块执行分析
+        
+        用于超过内存的数据：不加载全部数据，按块从数据库读取并合并部分聚合，
+        得到与 load_store + analyze 一致的基础、年度、类型、机构、获奖人统计，
+        以及趋势、地区、合作关系和合作网络分析。内存占用由分块大小决定。
+        
+        Args:
+            db_path: 数据库文件路径，默认读取 STORAGE_CONFIG
+            chunk_size: 每块行数，默认读取 CHUNKED_CONFIG
+            **filters: 过滤条件（year/award_type/award_level）
+        """
+        try:
+            logger.info(f"开始分块执行分析: {filters or '全部'}")
+            
+            analyzer = ChunkedAnalyzer(AwardStore(db_path), chunk_size)
+            analyzer.min_weight = self.config['network_min_weight']
+            self.results.update(analyzer.analyze(**filters))
+            
+            logger.info("分块分析完成")
+            
+        except Exception as e:
+            logger.error(f"分块执行分析失败: {str(e)}")
+    
     def save_results(self, output_dir: str) -> None:
         """
         保存分析结果
@@ -162,6 +313,19 @@ class AwardAnalyzer(BaseAnalyzer):
         except Exception as e:
             logger.error(f"保存分析结果失败: {str(e)}")
     
+    @requires(awards=['year', 'award_type', 'award_level'], projects=['organization'], winners=['organization'])
+    @memoized
+    def get_cube(self) -> AggregateCube:
+        """
+        获取当前数据的预聚合数据立方体，同一份数据只构建一次
+        
+        Returns:
+            数据立方体
+        """
+        return AggregateCube.from_frames(self.awards_df, self.projects_df, self.winners_df)
+    
+    @requires(awards=['year', 'award_type', 'award_level'], projects=['organization'], winners=['organization'])
+    @memoized
     def get_trend_analysis(self) -> Dict[str, pd.DataFrame]:
         """
         获取趋势分析
@@ -170,37 +334,14 @@ class AwardAnalyzer(BaseAnalyzer):
             趋势分析结果字典
         """
         try:
-            results = {}
-            
-            # 年度奖项数量趋势
-            yearly_counts = self.awards_df.groupby('year').size().reset_index()
-            yearly_counts.columns = ['年份', '奖项数量']
-            results['yearly_counts'] = yearly_counts
-            
-            # 年度奖项类型分布趋势
-            type_trends = self.awards_df.pivot_table(
-                index='year',
-                columns='award_type',
-                aggfunc='size',
-                fill_value=0
-            ).reset_index()
-            results['type_trends'] = type_trends
-            
-            # 年度奖项等级分布趋势
-            level_trends = self.awards_df.pivot_table(
-                index='year',
-                columns='award_level',
-                aggfunc='size',
-                fill_value=0
-            ).reset_index()
-            results['level_trends'] = level_trends
-            
-            return results
+            return self.get_cube().trends()
             
         except Exception as e:
             logger.error(f"获取趋势分析失败: {str(e)}")
             return {}
     
+    @requires(projects=['organization'], winners=['organization'])
+    @memoized
     def get_regional_analysis(self) -> pd.DataFrame:
         """
         获取地区分析
@@ -214,12 +355,6 @@ class AwardAnalyzer(BaseAnalyzer):
                 logger.warning("数据中缺少'organization'字段，无法进行地区分析")
                 return pd.DataFrame(columns=['地区', '获奖次数'])
             
-            # 提取机构所在地区（假设机构名称第一个字符为省份/地区名）
-            def extract_region(org: str) -> str:
-                if not org or not isinstance(org, str):
-                    return '未知'
-                return org[:2]
-            
             # 合并项目和获奖人的机构
             all_orgs = []
             if 'organization' in self.projects_df.columns:
@@ -229,12 +364,9 @@ class AwardAnalyzer(BaseAnalyzer):
             
             if not all_orgs:
                 return pd.DataFrame(columns=['地区', '获奖次数'])
-                
-            all_orgs_series = pd.concat(all_orgs)
             
-            # 统计地区分布
-            region_stats = all_orgs_series.map(extract_region).value_counts().reset_index()
-            region_stats.columns = ['地区', '获奖次数']
+            # 按地区词典解析机构所在省份，只解析不重复的机构
+            region_stats = get_region_resolver().region_counts(pd.concat(all_orgs, ignore_index=True))
             
             return region_stats
             
@@ -242,6 +374,8 @@ class AwardAnalyzer(BaseAnalyzer):
             logger.error(f"获取地区分析失败: {str(e)}")
             return pd.DataFrame(columns=['地区', '获奖次数'])
     
+    @requires(projects=['name', 'organization'], winners=['organization', 'org_id'])
+    @memoized
     def get_collaboration_analysis(self) -> Dict[str, Any]:
         """
         获取合作关系分析
@@ -276,7 +410,7 @@ class AwardAnalyzer(BaseAnalyzer):
                 }
             
             # 统计多机构合作项目
-            project_orgs = self.projects_df.groupby('name')['organization'].nunique()
+            project_orgs = self.projects_df.groupby('name', observed=True)['organization'].nunique()
             results['collaboration_stats'] = {
                 'single_org': len(project_orgs[project_orgs == 1]),
                 'multi_org': len(project_orgs[project_orgs > 1]),
@@ -284,31 +418,22 @@ class AwardAnalyzer(BaseAnalyzer):
             }
             
             # 检查获奖人数据框是否包含必要的字段
-            if 'project_name' not in self.winners_df.columns or 'organization' not in self.winners_df.columns:
+            if 'project_id' not in self.winners_df.columns or 'organization' not in self.winners_df.columns:
                 logger.warning("获奖人数据中缺少必要字段，无法分析合作机构")
                 results['top_collaborations'] = []
                 return results
             
-            # 找出合作最多的机构对
-            org_pairs = []
-            for _, group in self.winners_df.groupby('project_name'):
-                orgs = group['organization'].unique()
-                if len(orgs) > 1:
-                    for i in range(len(orgs)):
-                        for j in range(i + 1, len(orgs)):
-                            org_pairs.append(tuple(sorted([orgs[i], orgs[j]])))
-            
-            if org_pairs:
-                pair_counts = pd.Series(org_pairs).value_counts().head(10)
-                results['top_collaborations'] = [
-                    {
-                        'organizations': list(pair),
-                        'count': count
-                    }
-                    for pair, count in pair_counts.items()
-                ]
-            else:
-                results['top_collaborations'] = []
+            # 找出合作最多的机构对：项目×机构关联矩阵的共现次数
+            org_matrix = CooccurrenceMatrix.from_frame(
+                self.winners_df, 'project_id', self._org_key(self.winners_df), 'organization'
+            )
+            results['top_collaborations'] = [
+                {
+                    'organizations': pair['pair'],
+                    'count': pair['count']
+                }
+                for pair in org_matrix.top_pairs(10)
+            ]
             
             return results
             
@@ -323,192 +448,167 @@ class AwardAnalyzer(BaseAnalyzer):
                 'top_collaborations': []
             }
     
-    def get_field_analysis(self) -> pd.DataFrame:
+    @requires(awards=['year', 'award_type'], projects=['name', 'year', 'award_type'])
+    @memoized
+    def get_field_analysis(self, group_by: str = None) -> pd.DataFrame:
         """
         获取研究领域分析
         
+        Args:
+            group_by: 分组方式，None为整体热点词，'year'为各年度，'award_type'为各奖项类型
+            
         Returns:
-            研究领域分析DataFrame
+            研究领域分析DataFrame（关键词、出现项目数、TF-IDF权重），分组时首列为年份或奖项类型
         """
         try:
+            columns = {None: 'overall', 'year': '年份', 'award_type': '奖项类型'}
+            if group_by not in columns:
+                raise ValueError(f"未知的分组方式: {group_by}")
+            
             # 检查数据框是否包含必要的字段
             if 'name' not in self.projects_df.columns:
                 logger.warning("项目数据中缺少'name'字段，无法进行研究领域分析")
-                return pd.DataFrame(columns=['关键词', '出现次数'])
-            
-            # 提取项目名称中的关键词
-            def extract_keywords(text: str) -> List[str]:
-                if not text or not isinstance(text, str):
-                    return []
-                # 这里可以使用更复杂的关键词提取算法
-                words = text.split()
-                return [w for w in words if len(w) >= 2]
+                return pd.DataFrame(columns=FieldAnalyzer.COLUMNS)
             
-            # 统计关键词频率
-            keywords = []
-            for name in self.projects_df['name']:
-                keywords.extend(extract_keywords(name))
-            
-            if keywords:
-                keyword_stats = pd.Series(keywords).value_counts().head(20).reset_index()
-                keyword_stats.columns = ['关键词', '出现次数']
-                return keyword_stats
-            
-            return pd.DataFrame(columns=['关键词', '出现次数'])
+            result = self._field_terms().get(columns[group_by])
+            return result if result is not None else pd.DataFrame(columns=FieldAnalyzer.COLUMNS)
             
         except Exception as e:
             logger.error(f"获取研究领域分析失败: {str(e)}")
-            return pd.DataFrame(columns=['关键词', '出现次数'])
+            return pd.DataFrame(columns=FieldAnalyzer.COLUMNS)
     
-    def get_impact_analysis(self) -> Dict[str, Any]:
+    @memoized
+    def _field_terms(self) -> Dict[str, pd.DataFrame]:
+        """一次计算整体、各年度、各奖项类型的热点关键词"""
+        groups = {}
+        
+        # 项目缺少年份、类型时从所属奖项取得
+        award_rows = None
+        if 'award_id' in self.projects_df.columns and 'award_id' in self.awards_df.columns:
+            award_rows = pd.Index(self.awards_df['award_id']).get_indexer(self.projects_df['award_id'])
+        for column, label in (('year', '年份'), ('award_type', '奖项类型')):
+            if column in self.projects_df.columns:
+                groups[label] = self.projects_df[column].astype(object)
+            elif award_rows is not None and column in self.awards_df.columns:
+                values = self.awards_df[column].to_numpy(dtype=object)
+                groups[label] = pd.Series(
+                    np.where(award_rows >= 0, values[award_rows], None),
+                    index=self.projects_df.index, dtype=object
+                )
+        
+        return FieldAnalyzer().analyze(self.projects_df['name'], groups)
+    
+    @requires(projects=['level', 'year', 'organization', 'org_id'], winners=['name', 'winner_id'])
+    @memoized
+    def get_impact_analysis(self, scheme: str = None, half_life: float = None,
+                            top_n: int = 10) -> Dict[str, Any]:
         """
         获取影响力分析
         
+        Args:
+            scheme: 权重方案名称，默认读取 IMPACT_CONFIG
+            half_life: 时间衰减半衰期（年），默认读取 IMPACT_CONFIG
+            top_n: 返回前N名
+            
         Returns:
             影响力分析结果字典
         """
         try:
-            results = {}
-            
-            # 计算机构影响力得分
-            org_scores = {}
-            award_weights = {
-                '特等奖': 5,
-                '一等奖': 4,
-                '二等奖': 3,
-                '三等奖': 2,
-                '优秀奖': 1,
-                '提名奖': 0.5
-            }
-            
-            for _, row in self.projects_df.iterrows():
-                org = row.get('organization')
-                level = row.get('level')
-                if org and level:
-                    score = award_weights.get(level, 1)
-                    org_scores[org] = org_scores.get(org, 0) + score
-            
-            if org_scores:
-                org_impact = pd.DataFrame([
-                    {'机构': org, '影响力得分': score}
-                    for org, score in org_scores.items()
-                ]).sort_values('影响力得分', ascending=False).head(10)
-                
-                results['top_organizations'] = org_impact.to_dict('records')
-            else:
-                results['top_organizations'] = []
-            
-            # 计算获奖人影响力得分
-            winner_scores = {}
-            for _, row in self.winners_df.iterrows():
-                name = row.get('name')
-                project_name = row.get('project_name')
-                if name and project_name:
-                    project_level = self.projects_df[
-                        self.projects_df['name'] == project_name
-                    ]['level'].iloc[0]
-                    score = award_weights.get(project_level, 1)
-                    winner_scores[name] = winner_scores.get(name, 0) + score
-            
-            if winner_scores:
-                winner_impact = pd.DataFrame([
-                    {'获奖人': name, '影响力得分': score}
-                    for name, score in winner_scores.items()
-                ]).sort_values('影响力得分', ascending=False).head(10)
-                
-                results['top_winners'] = winner_impact.to_dict('records')
-            else:
-                results['top_winners'] = []
-            
-            return results
+            scorer = ImpactScorer(scheme=scheme, half_life=half_life)
+            return scorer.analyze(self.projects_df, self.winners_df, top_n)
             
         except Exception as e:
             logger.error(f"获取影响力分析失败: {str(e)}")
             return {}
     
-    def get_network_analysis(self, min_weight: int = None) -> Dict[str, Any]:
+    @requires(winners=['name', 'winner_id'])
+    @memoized
+    def build_network(self, min_weight: int = None) -> nx.Graph:
+        """
+        构建获奖人合作网络
+        
+        由项目×获奖人关联矩阵得到带权边列表，一次批量加入网络；
+        同一份数据、同一阈值的网络只构建一次。
+        
+        Args:
+            min_weight: 最小权重阈值
+            
+        Returns:
+            合作网络，经过实体消解时以获奖人ID为节点
+        """
+        winner_matrix = CooccurrenceMatrix.from_frame(
+            self.winners_df, 'project_id', self._winner_key(), 'name'
+        )
+        
+        # 项目×获奖人关联矩阵的共现次数即为边权重；低权重的边不加入网络，
+        # 但有过合作的获奖人仍保留为节点
+        G = nx.Graph()
+        G.add_nodes_from(node for edge in winner_matrix.edges() for node in edge[:2])
+        G.add_weighted_edges_from(winner_matrix.edges(min_weight))
+        return G
+    
+    @requires(winners=['name', 'winner_id'])
+    @memoized
+    def get_network_analysis(self, min_weight: int = None, mode: str = None) -> Dict[str, Any]:
         """
         获取合作网络分析
         
         Args:
             min_weight: 最小权重阈值
+            mode: 计算模式（exact/approximate/auto），默认读取 NETWORK_CONFIG
             
         Returns:
-            网络分析结果
+            网络分析结果，大规模网络的中心性为近似值（approximate 为True）
         """
         try:
-            # 创建合作网络
-            G = nx.Graph()
-            
-            # 遍历项目数据
-            for _, project in self.projects_df.iterrows():
-                # 获取项目相关的获奖人
-                winners = self.winners_df[self.winners_df['project_name'] == project['name']]
-                
-                # 添加节点和边
-                winner_list = winners['name'].tolist()
-                for i in range(len(winner_list)):
-                    for j in range(i + 1, len(winner_list)):
-                        if G.has_edge(winner_list[i], winner_list[j]):
-                            G[winner_list[i]][winner_list[j]]['weight'] += 1
-                        else:
-                            G.add_edge(winner_list[i], winner_list[j], weight=1)
-            
-            # 过滤低权重的边
-            if min_weight:
-                edges_to_remove = [(u, v) for u, v, d in G.edges(data=True) if d['weight'] < min_weight]
-                G.remove_edges_from(edges_to_remove)
+            G = self.build_network(min_weight)
             
             # 计算网络指标
-            results = {
-                'node_count': G.number_of_nodes(),
-                'edge_count': G.number_of_edges(),
-                'average_degree': sum(dict(G.degree()).values()) / G.number_of_nodes(),
-                'density': nx.density(G),
-                'clustering_coefficient': nx.average_clustering(G),
-                'components': list(nx.connected_components(G)),
-                'centrality': {
-                    'degree': nx.degree_centrality(G),
-                    'betweenness': nx.betweenness_centrality(G),
-                    'closeness': nx.closeness_centrality(G)
-                }
-            }
-            
-            return results
+            return self._label_network(NetworkMetrics(mode=mode).compute(G))
             
         except Exception as e:
             logger.error(f"获取网络分析失败: {str(e)}")
             return {}
     
+    def _label_network(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """只为输出的节点生成显示名称"""
+        nodes = set().union(*results['components'], *results['centrality'].values())
+        results['labels'] = self._winner_labels(nodes)
+        return results
+    
+    def _winner_labels(self, nodes) -> Dict[Any, str]:
+        """
+        获取网络节点的显示名称
+        
+        Args:
+            nodes: 节点（获奖人ID或姓名）
+            
+        Returns:
+            节点 -> 获奖人姓名 的字典
+        """
+        winner_key = self._winner_key()
+        if winner_key == 'name':
+            return {node: node for node in nodes}
+        names = self.winners_df.drop_duplicates(winner_key, keep='last').set_index(winner_key)['name']
+        return {node: names.get(node, node) for node in nodes}
+    
+    @requires(projects=['name'])
+    @memoized
     def get_text_analysis(self) -> Dict[str, Any]:
         """
         获取文本分析结果
         
+        分词由共享的 TextAnalysisService 完成，已分过词的项目名称直接使用缓存。
+        
         Returns:
             文本分析结果
         """
         try:
-            from collections import Counter
-            import jieba
-            import jieba.analyse
-            
-            # 合并所有项目名称和描述
-            text = ' '.join(self.projects_df['name'].dropna().tolist())
-            
-            # 提取关键词
-            keywords = jieba.analyse.extract_tags(text, topK=20, withWeight=True)
-            
-            # 分词统计
-            words = jieba.cut(text)
-            word_freq = Counter(words)
-            
-            # 计算词频统计
-            results = {
-                'keywords': {word: weight for word, weight in keywords},
-                'word_frequency': dict(word_freq.most_common(50)),
-                'total_words': sum(word_freq.values()),
-                'unique_words': len(word_freq)
-            }
+            service = get_text_service()
+            
+            # 对所有项目名称分词并统计关键词和词频
+            results = service.analyze(self.projects_df['name'].dropna().astype(str).tolist())
+            service.save_tokens()
             
             return results
             
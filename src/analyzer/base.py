@@ -1,8 +1,14 @@
-from typing import Dict, Any, List, Optional
+import threading
+from typing import Dict, Any, List, Optional, Iterable
 import pandas as pd
 import numpy as np
 from loguru import logger
 
+from processor.schema import DataSchema
+from processor.relations import add_relation_keys
+from .cache import frame_fingerprint, memoized
+from .loader import KEY_COLUMNS, requires, declared_columns
+
 class BaseAnalyzer:
     """数据分析基类"""
     
@@ -13,10 +19,160 @@ class BaseAnalyzer:
         Args:
             data: 包含多个DataFrame的字典
         """
+        # 数据表，设置了读取器时在首次访问时加载
+        self._frames = {}
+        self._loader = None
+        self._columns = None
+        self._frames_lock = threading.RLock()
+        
+        # 缺少整数键时按名称补充，之后的关联均通过 award_id/project_id 完成
+        data = add_relation_keys(data)
         self.awards_df = data.get('awards', pd.DataFrame())
         self.projects_df = data.get('projects', pd.DataFrame())
         self.winners_df = data.get('winners', pd.DataFrame())
         
+        # 各数据表的指纹缓存：{表名: (DataFrame, 指纹)}
+        self._fingerprints = {}
+        
+    @property
+    def awards_df(self) -> pd.DataFrame:
+        """奖项表"""
+        return self._frame('awards')
+    
+    @awards_df.setter
+    def awards_df(self, df: pd.DataFrame) -> None:
+        self._frames['awards'] = df
+    
+    @property
+    def projects_df(self) -> pd.DataFrame:
+        """项目表"""
+        return self._frame('projects')
+    
+    @projects_df.setter
+    def projects_df(self, df: pd.DataFrame) -> None:
+        self._frames['projects'] = df
+    
+    @property
+    def winners_df(self) -> pd.DataFrame:
+        """获奖人表"""
+        return self._frame('winners')
+    
+    @winners_df.setter
+    def winners_df(self, df: pd.DataFrame) -> None:
+        self._frames['winners'] = df
+    
+    def set_loader(self, loader, columns: Optional[Dict[str, Iterable[str]]] = None) -> None:
+        """
+        设置数据读取器，替换当前数据
+        
+        之后各数据表在首次访问时才读取，且只读取 columns 中声明的表和列。
+        
+        Args:
+            loader: 数据读取器（ExcelLoader/ColumnarStore），read(表名, 列) 返回DataFrame
+            columns: 表名 -> 列名，为None时读取全部表的全部列
+        """
+        with self._frames_lock:
+            self._loader = loader
+            self._columns = None if columns is None else {table: set(cols) for table, cols in columns.items()}
+            self._frames = {}
+            self._fingerprints = {}
+    
+    def require(self, *analyses: str) -> None:
+        """
+        扩展按需读取的列，使之包含指定分析方法声明的列
+        
+        已读取的数据表缺少新增的列时丢弃，下次访问时按扩展后的列重新读取。
+        
+        Args:
+            *analyses: 分析方法名
+        """
+        if self._loader is None or self._columns is None:
+            return
+        columns = declared_columns(type(self), analyses)
+        with self._frames_lock:
+            if columns is None:
+                self._columns = None
+                self._frames = {}
+                return
+            for table, table_columns in columns.items():
+                current = self._columns.setdefault(table, set())
+                if not table_columns <= current:
+                    current.update(table_columns)
+                    self._frames.pop(table, None)
+    
+    def _frame(self, name: str) -> pd.DataFrame:
+        """获取数据表，尚未读取时通过读取器读取"""
+        frame = self._frames.get(name)
+        if frame is None:
+            with self._frames_lock:
+                frame = self._frames.get(name)
+                if frame is None:
+                    frame = self._load_frame(name)
+                    self._frames[name] = frame
+        return frame
+    
+    def _declared(self, name: str) -> bool:
+        """数据表是否在按需读取的范围内"""
+        return self._loader is None or self._columns is None or name in self._columns
+    
+    def _load_frame(self, name: str) -> pd.DataFrame:
+        """通过读取器读取数据表，补充关联键并应用数据类型模式"""
+        if self._loader is None:
+            return pd.DataFrame()
+        if not self._declared(name):
+            raise KeyError(f"数据表 {name} 未在分析方法的 @requires 中声明")
+        frame = self._with_relation_keys(name, self._loader.read(name, self._projection(name)))
+        return frame if getattr(self._loader, 'typed', False) else DataSchema.apply_frame(frame, name)
+    
+    def _projection(self, name: str, columns: Optional[Iterable[str]] = None) -> Optional[List[str]]:
+        """数据表需要读取的列：声明的列（或指定的列）加上键列，为None时读取全部列"""
+        if columns is None:
+            if self._columns is None:
+                return None
+            columns = self._columns.get(name, ())
+        return sorted(set(columns) | set(KEY_COLUMNS.get(name, [])))
+    
+    def _with_relation_keys(self, name: str, frame: pd.DataFrame) -> pd.DataFrame:
+        """旧数据文件缺少整数键时按名称补充，父表未声明时只读取其键列"""
+        parent = {'projects': 'awards', 'winners': 'projects'}.get(name)
+        key = 'award_id' if name == 'awards' else 'project_id'
+        data = {name: frame}
+        if parent and key not in frame.columns:
+            if self._columns is None or parent in self._columns:
+                data[parent] = self._frame(parent)
+            else:
+                data[parent] = self._with_relation_keys(parent, self._loader.read(parent, self._projection(parent, ())))
+        return add_relation_keys(data)[name]
+    
+    def data_fingerprint(self) -> str:
+        """
+        获取当前数据的指纹
+        
+        数据表被替换（如重新加载）后自动重新计算；原地修改数据表后需调用 invalidate_cache()。
+        
+        Returns:
+            三张数据表的组合指纹
+        """
+        parts = []
+        for name in ('awards', 'projects', 'winners'):
+            # 未声明的数据表不读取，分析结果与其无关
+            if not self._declared(name):
+                parts.append('-')
+                continue
+            df = getattr(self, f'{name}_df')
+            cached = self._fingerprints.get(name)
+            if cached is None or cached[0] is not df:
+                cached = (df, frame_fingerprint(df))
+                self._fingerprints[name] = cached
+            parts.append(cached[1])
+        return '-'.join(parts)
+    
+    def invalidate_cache(self) -> None:
+        """数据表被原地修改后清除指纹，下次分析时按新内容重新计算"""
+        self._fingerprints = {}
+    
+    @requires(awards=['year', 'award_type', 'award_level'], projects=[], winners=[])
+    @memoized
     def get_basic_stats(self) -> Dict[str, Any]:
         """
         获取基础统计信息
@@ -39,6 +195,8 @@ class BaseAnalyzer:
             logger.error(f"获取基础统计信息失败: {str(e)}")
             return {}
     
+    @requires(awards=['year', 'award_type', 'award_level'])
+    @memoized
     def get_yearly_stats(self) -> pd.DataFrame:
         """
         获取年度统计信息
@@ -47,9 +205,9 @@ class BaseAnalyzer:
             年度统计DataFrame
         """
         try:
-            yearly_stats = self.awards_df.groupby('year').agg({
+            yearly_stats = self.awards_df.groupby('year', observed=True).agg({
                 'award_type': 'count',
-                'award_level': lambda x: x.value_counts().to_dict()
+                'award_level': lambda x: DataSchema.value_counts(x).to_dict()
             }).reset_index()
             
             yearly_stats.columns = ['年份', '奖项数量', '等级分布']
@@ -59,6 +217,8 @@ class BaseAnalyzer:
             logger.error(f"获取年度统计信息失败: {str(e)}")
             return pd.DataFrame()
     
+    @requires(awards=['year', 'award_type', 'award_level'])
+    @memoized
     def get_type_stats(self) -> pd.DataFrame:
         """
         获取奖项类型统计信息
@@ -67,9 +227,9 @@ class BaseAnalyzer:
             类型统计DataFrame
         """
         try:
-            type_stats = self.awards_df.groupby('award_type').agg({
+            type_stats = self.awards_df.groupby('award_type', observed=True).agg({
                 'year': 'count',
-                'award_level': lambda x: x.value_counts().to_dict()
+                'award_level': lambda x: DataSchema.value_counts(x).to_dict()
             }).reset_index()
             
             type_stats.columns = ['奖项类型', '数量', '等级分布']
@@ -79,26 +239,40 @@ class BaseAnalyzer:
             logger.error(f"获取奖项类型统计信息失败: {str(e)}")
             return pd.DataFrame()
     
-    def get_organization_stats(self, top_n: int = 10) -> pd.DataFrame:
+    @requires(projects=['organization', 'org_id'], winners=['organization', 'org_id'])
+    @memoized
+    def get_organization_stats(self, top_n: Optional[int] = 10) -> pd.DataFrame:
         """
         获取机构统计信息
         
         Args:
-            top_n: 返回前N个机构
+            top_n: 返回前N个机构，为None时返回全部机构
             
         Returns:
             机构统计DataFrame
         """
         try:
-            # 合并项目和获奖人的机构
-            org_stats = pd.concat([
-                self.projects_df['organization'].value_counts(),
-                self.winners_df['organization'].value_counts()
-            ]).groupby(level=0).sum()
+            # 项目和获奖人都经过实体消解时按机构ID统计，显示首次出现的机构名称
+            frames = [df for df in (self.projects_df, self.winners_df) if 'organization' in df.columns]
+            key = 'org_id' if frames and all(self._org_key(df) == 'org_id' for df in frames) else 'organization'
+            
+            # 合并项目和获奖人的机构，一次计数
+            keys = np.concatenate([df[key].to_numpy(dtype=object) for df in frames]) if frames else np.empty(0, dtype=object)
+            names = np.concatenate([df['organization'].to_numpy(dtype=object) for df in frames]) if frames else keys
+            codes, _ = pd.factorize(keys)
+            valid = np.flatnonzero(codes >= 0)
+            counts = np.bincount(codes[valid], minlength=codes.max() + 1 if len(valid) else 0)
+            
+            # 每个机构首次出现的位置
+            first = np.full(len(counts), len(codes), dtype=np.int64)
+            np.minimum.at(first, codes[valid], valid)
             
             # 获取前N个机构
-            org_stats = org_stats.nlargest(top_n).reset_index()
-            org_stats.columns = ['机构名称', '获奖次数']
+            top = self._top_n(counts, top_n)
+            org_stats = pd.DataFrame({
+                '机构名称': names[first[top]],
+                '获奖次数': counts[top]
+            })
             
             return org_stats
             
@@ -106,25 +280,39 @@ class BaseAnalyzer:
             logger.error(f"获取机构统计信息失败: {str(e)}")
             return pd.DataFrame()
     
-    def get_winner_stats(self, top_n: int = 10) -> pd.DataFrame:
+    @requires(winners=['name', 'organization', 'winner_id'])
+    @memoized
+    def get_winner_stats(self, top_n: Optional[int] = 10) -> pd.DataFrame:
         """
         获取获奖人统计信息
         
         Args:
-            top_n: 返回前N个获奖人
+            top_n: 返回前N个获奖人，为None时返回全部获奖人
             
         Returns:
             获奖人统计DataFrame
         """
         try:
-            winner_stats = self.winners_df['name'].value_counts().nlargest(top_n).reset_index()
-            winner_stats.columns = ['获奖人', '获奖次数']
+            # 实体消解后按获奖人ID统计，否则按姓名统计
+            key = self._winner_key()
+            codes, _ = pd.factorize(self.winners_df[key])
+            valid = np.flatnonzero(codes >= 0)
+            counts = np.bincount(codes[valid], minlength=codes.max() + 1 if len(valid) else 0)
+            
+            # 每名获奖人最近一条记录的位置
+            last = np.full(len(counts), -1, dtype=np.int64)
+            np.maximum.at(last, codes[valid], valid)
             
-            # 添加最近获奖机构
-            winner_stats['最近获奖机构'] = winner_stats['获奖人'].map(
-                lambda x: self.winners_df[self.winners_df['name'] == x]['organization'].iloc[-1]
-                if len(self.winners_df[self.winners_df['name'] == x]) > 0 else None
-            )
+            top = self._top_n(counts, top_n)
+            rows = last[top]
+            winner_stats = pd.DataFrame({
+                '获奖人': self.winners_df['name'].to_numpy(dtype=object)[rows],
+                '获奖次数': counts[top],
+                '最近获奖机构': (
+                    self.winners_df['organization'].to_numpy(dtype=object)[rows]
+                    if 'organization' in self.winners_df.columns else None
+                )
+            })
             
             return winner_stats
             
@@ -132,13 +320,51 @@ class BaseAnalyzer:
             logger.error(f"获取获奖人统计信息失败: {str(e)}")
             return pd.DataFrame()
     
+    @staticmethod
+    def _top_n(counts: np.ndarray, top_n: Optional[int]) -> np.ndarray:
+        """
+        选出计数最大的N个位置
+        
+        先用 argpartition 线性时间选出第N大的计数，只对不小于它的候选排序，
+        次数相同时按首次出现的顺序排列。
+        
+        Args:
+            counts: 计数数组
+            top_n: 返回个数，为None时返回全部
+            
+        Returns:
+            按计数降序排列的位置数组
+        """
+        if top_n is not None and top_n <= 0:
+            return np.empty(0, dtype=np.int64)
+        
+        if top_n is None or top_n >= len(counts):
+            candidates = np.arange(len(counts))
+        else:
+            threshold = counts[np.argpartition(-counts, top_n - 1)[top_n - 1]]
+            candidates = np.flatnonzero(counts >= threshold)
+        
+        order = np.lexsort((candidates, -counts[candidates]))
+        return candidates[order][:top_n]
+    
+    def _winner_key(self) -> str:
+        """获奖人分组键：经过实体消解时使用winner_id，否则使用姓名"""
+        return 'winner_id' if 'winner_id' in self.winners_df.columns else 'name'
+    
+    @staticmethod
+    def _org_key(df: pd.DataFrame) -> str:
+        """机构分组键：经过实体消解时使用org_id，否则使用机构名称"""
+        return 'org_id' if 'org_id' in df.columns else 'organization'
+    
     def _get_year_range(self) -> Dict[str, int]:
         """获取年份范围"""
         try:
             if len(self.awards_df) > 0:
+                min_year = self.awards_df['year'].min()
+                max_year = self.awards_df['year'].max()
                 return {
-                    'min_year': self.awards_df['year'].min(),
-                    'max_year': self.awards_df['year'].max()
+                    'min_year': int(min_year) if pd.notna(min_year) else None,
+                    'max_year': int(max_year) if pd.notna(max_year) else None
                 }
             return {'min_year': None, 'max_year': None}
             
@@ -149,7 +375,7 @@ class BaseAnalyzer:
         """获取奖项类型分布"""
         try:
             if len(self.awards_df) > 0:
-                return self.awards_df['award_type'].value_counts().to_dict()
+                return DataSchema.value_counts(self.awards_df['award_type']).to_dict()
             return {}
             
         except Exception:
@@ -159,7 +385,7 @@ class BaseAnalyzer:
         """获取奖项等级分布"""
         try:
             if len(self.awards_df) > 0:
-                return self.awards_df['award_level'].value_counts().to_dict()
+                return DataSchema.value_counts(self.awards_df['award_level']).to_dict()
             return {}
             
         except Exception:
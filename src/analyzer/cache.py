@@ -0,0 +1,137 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Dict, Any, Callable, Optional, Tuple
+import pandas as pd
+from loguru import logger
+
+from config.config import CACHE_CONFIG
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    计算DataFrame的内容指纹
+
+    对列名、类型和逐行哈希值求摘要，内容相同的数据（如重新读取的同一文件）指纹相同。
+
+    Args:
+        df: 数据表
+
+    Returns:
+        十六进制指纹字符串
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(repr((list(df.columns), [str(dtype) for dtype in df.dtypes], df.shape)).encode('utf-8'))
+    if len(df):
+        try:
+            row_hashes = pd.util.hash_pandas_object(df, index=False)
+        except TypeError:
+            # 列中含有列表、字典等不可哈希的值时按字符串计算
+            row_hashes = pd.util.hash_pandas_object(df.astype(str), index=False)
+        hasher.update(row_hashes.to_numpy().tobytes())
+    return hasher.hexdigest()
+
+class AnalysisCache:
+    """分析结果缓存类
+
+    以（数据指纹, 分析方法, 参数）为键的LRU缓存，同一进程内的分析器共享，
+    数据内容变化后指纹随之变化，旧结果不再命中并逐步被淘汰。
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        初始化缓存
+
+        Args:
+            max_entries: 最大缓存条数，默认读取 CACHE_CONFIG
+        """
+        self.max_entries = max_entries or CACHE_CONFIG.get('max_entries', 128)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """
+        查询缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            (是否命中, 缓存结果)
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Tuple, value: Any) -> None:
+        """
+        写入缓存，超出容量时淘汰最久未使用的条目
+
+        Args:
+            key: 缓存键
+            value: 分析结果
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取缓存统计
+
+        Returns:
+            条目数、命中数和未命中数
+        """
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+analysis_cache = AnalysisCache()
+
+def memoized(method: Callable) -> Callable:
+    """
+    分析方法的缓存装饰器
+
+    以分析器的数据指纹和调用参数为键缓存返回值，同一份数据的同一分析最多执行一次。
+    缓存的结果在调用方之间共享，调用方不应原地修改。
+
+    Args:
+        method: 分析器的方法，需要提供 data_fingerprint()
+
+    Returns:
+        带缓存的方法
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not CACHE_CONFIG.get('enabled', True):
+            return method(self, *args, **kwargs)
+
+        key = (self.data_fingerprint(), method.__qualname__, args, tuple(sorted(kwargs.items())))
+        try:
+            found, value = analysis_cache.get(key)
+        except TypeError:
+            # 参数不可哈希时不缓存
+            return method(self, *args, **kwargs)
+        if found:
+            logger.debug(f"分析结果命中缓存: {method.__qualname__}")
+            return value
+
+        value = method(self, *args, **kwargs)
+        analysis_cache.put(key, value)
+        return value
+
+    return wrapper
\ No newline at end of file
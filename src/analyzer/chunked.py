@@ -0,0 +1,137 @@
+from collections import Counter
+from typing import Dict, Any, Optional
+import pandas as pd
+from loguru import logger
+
+from config.config import CHUNKED_CONFIG, NETWORK_CONFIG, AWARD_TYPES
+from processor.schema import DataSchema
+from storage.sqlite import AwardStore
+from .incremental import IncrementalAggregator
+from .network import NetworkMetrics
+from .region import get_region_resolver
+from .cube import AggregateCube, AWARD_DIMENSIONS, DIMENSIONS, MEASURES
+
+class ChunkedAnalyzer:
+    """分块统计类
+
+    数据量超过内存时，在同一个读事务中按主键顺序从数据库分块读取奖项、项目、获奖人表，
+    每块只合并到可合并的部分聚合中，读完即释放：
+    - 基础、年度、类型、机构、获奖人统计及机构合作对：由分块模式的 IncrementalAggregator 合并计数
+    - 多机构合作项目统计：按项目名称分组在数据库中完成
+    - 趋势分析：奖项维度的聚合单元逐块相加
+    - 地区分析：各地区次数逐块相加
+    - 合作网络：获奖人共现次数逐块相加（同一项目的获奖人总在同一块中）
+
+    内存占用由分块大小和聚合状态决定，聚合状态随不同取值（年份、机构、获奖人、
+    合作关系）的数量增长，不保存奖项键、项目名称等逐条记录的状态。
+    结果与 AwardAnalyzer 全量加载后的计算一致。
+    """
+
+    def __init__(self, store: Optional[AwardStore] = None, chunk_size: Optional[int] = None):
+        """
+        初始化分块统计
+
+        Args:
+            store: 奖项数据库，默认读取 STORAGE_CONFIG
+            chunk_size: 每块行数，默认读取 CHUNKED_CONFIG
+        """
+        self.store = store or AwardStore()
+        self.chunk_size = chunk_size or CHUNKED_CONFIG.get('chunk_size', 5000)
+        self.min_weight = NETWORK_CONFIG.get('min_weight', 2)
+
+    def analyze(self, network: bool = True, **filters) -> Dict[str, Any]:
+        """
+        分块执行统计分析
+
+        Args:
+            network: 是否计算合作网络分析
+            **filters: 过滤条件（year/award_type/award_level）
+
+        Returns:
+            与 AwardAnalyzer.results 中同名的结果
+        """
+        aggregator = IncrementalAggregator(chunked=True)
+        resolver = get_region_resolver()
+        award_cells = None
+        regions = Counter()
+
+        # 各表读取同一份数据快照；全量统计先合并项目再合并获奖人，分块读取保持同样的顺序
+        with self.store.snapshot() as conn:
+            for table in ('awards', 'projects', 'winners'):
+                chunks = 0
+                for chunk in self.store.iter_frames(table, self.chunk_size, conn, **filters):
+                    aggregator.update({table: chunk})
+                    if table == 'awards':
+                        award_cells = self._merge_cells(award_cells, chunk)
+                    elif 'organization' in chunk.columns:
+                        regions.update(resolver.resolve_series(chunk['organization']).value_counts(sort=False).to_dict())
+                    chunks += 1
+                logger.info(f"分块读取 {table}: {chunks} 块")
+            collaboration_stats = self.store.collaboration_stats(conn, **filters)
+
+        results = aggregator.results()
+        results['collaboration_analysis']['collaboration_stats'] = collaboration_stats
+
+        # 分块读取的数据已应用数据类型模式，分组列恢复为与全量统计一致的类型
+        results['yearly_stats']['年份'] = DataSchema.to_year(results['yearly_stats']['年份'])
+        if aggregator.categorical_types:
+            results['type_stats']['奖项类型'] = DataSchema.to_category(results['type_stats']['奖项类型'], AWARD_TYPES)
+            results['type_stats']['数量'] = results['type_stats']['数量'].astype('Int64')
+        results['trend_analysis'] = self._cube(award_cells).trends()
+        results['regional_analysis'] = resolver.rank_counts(pd.Series(regions, dtype='int64'))
+        if network:
+            results['network_analysis'] = self._network_analysis(aggregator)
+        return results
+
+    @staticmethod
+    def _merge_cells(cells: Optional[pd.Series], awards_df: pd.DataFrame) -> pd.Series:
+        """将一块奖项按奖项维度计数，并与已有的聚合单元相加
+
+        各块词表以外的类别不同，分类类型无法直接拼接，分组前先转为普通取值，
+        全部合并后再由 _cube 恢复分类类型。
+        """
+        frame = awards_df.reindex(columns=AWARD_DIMENSIONS)
+        for column in DataSchema.CATEGORY_COLUMNS['awards']:
+            if column in frame.columns and isinstance(frame[column].dtype, pd.CategoricalDtype):
+                frame[column] = frame[column].astype(object)
+        counts = frame.groupby(AWARD_DIMENSIONS, dropna=False).size()
+        if cells is None:
+            return counts
+        return (
+            pd.concat([cells, counts])
+            .groupby(level=AWARD_DIMENSIONS, observed=True, dropna=False)
+            .sum()
+        )
+
+    @staticmethod
+    def _cube(cells: Optional[pd.Series]) -> AggregateCube:
+        """由奖项维度的聚合单元构建只含奖项维度的数据立方体"""
+        if cells is None:
+            award_cells = pd.DataFrame(columns=AWARD_DIMENSIONS + ['awards'])
+        else:
+            award_cells = cells.rename('awards').reset_index()
+            # 与全量数据应用数据类型模式的结果一致：词表顺序在前，其余类别按取值升序
+            award_cells['year'] = DataSchema.to_year(award_cells['year'])
+            for column, categories in DataSchema.CATEGORY_COLUMNS['awards'].items():
+                award_cells[column] = DataSchema.to_category(award_cells[column], categories)
+        org_cells = award_cells.iloc[:0].reindex(columns=DIMENSIONS + MEASURES)
+        return AggregateCube(award_cells, org_cells)
+
+    def _network_analysis(self, aggregator: IncrementalAggregator) -> Dict[str, Any]:
+        """由合并后的获奖人共现次数计算合作网络分析"""
+        try:
+            # 按全量计算时的顺序加入边，节点顺序一致，聚类系数等浮点结果也一致
+            G = aggregator.build_network(self.min_weight)
+            results = NetworkMetrics().compute(G)
+
+            # 只为输出的节点生成显示名称
+            nodes = set().union(*results['components'], *results['centrality'].values())
+            results['labels'] = {
+                node: aggregator.winner_latest[node][0] if node in aggregator.winner_latest else node
+                for node in nodes
+            }
+            return results
+
+        except Exception as e:
+            logger.error(f"获取网络分析失败: {str(e)}")
+            return {}
\ No newline at end of file
@@ -0,0 +1,128 @@
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+class CooccurrenceMatrix:
+    """共现矩阵类
+
+    将分组（如项目）和实体（如获奖人、机构）编码为整数，构建 分组×实体 的稀疏关联矩阵 A，
+    一次稀疏矩阵乘法 AᵀA 即得到所有实体对共同出现的分组数，不需要逐组枚举实体对。
+    """
+
+    def __init__(self, incidence: sparse.csr_matrix, entities: np.ndarray, labels: np.ndarray):
+        """
+        初始化共现矩阵
+
+        Args:
+            incidence: 分组×实体的0/1稀疏关联矩阵
+            entities: 实体编码对应的实体键
+            labels: 实体编码对应的显示名称
+        """
+        self.incidence = incidence
+        self.entities = entities
+        self.labels = labels
+        self._pairs = None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, group_column: str, entity_column: str,
+                   label_column: Optional[str] = None) -> 'CooccurrenceMatrix':
+        """
+        从DataFrame构建共现矩阵
+
+        Args:
+            df: 数据表，每行为一次“实体出现在分组中”
+            group_column: 分组列（如 project_id）
+            entity_column: 实体列（如 winner_id、organization）
+            label_column: 显示名称列，默认与实体列相同；同一实体取最后一次出现的名称
+
+        Returns:
+            共现矩阵
+        """
+        label_column = label_column or entity_column
+        group_codes, _ = pd.factorize(df[group_column])
+        entity_codes, entities = pd.factorize(df[entity_column])
+        linked = (group_codes >= 0) & (entity_codes >= 0)
+        group_codes = group_codes[linked]
+        entity_codes = entity_codes[linked]
+
+        last = np.full(len(entities), -1, dtype=np.int64)
+        np.maximum.at(last, entity_codes, np.arange(len(entity_codes)))
+        labels = df[label_column].to_numpy(dtype=object)[linked][last]
+
+        # 同一分组中重复出现的实体只计一次
+        incidence = sparse.csr_matrix(
+            (np.ones(len(entity_codes), dtype=np.int64), (group_codes, entity_codes)),
+            shape=(group_codes.max() + 1 if len(group_codes) else 0, len(entities))
+        )
+        incidence.sum_duplicates()
+        incidence.data[:] = 1
+        return cls(incidence, np.asarray(entities, dtype=object), labels)
+
+    @property
+    def entity_count(self) -> int:
+        """实体数量"""
+        return len(self.entities)
+
+    def pairs(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        计算所有共现实体对
+
+        Returns:
+            (实体编码1, 实体编码2, 共现次数)，编码1 < 编码2，按 (编码1, 编码2) 排序
+        """
+        if self._pairs is None:
+            cooccurrence = sparse.triu(self.incidence.T @ self.incidence, k=1).tocoo()
+            # 稀疏矩阵乘积的元素顺序不固定，按编码排序使边的顺序确定
+            order = np.lexsort((cooccurrence.col, cooccurrence.row))
+            self._pairs = (
+                cooccurrence.row[order].astype(np.int64),
+                cooccurrence.col[order].astype(np.int64),
+                cooccurrence.data[order].astype(np.int64)
+            )
+        return self._pairs
+
+    def edges(self, min_weight: Optional[int] = None) -> List[Tuple[Any, Any, int]]:
+        """
+        获取带权边列表
+
+        Args:
+            min_weight: 最小共现次数
+
+        Returns:
+            (实体键1, 实体键2, 共现次数) 列表
+        """
+        rows, cols, weights = self.pairs()
+        if min_weight:
+            keep = weights >= min_weight
+            rows, cols, weights = rows[keep], cols[keep], weights[keep]
+        return list(zip(self.entities[rows].tolist(), self.entities[cols].tolist(), weights.tolist()))
+
+    def top_pairs(self, top_n: int = 10) -> List[Dict[str, Any]]:
+        """
+        获取共现次数最多的实体对
+
+        Args:
+            top_n: 返回个数
+
+        Returns:
+            [{'pair': [名称1, 名称2], 'count': 次数}, ...]，次数相同时按实体首次出现的顺序
+        """
+        rows, cols, weights = self.pairs()
+        order = np.lexsort((cols, rows, -weights))[:top_n]
+        return [
+            {
+                'pair': sorted([self.labels[rows[i]], self.labels[cols[i]]], key=str),
+                'count': int(weights[i])
+            }
+            for i in order
+        ]
+
+    def group_sizes(self) -> np.ndarray:
+        """
+        获取每个分组中的不同实体数
+
+        Returns:
+            实体数数组
+        """
+        return np.diff(self.incidence.indptr)
\ No newline at end of file
@@ -0,0 +1,253 @@
+import threading
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from .region import get_region_resolver
+
+# 奖项维度：仅按这些维度汇总时奖项数量精确计数
+AWARD_DIMENSIONS = ['year', 'award_type', 'award_level']
+
+# 全部维度
+DIMENSIONS = AWARD_DIMENSIONS + ['region', 'organization']
+
+# 度量
+MEASURES = ['awards', 'projects', 'winners']
+
+class AggregateCube:
+    """预聚合数据立方体类
+
+    数据加载后按 (年份, 奖项类型, 奖项等级, 地区, 机构) 一次性预聚合，之后任意维度组合的
+    筛选与汇总只在聚合单元上计算，不再访问原始记录：
+    - award_cells：奖项维度上的奖项数量
+    - org_cells：全部维度上的项目数、获奖人数，以及涉及该机构的奖项数量
+      （项目和获奖人分别按各自的机构计入）
+    - award_orgs：奖项与所涉机构的关联表，每个 (奖项, 地区, 机构) 只保留一行
+
+    奖项数量不能跨聚合单元相加（多个机构联合获奖的奖项会重复计数）：汇总维度和筛选条件
+    只涉及奖项维度时取自 award_cells；涉及地区或机构时在 award_orgs 中按奖项去重计数。
+    """
+
+    def __init__(self, award_cells: pd.DataFrame, org_cells: pd.DataFrame,
+                 award_orgs: Optional[pd.DataFrame] = None):
+        """
+        初始化数据立方体
+
+        Args:
+            award_cells: 奖项维度聚合单元，列为 AWARD_DIMENSIONS + ['awards']
+            org_cells: 全部维度聚合单元，列为 DIMENSIONS + MEASURES
+            award_orgs: 奖项与机构的关联表，列为 DIMENSIONS + ['award_id']，默认为空
+        """
+        self.award_cells = award_cells
+        self.org_cells = org_cells
+        self.award_orgs = award_orgs if award_orgs is not None else pd.DataFrame(columns=DIMENSIONS + ['award_id'])
+
+    @classmethod
+    def from_frames(cls, awards_df: pd.DataFrame, projects_df: pd.DataFrame,
+                    winners_df: pd.DataFrame) -> 'AggregateCube':
+        """
+        由奖项、项目、获奖人表构建数据立方体
+
+        Args:
+            awards_df: 奖项表，含 award_id
+            projects_df: 项目表，含 award_id、project_id
+            winners_df: 获奖人表，含 project_id
+
+        Returns:
+            数据立方体
+        """
+        awards = awards_df.reindex(columns=['award_id'] + AWARD_DIMENSIONS)
+        award_cells = (
+            awards.groupby(AWARD_DIMENSIONS, observed=True, dropna=False)
+            .size().rename('awards').reset_index()
+        )
+
+        # 项目、获奖人通过整数键关联到所属奖项，取奖项维度
+        award_dims = awards.dropna(subset=['award_id']).drop_duplicates('award_id').set_index('award_id')[AWARD_DIMENSIONS]
+        projects = projects_df.reindex(columns=['project_id', 'award_id', 'organization'])
+        winners = winners_df.reindex(columns=['project_id', 'organization'])
+        project_awards = projects.dropna(subset=['project_id']).drop_duplicates('project_id').set_index('project_id')['award_id']
+        winner_award_ids = project_awards.reindex(winners['project_id']).to_numpy()
+
+        facts = []
+        for award_ids, frame, measure in (
+            (projects['award_id'].to_numpy(), projects, 'projects'),
+            (winner_award_ids, winners, 'winners')
+        ):
+            fact = award_dims.reindex(award_ids).reset_index(drop=True)
+            fact['organization'] = frame['organization'].to_numpy(dtype=object)
+            fact['award_id'] = award_ids
+            fact['projects'] = np.int64(measure == 'projects')
+            fact['winners'] = np.int64(measure == 'winners')
+            facts.append(fact)
+        facts = pd.concat(facts, ignore_index=True)
+        facts.insert(len(AWARD_DIMENSIONS), 'region', get_region_resolver().resolve_series(facts['organization']).to_numpy())
+
+        org_cells = (
+            facts.groupby(DIMENSIONS, observed=True, dropna=False)
+            .agg(awards=('award_id', 'nunique'), projects=('projects', 'sum'), winners=('winners', 'sum'))
+            .reset_index()
+        )
+        award_orgs = (
+            facts.dropna(subset=['award_id'])
+            .drop_duplicates(['award_id', 'region', 'organization'])[DIMENSIONS + ['award_id']]
+            .reset_index(drop=True)
+        )
+        return cls(award_cells, org_cells, award_orgs)
+
+    def __len__(self) -> int:
+        return len(self.org_cells)
+
+    @staticmethod
+    def _mask(cells: pd.DataFrame, filters: Dict[str, Any], year_range: Optional[Tuple[Any, Any]]) -> np.ndarray:
+        """筛选条件对应的单元掩码：取值为列表时匹配其中任一取值，year_range 为闭区间"""
+        mask = np.ones(len(cells), dtype=bool)
+        for column, value in filters.items():
+            if value is None:
+                continue
+            values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            mask &= cells[column].isin(values).to_numpy()
+        if year_range is not None:
+            start, end = year_range
+            years = cells['year']
+            if start is not None:
+                mask &= (years >= start).fillna(False).to_numpy(dtype=bool)
+            if end is not None:
+                mask &= (years <= end).fillna(False).to_numpy(dtype=bool)
+        return mask
+
+    def rollup(self, by: Sequence[str] = (), year_range: Optional[Tuple[Any, Any]] = None,
+               **filters) -> pd.DataFrame:
+        """
+        按维度筛选并汇总
+
+        Args:
+            by: 汇总维度，为空时返回总计
+            year_range: 年份闭区间 (起, 止)，任一端为None表示不限
+            **filters: 维度筛选条件，取值为单个值或列表
+
+        Returns:
+            汇总DataFrame，列为 by + MEASURES，按汇总维度排序
+        """
+        by = list(by)
+        unknown = [column for column in by + list(filters) if column not in DIMENSIONS]
+        if unknown:
+            raise ValueError(f"不支持的维度: {', '.join(unknown)}")
+
+        cells = self.org_cells[self._mask(self.org_cells, filters, year_range)]
+        if by:
+            result = cells.groupby(by, observed=True, dropna=False)[MEASURES].sum()
+        else:
+            result = cells[MEASURES].sum().to_frame().T
+
+        active = {column for column, value in filters.items() if value is not None}
+        if set(by) | active <= set(AWARD_DIMENSIONS):
+            awards = self.award_cells[self._mask(self.award_cells, filters, year_range)]
+            if by:
+                award_counts = awards.groupby(by, observed=True, dropna=False)['awards'].sum()
+                result = result.drop(columns='awards').join(award_counts, how='outer')
+            else:
+                result['awards'] = awards['awards'].sum()
+        else:
+            # 涉及地区或机构：同一奖项在每个分组中只计一次
+            pairs = self.award_orgs[self._mask(self.award_orgs, filters, year_range)]
+            if by:
+                award_counts = pairs.groupby(by, observed=True, dropna=False)['award_id'].nunique().rename('awards')
+                result = result.drop(columns='awards').join(award_counts, how='outer')
+            else:
+                result['awards'] = pairs['award_id'].nunique()
+
+        result = result.fillna(0).astype(np.int64)[MEASURES]
+        return result.reset_index() if by else result.reset_index(drop=True)
+
+    def pivot(self, index: str, columns: str, measure: str = 'awards', **filters) -> pd.DataFrame:
+        """
+        透视表：行、列为两个维度，取值为度量
+
+        Args:
+            index: 行维度
+            columns: 列维度
+            measure: 度量
+            **filters: 传给 rollup 的筛选条件
+
+        Returns:
+            透视DataFrame，index 维度为第一列，缺失组合为0
+        """
+        rolled = self.rollup([index, columns], **filters)
+        return rolled.pivot_table(
+            index=index,
+            columns=columns,
+            values=measure,
+            aggfunc='sum',
+            fill_value=0,
+            observed=True
+        ).reset_index()
+
+    def trends(self) -> Dict[str, pd.DataFrame]:
+        """
+        获取年度趋势：奖项数量及类型、等级分布
+
+        只使用奖项维度，org_cells 可以为空。
+
+        Returns:
+            趋势结果字典（yearly_counts/type_trends/level_trends）
+        """
+        results = {}
+        
+        # 年度奖项数量趋势
+        yearly_counts = self.rollup(['year'])[['year', 'awards']].dropna(subset=['year'])
+        yearly_counts.columns = ['年份', '奖项数量']
+        results['yearly_counts'] = yearly_counts.reset_index(drop=True)
+        
+        # 年度奖项类型分布趋势
+        results['type_trends'] = self.pivot('year', 'award_type')
+        
+        # 年度奖项等级分布趋势
+        results['level_trends'] = self.pivot('year', 'award_level')
+        
+        return results
+
+    def members(self, dimension: str) -> List[Any]:
+        """
+        获取维度的全部取值，供筛选控件使用
+
+        Args:
+            dimension: 维度
+
+        Returns:
+            排序后的取值列表（不含缺失值）
+        """
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"不支持的维度: {dimension}")
+        cells = self.award_cells if dimension in AWARD_DIMENSIONS else self.org_cells
+        values = cells[dimension].dropna()
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # 分类维度按词表顺序
+            present = set(values)
+            return [value for value in values.cat.categories if value in present]
+        return sorted(values.unique().tolist())
+
+_cubes: Dict[str, Tuple[Any, AggregateCube]] = {}
+_cubes_lock = threading.Lock()
+
+def get_store_cube(store) -> AggregateCube:
+    """
+    获取进程内缓存的数据库数据立方体，数据库内容变化后重新构建
+
+    Args:
+        store: 奖项数据库（AwardStore）
+
+    Returns:
+        数据立方体
+    """
+    version = store.data_version()
+    with _cubes_lock:
+        cached = _cubes.get(store.db_path)
+        if cached is None or cached[0] != version:
+            data = store.load_frames()
+            cube = AggregateCube.from_frames(data['awards'], data['projects'], data['winners'])
+            _cubes[store.db_path] = (version, cube)
+            logger.info(f"数据立方体已构建: {len(cube)} 个聚合单元")
+            cached = _cubes[store.db_path]
+        return cached[1]
\ No newline at end of file
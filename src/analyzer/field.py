@@ -0,0 +1,124 @@
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from config.config import FIELD_CONFIG
+from .text import get_text_service
+
+class FieldAnalyzer:
+    """研究领域分析类
+
+    项目名称经共享的 TextAnalysisService 分词（使用缓存），以每个项目名称为一篇文档，
+    用 TfidfVectorizer 在当前语料上计算IDF和TF-IDF稀疏矩阵。
+    整体、各年度、各奖项类型的热点词由一个 分组×项目 的稀疏矩阵一次相乘汇总得到。
+    """
+
+    COLUMNS = ['关键词', '出现次数', '权重']
+
+    def __init__(self, top_n: Optional[int] = None, min_length: Optional[int] = None):
+        """
+        初始化研究领域分析器
+
+        Args:
+            top_n: 每个分组输出的关键词数，默认读取 FIELD_CONFIG
+            min_length: 关键词最小长度，默认读取 FIELD_CONFIG
+        """
+        self.top_n = top_n or FIELD_CONFIG.get('top_n', 20)
+        self.min_length = min_length or FIELD_CONFIG.get('min_length', 2)
+        self.stop_words = set(FIELD_CONFIG.get('stop_words', []))
+
+    def _terms(self, tokens: tuple) -> List[str]:
+        """过滤单字、纯数字、停用词"""
+        import jieba.analyse
+
+        stop_words = jieba.analyse.default_tfidf.stop_words
+        return [
+            token for token in tokens
+            if len(token.strip()) >= self.min_length and not token.isdigit()
+            and token.lower() not in stop_words and token not in self.stop_words
+        ]
+
+    def analyze(self, names: pd.Series, groups: Optional[Dict[str, pd.Series]] = None) -> Dict[str, pd.DataFrame]:
+        """
+        计算整体及各分组的热点关键词
+
+        Args:
+            names: 项目名称
+            groups: {分组列名: 与 names 对齐的分组取值}，如 {'年份': 年份列, '奖项类型': 类型列}
+
+        Returns:
+            {'overall': 整体热点词, 分组列名: 各分组热点词（长表）}
+        """
+        groups = groups or {}
+        known = names.notna().to_numpy()
+        texts = names[known].astype(str).tolist()
+        results = {'overall': pd.DataFrame(columns=self.COLUMNS)}
+        results.update({column: pd.DataFrame(columns=[column] + self.COLUMNS) for column in groups})
+        if not texts:
+            return results
+
+        token_lists = get_text_service().tokenize(texts)
+        vectorizer = TfidfVectorizer(analyzer=self._terms)
+        try:
+            weights = vectorizer.fit_transform(token_lists).tocsr()
+        except ValueError:
+            # 没有任何有效关键词
+            return results
+        terms = vectorizer.get_feature_names_out()
+        presence = weights.copy()
+        presence.data[:] = 1
+
+        # 分组矩阵：第一行为整体，其后依次为各分组列的每个取值
+        rows = [np.zeros(len(texts), dtype=np.int64)]
+        labels = [('overall', None)]
+        offset = 1
+        for column, values in groups.items():
+            codes, uniques = pd.factorize(values[known], sort=True)
+            rows.append(np.where(codes >= 0, codes + offset, -1))
+            labels.extend((column, value) for value in uniques)
+            offset += len(uniques)
+
+        group_rows = np.concatenate(rows)
+        doc_cols = np.tile(np.arange(len(texts)), len(rows))
+        linked = group_rows >= 0
+        indicator = sparse.csr_matrix(
+            (np.ones(int(linked.sum())), (group_rows[linked], doc_cols[linked])),
+            shape=(offset, len(texts))
+        )
+        group_weights = (indicator @ weights).tocsr()
+        group_counts = (indicator @ presence).tocsr()
+
+        frames = {column: [] for column in groups}
+        for row, (column, value) in enumerate(labels):
+            top = self._top_terms(group_weights, group_counts, row, terms)
+            if column == 'overall':
+                results['overall'] = top
+            elif not top.empty:
+                top.insert(0, column, value)
+                frames[column].append(top)
+        for column, parts in frames.items():
+            if parts:
+                results[column] = pd.concat(parts, ignore_index=True)
+        return results
+
+    def _top_terms(self, group_weights: sparse.csr_matrix, group_counts: sparse.csr_matrix,
+                   row: int, terms: np.ndarray) -> pd.DataFrame:
+        """取分组内TF-IDF权重之和最大的关键词"""
+        start, end = group_weights.indptr[row], group_weights.indptr[row + 1]
+        columns = group_weights.indices[start:end]
+        values = group_weights.data[start:end]
+        if len(values) > self.top_n:
+            # 保留不小于第N大权重的全部关键词，权重相同时按关键词顺序取舍
+            threshold = values[np.argpartition(-values, self.top_n - 1)[self.top_n - 1]]
+            keep = values >= threshold
+            columns, values = columns[keep], values[keep]
+        order = np.lexsort((columns, -values))[:self.top_n]
+        columns, values = columns[order], values[order]
+        counts = np.asarray(group_counts[row, columns].todense()).ravel().astype(np.int64)
+        return pd.DataFrame({
+            '关键词': terms[columns],
+            '出现次数': counts,
+            '权重': np.round(values, 4)
+        })
\ No newline at end of file
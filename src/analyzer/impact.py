@@ -0,0 +1,193 @@
+from typing import Dict, Any, List, Optional
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from config.config import IMPACT_CONFIG
+from processor.relations import GroupIndex
+
+class ImpactScorer:
+    """影响力评分类
+
+    按项目等级映射权重，可选按获奖年份做半衰期衰减，得到每个项目的得分；
+    机构得分为其有等级的项目得分之和，获奖人得分为其参与项目的得分之和。
+    所有计算均为向量化的映射、按键关联和分组求和。
+    """
+
+    def __init__(self, scheme: Optional[str] = None, weights: Optional[Dict[str, float]] = None,
+                 half_life: Optional[float] = None, reference_year: Optional[int] = None):
+        """
+        初始化评分器
+
+        Args:
+            scheme: 权重方案名称，默认读取 IMPACT_CONFIG
+            weights: 自定义等级权重，指定时忽略 scheme
+            half_life: 衰减半衰期（年），默认读取 IMPACT_CONFIG，为空时不衰减
+            reference_year: 衰减的参照年份，默认为数据中的最大年份
+        """
+        self.scheme = scheme or IMPACT_CONFIG.get('scheme', 'default')
+        schemes = IMPACT_CONFIG.get('weight_schemes', {})
+        if weights is None:
+            if self.scheme not in schemes:
+                raise ValueError(f"未知的权重方案: {self.scheme}")
+            weights = schemes[self.scheme]
+        self.weights = dict(weights)
+        self.default_weight = IMPACT_CONFIG.get('default_weight', 1)
+        self.half_life = half_life if half_life is not None else IMPACT_CONFIG.get('half_life')
+        self.reference_year = reference_year if reference_year is not None else IMPACT_CONFIG.get('reference_year')
+
+    def level_weights(self, levels: pd.Series) -> np.ndarray:
+        """
+        将项目等级映射为权重
+
+        分类类型的列只映射各类别一次，再按编码取值。
+
+        Args:
+            levels: 等级列
+
+        Returns:
+            权重数组，未知或缺失的等级使用默认权重
+        """
+        if isinstance(levels.dtype, pd.CategoricalDtype):
+            category_weights = np.array(
+                [self.weights.get(c, self.default_weight) for c in levels.cat.categories] + [self.default_weight],
+                dtype=float
+            )
+            return category_weights[levels.cat.codes.to_numpy()]
+        return levels.map(self.weights).astype(float).fillna(self.default_weight).to_numpy()
+
+    def decay(self, years: pd.Series) -> np.ndarray:
+        """
+        计算时间衰减系数
+
+        Args:
+            years: 年份列
+
+        Returns:
+            衰减系数数组，未设置半衰期或年份缺失时为1
+        """
+        factors = np.ones(len(years))
+        if not self.half_life:
+            return factors
+
+        years = pd.to_numeric(years, errors='coerce').astype(float).to_numpy()
+        known = ~np.isnan(years)
+        if not known.any():
+            return factors
+
+        reference = self.reference_year if self.reference_year is not None else years[known].max()
+        age = np.clip(reference - years[known], 0, None)
+        factors[known] = 0.5 ** (age / self.half_life)
+        return factors
+
+    def project_scores(self, projects_df: pd.DataFrame) -> np.ndarray:
+        """
+        计算每个项目的得分
+
+        Args:
+            projects_df: 项目表
+
+        Returns:
+            与 projects_df 行对齐的得分数组
+        """
+        if 'level' in projects_df.columns:
+            scores = self.level_weights(projects_df['level'])
+        else:
+            scores = np.full(len(projects_df), float(self.default_weight))
+        if 'year' in projects_df.columns:
+            scores = scores * self.decay(projects_df['year'])
+        return scores
+
+    def score_organizations(self, projects_df: pd.DataFrame, scores: np.ndarray,
+                            top_n: Optional[int] = 10) -> pd.DataFrame:
+        """
+        计算机构影响力
+
+        没有等级的项目不计入机构得分（获奖人得分仍按默认权重计入）。
+
+        Args:
+            projects_df: 项目表
+            scores: 项目得分
+            top_n: 返回前N个机构，为None时返回全部
+
+        Returns:
+            机构影响力DataFrame
+        """
+        if 'organization' not in projects_df.columns or 'level' not in projects_df.columns:
+            return pd.DataFrame(columns=['机构', '影响力得分'])
+
+        # 经过实体消解时按机构ID汇总，显示首次出现的名称
+        key = 'org_id' if 'org_id' in projects_df.columns else 'organization'
+        frame = pd.DataFrame({
+            'key': projects_df[key].to_numpy(),
+            '机构': projects_df['organization'].to_numpy(dtype=object),
+            '影响力得分': scores
+        })
+        levels = projects_df['level']
+        has_level = (levels.notna() & (levels.astype(object) != '')).to_numpy()
+        grouped = frame[has_level].dropna(subset=['key']).groupby('key', sort=False)
+        org_impact = grouped.agg({'机构': 'first', '影响力得分': 'sum'})
+        return self._top(org_impact, top_n)
+
+    def score_winners(self, projects_df: pd.DataFrame, winners_df: pd.DataFrame,
+                      scores: np.ndarray, top_n: Optional[int] = 10) -> pd.DataFrame:
+        """
+        计算获奖人影响力
+
+        Args:
+            projects_df: 项目表
+            winners_df: 获奖人表
+            scores: 项目得分
+            top_n: 返回前N个获奖人，为None时返回全部
+
+        Returns:
+            获奖人影响力DataFrame
+        """
+        index = GroupIndex.from_frames(projects_df, winners_df, 'project_id')
+        if index is None or 'name' not in winners_df.columns:
+            return pd.DataFrame(columns=['获奖人', '影响力得分'])
+
+        # 经项目键关联取得每名获奖人所在项目的得分，未关联到项目的获奖人不计分
+        linked = index.parents >= 0
+        key = 'winner_id' if 'winner_id' in winners_df.columns else 'name'
+        frame = pd.DataFrame({
+            'key': winners_df[key].to_numpy()[linked],
+            '获奖人': winners_df['name'].to_numpy(dtype=object)[linked],
+            '影响力得分': scores[index.parents[linked]]
+        })
+        grouped = frame.dropna(subset=['key']).groupby('key', sort=False)
+        winner_impact = grouped.agg({'获奖人': 'last', '影响力得分': 'sum'})
+        return self._top(winner_impact, top_n)
+
+    def analyze(self, projects_df: pd.DataFrame, winners_df: pd.DataFrame,
+                top_n: Optional[int] = 10) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        计算机构和获奖人影响力排名
+
+        Args:
+            projects_df: 项目表
+            winners_df: 获奖人表
+            top_n: 返回前N名，为None时返回全部
+
+        Returns:
+            影响力分析结果字典
+        """
+        try:
+            scores = self.project_scores(projects_df)
+            return {
+                'top_organizations': self.score_organizations(projects_df, scores, top_n).to_dict('records'),
+                'top_winners': self.score_winners(projects_df, winners_df, scores, top_n).to_dict('records')
+            }
+
+        except Exception as e:
+            logger.error(f"计算影响力失败: {str(e)}")
+            return {'top_organizations': [], 'top_winners': []}
+
+    @staticmethod
+    def _top(impact: pd.DataFrame, top_n: Optional[int]) -> pd.DataFrame:
+        """按得分降序取前N名"""
+        if top_n is None:
+            impact = impact.sort_values('影响力得分', ascending=False, kind='stable')
+        else:
+            impact = impact.nlargest(top_n, '影响力得分')
+        return impact.reset_index(drop=True)
\ No newline at end of file
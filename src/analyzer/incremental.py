@@ -0,0 +1,583 @@
+import os
+import pickle
+from collections import Counter
+from typing import Dict, Any, Callable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+import networkx as nx
+from loguru import logger
+
+from config.config import INCREMENTAL_CONFIG, AWARD_TYPES, AWARD_LEVELS
+from processor.relations import GroupIndex, add_relation_keys
+from storage.sqlite import AwardStore
+from .base import BaseAnalyzer
+from .cooccurrence import CooccurrenceMatrix
+
+def _counts(values: pd.Series) -> List[Tuple[Any, int]]:
+    """按首次出现的顺序统计取值次数，忽略缺失值"""
+    codes, uniques = pd.factorize(values.astype(object))
+    valid = codes[codes >= 0]
+    counts = np.bincount(valid, minlength=len(uniques))
+    return list(zip(np.asarray(uniques, dtype=object).tolist(), counts.tolist()))
+
+def _last(keys: pd.Series, values: pd.Series) -> Dict[Any, Any]:
+    """每个键最后一次出现时对应的值，忽略缺失的键"""
+    frame = pd.DataFrame({'key': keys.to_numpy(dtype=object), 'value': values.to_numpy(dtype=object)})
+    frame = frame.dropna(subset=['key']).drop_duplicates('key', keep='last')
+    return dict(zip(frame['key'].tolist(), frame['value'].tolist()))
+
+def _first(keys: pd.Series, values: pd.Series) -> Dict[Any, Any]:
+    """每个键第一次出现时对应的值，忽略缺失的键"""
+    frame = pd.DataFrame({'key': keys.to_numpy(dtype=object), 'value': values.to_numpy(dtype=object)})
+    frame = frame.dropna(subset=['key']).drop_duplicates('key', keep='first')
+    return dict(zip(frame['key'].tolist(), frame['value'].tolist()))
+
+# 判断重新抓取的奖项内容是否变化时比较的列，不含整数键、实体ID和抓取时间
+_CONTENT_COLUMNS = {
+    'awards': ['title', 'content', 'year', 'award_type', 'award_level', 'source_url', 'source_title', 'source_engine'],
+    'projects': ['name', 'organization', 'level'],
+    'winners': ['name', 'organization']
+}
+
+def _row_hashes(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """按内容计算每行的哈希值，与列的存储类型无关：年份统一为浮点数，其余列统一为字符串，缺失的列视为全部缺失"""
+    frame = pd.DataFrame(index=df.index)
+    for column in columns:
+        values = df[column] if column in df.columns else pd.Series(None, index=df.index, dtype=object)
+        if column == 'year':
+            frame[column] = pd.to_numeric(values, errors='coerce').astype(float)
+        else:
+            values = values.astype(object)
+            frame[column] = values.where(values.notna(), None).astype(str)
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+def _combine(*hashes: np.ndarray) -> np.ndarray:
+    """逐行合并多个哈希值"""
+    return pd.util.hash_pandas_object(pd.DataFrame(dict(enumerate(hashes))), index=False).to_numpy()
+
+def _sum_by_parent(index: Optional[GroupIndex], hashes: np.ndarray, size: int) -> np.ndarray:
+    """按父行累加子行的哈希值（与子行顺序无关），没有子行时为0"""
+    totals = np.zeros(size, dtype=np.uint64)
+    if index is not None:
+        linked = index.parents >= 0
+        np.add.at(totals, index.parents[linked], hashes[linked])
+    return totals
+
+class PairCounter:
+    """可合并的实体对计数
+
+    实体按首次出现的顺序编号，实体对以 (较小编号, 较大编号) 为键累加共现次数，
+    排序规则与 CooccurrenceMatrix 对全量数据的计算结果一致。
+    """
+
+    def __init__(self):
+        self.codes = {}
+        self.labels = {}
+        self.counts = Counter()
+
+    def update(self, df: pd.DataFrame, group_column: str, entity_column: str, label_column: str) -> List[Tuple[Any, Any, int]]:
+        """
+        合并一批数据的实体对计数
+
+        Args:
+            df: 新增数据，每行为一次“实体出现在分组中”
+            group_column: 分组列
+            entity_column: 实体列
+            label_column: 显示名称列
+
+        Returns:
+            本批新增的 (实体键1, 实体键2, 共现次数) 列表
+        """
+        matrix = CooccurrenceMatrix.from_frame(df, group_column, entity_column, label_column)
+        entities = matrix.entities.tolist()
+        for entity, label in zip(entities, matrix.labels.tolist()):
+            self.codes.setdefault(entity, len(self.codes))
+            self.labels[entity] = label
+
+        rows, cols, weights = matrix.pairs()
+        added = []
+        for row, col, weight in zip(rows.tolist(), cols.tolist(), weights.tolist()):
+            a, b = entities[row], entities[col]
+            if self.codes[a] > self.codes[b]:
+                a, b = b, a
+            self.counts[(a, b)] += weight
+            added.append((a, b, weight))
+        return added
+
+    def edges(self, min_weight: Optional[int] = None) -> List[Tuple[Any, Any, int]]:
+        """
+        获取带权边列表
+
+        Args:
+            min_weight: 最小共现次数
+
+        Returns:
+            (实体键1, 实体键2, 共现次数) 列表，按实体首次出现的顺序排列，
+            与 CooccurrenceMatrix.edges 对全量数据的结果及顺序一致
+        """
+        return [
+            (a, b, count)
+            for (a, b), count in sorted(self.counts.items(), key=lambda item: (self.codes[item[0][0]], self.codes[item[0][1]]))
+            if not min_weight or count >= min_weight
+        ]
+
+    def top_pairs(self, top_n: int = 10) -> List[Dict[str, Any]]:
+        """
+        获取共现次数最多的实体对
+
+        Args:
+            top_n: 返回个数
+
+        Returns:
+            [{'pair': [名称1, 名称2], 'count': 次数}, ...]
+        """
+        ranked = sorted(
+            self.counts.items(),
+            key=lambda item: (-item[1], self.codes[item[0][0]], self.codes[item[0][1]])
+        )[:top_n]
+        return [
+            {'pair': sorted([self.labels[a], self.labels[b]], key=str), 'count': count}
+            for (a, b), count in ranked
+        ]
+
+class IncrementalAggregator:
+    """增量统计类
+
+    以可合并的计数器保存年度、类型、等级、机构、获奖人的计数，以及机构合作对、
+    获奖人合作网络，每次只合并新增批次，结果与对全部历史数据重新计算一致。
+    已合并过的奖项（按业务键）再次出现且内容不变时跳过，重复抓取不会重复计数；
+    内容有变化时数据库中的奖项已被替换，而已合并的计数无法撤销，拒绝合并，
+    由调用方用数据库中的全部数据重建（见 changed_awards）。
+
+    分块模式用于逐块合并数据库中的数据：库中奖项已按业务键去重，不再保存奖项键；
+    多机构合作统计由调用方在数据库中计算，不再保存项目名称到机构集合的映射。
+    """
+
+    def __init__(self, state_file: Optional[str] = None, chunked: bool = False):
+        """
+        初始化增量统计
+
+        Args:
+            state_file: 状态文件路径，默认读取 INCREMENTAL_CONFIG
+            chunked: 是否为分块模式
+        """
+        self.state_file = state_file or INCREMENTAL_CONFIG.get('state_file', 'data/processed/incremental.pkl')
+        self.chunked = chunked
+        # 业务键 -> 奖项内容（含项目、获奖人）的哈希值
+        self.award_keys = {}
+        self.totals = Counter()
+        self.years = Counter()
+        self.types = Counter()
+        self.levels = Counter()
+        self.yearly = Counter()
+        self.yearly_levels = Counter()
+        self.type_counts = Counter()
+        self.type_levels = Counter()
+
+        # 类型、等级列为分类类型时，全量统计按词表顺序分组，次数相同时按词表顺序排列
+        self.categorical_types = False
+        self.categorical_levels = False
+
+        # 机构计数：全量统计先合并项目再合并获奖人，首次出现的顺序分别保存
+        self.project_orgs = Counter()
+        self.winner_orgs = Counter()
+        self.project_org_names = {}
+        self.winner_org_names = {}
+        self.org_key = None
+
+        # 获奖人计数及最近一条记录
+        self.winners = Counter()
+        self.winner_latest = {}
+        self.winner_key = None
+
+        # 项目名称 -> 机构集合，用于多机构合作统计
+        self.project_org_sets = {}
+        self.org_pairs = PairCounter()
+        self.winner_pairs = PairCounter()
+
+    def update(self, data: Dict[str, pd.DataFrame]) -> Dict[str, int]:
+        """
+        合并新增批次
+
+        Args:
+            data: 新增数据的DataFrame字典
+
+        Returns:
+            本批合并的奖项、项目、获奖人数量
+        """
+        data = self._new_records(add_relation_keys(data))
+        awards_df = data.get('awards', pd.DataFrame())
+        projects_df = data.get('projects', pd.DataFrame())
+        winners_df = data.get('winners', pd.DataFrame())
+
+        self.totals.update({'awards': len(awards_df), 'projects': len(projects_df), 'winners': len(winners_df)})
+        self._update_awards(awards_df)
+        self._update_organizations(projects_df, winners_df)
+        self._update_winners(winners_df)
+        self._update_collaborations(projects_df, winners_df)
+
+        added = {'awards': len(awards_df), 'projects': len(projects_df), 'winners': len(winners_df)}
+        logger.info(f"增量统计合并: {added['awards']} 条奖项, {added['projects']} 个项目, {added['winners']} 名获奖人")
+        return added
+
+    def changed_awards(self, data: Dict[str, pd.DataFrame]) -> List[str]:
+        """
+        获取已合并过、但重新抓取后内容有变化的奖项
+
+        Args:
+            data: 新增数据的DataFrame字典
+
+        Returns:
+            内容有变化的奖项业务键列表，不为空时 update 会拒绝合并，须重建增量统计
+        """
+        keys, fingerprints = self._fingerprints(add_relation_keys(data))
+        return self._changed(keys, fingerprints)
+
+    def _changed(self, keys: List[Optional[str]], fingerprints: List[int]) -> List[str]:
+        """已合并过且内容哈希不同的业务键；旧版本状态中没有哈希值的奖项视为未变化"""
+        return [
+            key for key, fingerprint in zip(keys, fingerprints)
+            if key is not None and self.award_keys.get(key) not in (None, fingerprint)
+        ]
+
+    def _fingerprints(self, data: Dict[str, pd.DataFrame]) -> Tuple[List[Optional[str]], List[int]]:
+        """计算每条奖项的业务键及其内容（含项目、获奖人）的哈希值，分块模式或缺少业务键列时为空"""
+        awards_df = data.get('awards', pd.DataFrame())
+        if self.chunked or awards_df.empty or not {'source_url', 'title'} & set(awards_df.columns):
+            return [], []
+
+        # 与 AwardStore.award_key 一致：来源URL，缺失时使用标题
+        keys = pd.Series(None, index=awards_df.index, dtype=object)
+        for column in ('title', 'source_url'):
+            if column in awards_df.columns:
+                values = awards_df[column].astype(object)
+                present = values.notna() if column == 'title' else values.notna() & (values != '')
+                keys = keys.mask(present, values)
+        keys = keys.tolist()
+
+        # 获奖人哈希累加到所在项目，项目哈希再累加到所在奖项
+        projects_df = data.get('projects', pd.DataFrame())
+        winners_df = data.get('winners', pd.DataFrame())
+        winner_sums = _sum_by_parent(
+            GroupIndex.from_frames(projects_df, winners_df, 'project_id'),
+            _row_hashes(winners_df, _CONTENT_COLUMNS['winners']), len(projects_df)
+        )
+        project_hashes = _combine(_row_hashes(projects_df, _CONTENT_COLUMNS['projects']), winner_sums)
+        project_sums = _sum_by_parent(
+            GroupIndex.from_frames(awards_df, projects_df, 'award_id'), project_hashes, len(awards_df)
+        )
+        fingerprints = _combine(_row_hashes(awards_df, _CONTENT_COLUMNS['awards']), project_sums)
+        return keys, fingerprints.tolist()
+
+    def _new_records(self, data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """去掉已合并过的奖项及其项目、获奖人；已合并过的奖项内容有变化时拒绝合并"""
+        keys, fingerprints = self._fingerprints(data)
+        if not keys:
+            return data
+
+        changed = self._changed(keys, fingerprints)
+        if changed:
+            raise ValueError(f"已合并的奖项内容有变化，需要重建增量统计: {len(changed)} 条")
+        keep = np.array([key is None or key not in self.award_keys for key in keys], dtype=bool)
+        self.award_keys.update((key, fingerprint) for key, fingerprint in zip(keys, fingerprints) if key is not None)
+        if keep.all():
+            return data
+
+        awards_df = data['awards']
+        result = dict(data)
+        result['awards'] = awards_df[keep]
+        projects_df = data.get('projects', pd.DataFrame())
+        if 'award_id' in awards_df.columns and 'award_id' in projects_df.columns:
+            projects_df = projects_df[projects_df['award_id'].isin(awards_df.loc[keep, 'award_id'])]
+            result['projects'] = projects_df
+        winners_df = data.get('winners', pd.DataFrame())
+        if 'project_id' in projects_df.columns and 'project_id' in winners_df.columns:
+            result['winners'] = winners_df[winners_df['project_id'].isin(projects_df['project_id'])]
+        logger.info(f"跳过已合并的奖项 {int((~keep).sum())} 条")
+        return result
+
+    def _update_awards(self, awards_df: pd.DataFrame) -> None:
+        """合并年度、类型、等级计数"""
+        if awards_df.empty:
+            return
+        columns = [c for c in ('year', 'award_type', 'award_level') if c in awards_df.columns]
+        frame = awards_df[columns].astype(object)
+        frame = frame.where(frame.notna(), None)
+
+        if 'year' in frame.columns:
+            self.years.update(dict(_counts(frame['year'])))
+        if 'award_type' in frame.columns:
+            self.types.update(dict(_counts(frame['award_type'])))
+        if 'award_level' in frame.columns:
+            self.levels.update(dict(_counts(frame['award_level'])))
+
+        # 与 groupby().agg('count') 一致：年度数量计非空的类型，类型数量计非空的年份
+        if {'year', 'award_type'} <= set(frame.columns):
+            counted = frame.dropna(subset=['year', 'award_type'])
+            self.yearly.update(dict(_counts(counted['year'])))
+            self.type_counts.update(dict(_counts(counted['award_type'])))
+        if 'award_type' in awards_df.columns and isinstance(awards_df['award_type'].dtype, pd.CategoricalDtype):
+            self.categorical_types = True
+        if 'award_level' in awards_df.columns and isinstance(awards_df['award_level'].dtype, pd.CategoricalDtype):
+            self.categorical_levels = True
+        if {'year', 'award_level'} <= set(frame.columns):
+            pairs = frame.dropna(subset=['year', 'award_level'])
+            self.yearly_levels.update(Counter(zip(pairs['year'], pairs['award_level'])))
+        if {'award_type', 'award_level'} <= set(frame.columns):
+            pairs = frame.dropna(subset=['award_type', 'award_level'])
+            self.type_levels.update(Counter(zip(pairs['award_type'], pairs['award_level'])))
+
+    def _update_organizations(self, projects_df: pd.DataFrame, winners_df: pd.DataFrame) -> None:
+        """合并机构计数"""
+        frames = [df for df in (projects_df, winners_df) if 'organization' in df.columns and not df.empty]
+        if frames:
+            key = 'org_id' if all(BaseAnalyzer._org_key(df) == 'org_id' for df in frames) else 'organization'
+            if self.org_key not in (None, key):
+                raise ValueError(f"新增数据的机构键 {key} 与已有状态 {self.org_key} 不一致")
+            self.org_key = key
+
+        for df, counter, names in ((projects_df, self.project_orgs, self.project_org_names),
+                                   (winners_df, self.winner_orgs, self.winner_org_names)):
+            if 'organization' not in df.columns or df.empty:
+                continue
+            counter.update(dict(_counts(df[self.org_key].astype(object))))
+            for org, name in _first(df[self.org_key], df['organization']).items():
+                names.setdefault(org, name)
+
+    def _update_winners(self, winners_df: pd.DataFrame) -> None:
+        """合并获奖人计数及最近一条记录"""
+        if winners_df.empty or 'name' not in winners_df.columns:
+            return
+        key = 'winner_id' if 'winner_id' in winners_df.columns else 'name'
+        if self.winner_key not in (None, key):
+            raise ValueError(f"新增数据的获奖人键 {key} 与已有状态 {self.winner_key} 不一致")
+        self.winner_key = key
+
+        self.winners.update(dict(_counts(winners_df[key].astype(object))))
+        organizations = winners_df['organization'] if 'organization' in winners_df.columns else pd.Series(None, index=winners_df.index)
+        records = pd.Series(list(zip(winners_df['name'], organizations)), index=winners_df.index)
+        self.winner_latest.update(_last(winners_df[key], records))
+
+    def _update_collaborations(self, projects_df: pd.DataFrame, winners_df: pd.DataFrame) -> None:
+        """合并机构合作、获奖人合作网络"""
+        if not self.chunked and {'name', 'organization'} <= set(projects_df.columns):
+            for name, org in zip(projects_df['name'].tolist(), projects_df['organization'].tolist()):
+                if pd.isna(name):
+                    continue
+                orgs = self.project_org_sets.setdefault(name, set())
+                if not pd.isna(org):
+                    orgs.add(org)
+
+        if winners_df.empty or 'project_id' not in winners_df.columns:
+            return
+        if 'organization' in winners_df.columns:
+            self.org_pairs.update(winners_df, 'project_id', BaseAnalyzer._org_key(winners_df), 'organization')
+        if 'name' in winners_df.columns:
+            self.winner_pairs.update(winners_df, 'project_id', self.winner_key, 'name')
+
+    def build_network(self, min_weight: Optional[int] = None) -> nx.Graph:
+        """
+        获取获奖人合作网络
+
+        Args:
+            min_weight: 最小权重阈值
+
+        Returns:
+            合作网络，与 AwardAnalyzer.build_network 对全量数据的结果一致
+        """
+        G = nx.Graph()
+        G.add_nodes_from(node for edge in self.winner_pairs.edges() for node in edge[:2])
+        G.add_weighted_edges_from(self.winner_pairs.edges(min_weight))
+        return G
+
+    def get_basic_stats(self) -> Dict[str, Any]:
+        """
+        获取基础统计信息
+
+        Returns:
+            统计信息字典
+        """
+        years = [year for year in self.years if year is not None]
+        return {
+            'total_awards': self.totals['awards'],
+            'total_projects': self.totals['projects'],
+            'total_winners': self.totals['winners'],
+            'year_range': {
+                'min_year': int(min(years)) if years else None,
+                'max_year': int(max(years)) if years else None
+            },
+            'award_types': self._ranked(self.types, self._type_order()),
+            'award_levels': self._ranked(self.levels, self._level_order())
+        }
+
+    def get_yearly_stats(self) -> pd.DataFrame:
+        """
+        获取年度统计信息
+
+        Returns:
+            年度统计DataFrame
+        """
+        return self._grouped_stats(self.yearly, self.yearly_levels, ['年份', '奖项数量', '等级分布'],
+                                   level_order=self._level_order())
+
+    def get_type_stats(self) -> pd.DataFrame:
+        """
+        获取奖项类型统计信息
+
+        Returns:
+            类型统计DataFrame
+        """
+        return self._grouped_stats(self.type_counts, self.type_levels, ['奖项类型', '数量', '等级分布'],
+                                   self._type_order(), self._level_order())
+
+    def get_organization_stats(self, top_n: Optional[int] = 10) -> pd.DataFrame:
+        """
+        获取机构统计信息
+
+        Args:
+            top_n: 返回前N个机构，为None时返回全部机构
+
+        Returns:
+            机构统计DataFrame
+        """
+        keys = list(self.project_orgs) + [org for org in self.winner_orgs if org not in self.project_orgs]
+        counts = np.array([self.project_orgs[org] + self.winner_orgs[org] for org in keys], dtype=np.int64)
+        top = BaseAnalyzer._top_n(counts, top_n)
+        return pd.DataFrame({
+            '机构名称': [self.project_org_names.get(keys[i], self.winner_org_names.get(keys[i])) for i in top],
+            '获奖次数': counts[top]
+        })
+
+    def get_winner_stats(self, top_n: Optional[int] = 10) -> pd.DataFrame:
+        """
+        获取获奖人统计信息
+
+        Args:
+            top_n: 返回前N个获奖人，为None时返回全部获奖人
+
+        Returns:
+            获奖人统计DataFrame
+        """
+        keys = list(self.winners)
+        counts = np.array([self.winners[key] for key in keys], dtype=np.int64)
+        top = BaseAnalyzer._top_n(counts, top_n)
+        return pd.DataFrame({
+            '获奖人': [self.winner_latest[keys[i]][0] for i in top],
+            '获奖次数': counts[top],
+            '最近获奖机构': [self.winner_latest[keys[i]][1] for i in top]
+        })
+
+    def get_collaboration_analysis(self) -> Dict[str, Any]:
+        """
+        获取合作关系分析
+
+        Returns:
+            合作关系分析结果字典
+        """
+        sizes = [len(orgs) for orgs in self.project_org_sets.values()]
+        return {
+            'collaboration_stats': {
+                'single_org': sum(1 for size in sizes if size == 1),
+                'multi_org': sum(1 for size in sizes if size > 1),
+                'max_orgs': max(sizes) if sizes else 0
+            },
+            'top_collaborations': [
+                {'organizations': pair['pair'], 'count': pair['count']}
+                for pair in self.org_pairs.top_pairs(10)
+            ]
+        }
+
+    def results(self) -> Dict[str, Any]:
+        """
+        获取全部增量统计结果
+
+        Returns:
+            与 AwardAnalyzer.results 中同名的结果
+        """
+        return {
+            'basic_stats': self.get_basic_stats(),
+            'yearly_stats': self.get_yearly_stats(),
+            'type_stats': self.get_type_stats(),
+            'organization_stats': self.get_organization_stats(),
+            'winner_stats': self.get_winner_stats(),
+            'collaboration_analysis': self.get_collaboration_analysis()
+        }
+
+    @classmethod
+    def load(cls, state_file: Optional[str] = None) -> 'IncrementalAggregator':
+        """
+        加载增量统计状态
+
+        Args:
+            state_file: 状态文件路径，默认读取 INCREMENTAL_CONFIG
+
+        Returns:
+            增量统计，状态文件不存在时为空
+        """
+        aggregator = cls(state_file)
+        try:
+            if os.path.exists(aggregator.state_file):
+                with open(aggregator.state_file, 'rb') as f:
+                    state = pickle.load(f)
+                aggregator.__dict__.update(state)
+                aggregator.state_file = state_file or aggregator.state_file
+                # 旧版本状态只保存了业务键
+                if isinstance(aggregator.award_keys, set):
+                    aggregator.award_keys = dict.fromkeys(aggregator.award_keys)
+                logger.info(f"增量统计状态已加载: {aggregator.totals['awards']} 条奖项")
+
+        except Exception as e:
+            logger.error(f"加载增量统计状态失败: {str(e)}")
+        return aggregator
+
+    def save(self) -> None:
+        """保存增量统计状态，先写临时文件再替换，避免中断时损坏已有状态"""
+        try:
+            directory = os.path.dirname(self.state_file)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            state = {k: v for k, v in self.__dict__.items() if k != 'state_file'}
+            temp_file = f"{self.state_file}.tmp"
+            with open(temp_file, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.state_file)
+
+            logger.info(f"增量统计状态已保存到: {self.state_file}")
+
+        except Exception as e:
+            logger.error(f"保存增量统计状态失败: {str(e)}")
+
+    @staticmethod
+    def _vocabulary_order(vocabulary: List[str]) -> Callable:
+        """分类类型的类别顺序：先词表顺序，再按取值升序排列词表以外的取值"""
+        index = {value: i for i, value in enumerate(vocabulary)}
+        return lambda value: (0, index[value], '') if value in index else (1, 0, value)
+
+    def _type_order(self) -> Optional[Callable]:
+        """类型列为分类类型时的类别顺序"""
+        return self._vocabulary_order(AWARD_TYPES) if self.categorical_types else None
+
+    def _level_order(self) -> Optional[Callable]:
+        """等级列为分类类型时的类别顺序"""
+        return self._vocabulary_order(AWARD_LEVELS) if self.categorical_levels else None
+
+    @staticmethod
+    def _ranked(counter: Counter, order: Optional[Callable] = None) -> Dict[Any, int]:
+        """按次数降序排列的计数字典，忽略缺失值；次数相同时按类别顺序，未指定时按首次出现的顺序"""
+        key = (lambda item: (-item[1], order(item[0]))) if order else (lambda item: -item[1])
+        return {k: v for k, v in sorted(((k, v) for k, v in counter.items() if k is not None), key=key) if v > 0}
+
+    def _grouped_stats(self, counts: Counter, level_counts: Counter, columns: List[str],
+                       order: Optional[Callable] = None, level_order: Optional[Callable] = None) -> pd.DataFrame:
+        """按分组输出数量及等级分布，分组默认按取值升序排列"""
+        groups = sorted((k for k in counts if k is not None), key=order)
+        distributions = {group: {} for group in groups}
+        key = (lambda item: (-item[1], level_order(item[0][1]))) if level_order else (lambda item: -item[1])
+        for (group, level), count in sorted(level_counts.items(), key=key):
+            if group in distributions:
+                distributions[group][level] = count
+        return pd.DataFrame(
+            [[group, counts[group], distributions[group]] for group in groups],
+            columns=columns
+        )
\ No newline at end of file
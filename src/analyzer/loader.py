@@ -0,0 +1,137 @@
+import threading
+from functools import wraps
+from typing import Dict, Iterable, Optional, Set
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+# 关联各表需要的键列，读取某张表时总会读取（名称列用于旧数据文件按名称补充整数键）
+KEY_COLUMNS = {
+    'awards': ['award_id', 'title'],
+    'projects': ['project_id', 'award_id', 'award_title', 'name'],
+    'winners': ['project_id', 'project_name']
+}
+
+def requires(**tables: Iterable[str]):
+    """
+    声明分析方法使用的数据表和列
+
+    例如 @requires(awards=['year', 'award_type']) 表示只使用奖项表的年份和类型列，
+    列表为空表示只需要该表的行（键列）。未声明的方法视为需要全部列。
+    调用被装饰的方法时，分析器按需读取的列先扩展为包含声明的列，
+    打开数据时未计划执行的分析也能读取到所需的表和列。
+
+    Args:
+        **tables: 表名 -> 列名列表
+
+    Returns:
+        装饰器
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            self.require(wrapper.__name__)
+            return method(self, *args, **kwargs)
+
+        wrapper.requires = {table: list(columns) for table, columns in tables.items()}
+        return wrapper
+    return decorator
+
+def declared_columns(analyzer_cls: type, analyses: Optional[Iterable[str]] = None) -> Optional[Dict[str, Set[str]]]:
+    """
+    汇总分析方法声明的表和列
+
+    Args:
+        analyzer_cls: 分析器类
+        analyses: 分析方法名，为None时汇总全部声明了列的方法
+
+    Returns:
+        表名 -> 列名集合；包含未声明列的方法时返回None（读取全部列）
+    """
+    if analyses is None:
+        analyses = [name for name in dir(analyzer_cls) if hasattr(getattr(analyzer_cls, name, None), 'requires')]
+
+    columns = {}
+    for name in analyses:
+        declared = getattr(getattr(analyzer_cls, name, None), 'requires', None)
+        if declared is None:
+            return None
+        for table, table_columns in declared.items():
+            columns.setdefault(table, set()).update(table_columns)
+    return columns
+
+class ExcelLoader:
+    """Excel数据文件的按需读取类
+
+    以 openpyxl 只读模式打开工作簿并保持打开，各数据表在调用 read 时才逐行读取，
+    只为指定列所在的列区间生成单元格值。xlsx 是压缩的XML，每次读取仍需解压并扫描
+    整张工作表；反复读取的数据应先转换为列式缓存（ColumnarStore）。
+    """
+
+    # 读取结果尚未应用数据类型模式
+    typed = False
+
+    def __init__(self, excel_path: str):
+        """
+        初始化读取器
+
+        Args:
+            excel_path: Excel文件路径
+        """
+        from openpyxl import load_workbook
+
+        self.excel_path = excel_path
+        self._workbook = load_workbook(excel_path, read_only=True, data_only=True)
+        self.sheet_names = list(self._workbook.sheetnames)
+        # 只读工作簿共享一个文件句柄，读取需串行
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """关闭工作簿文件"""
+        self._workbook.close()
+
+    def read(self, table: str, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        读取一张数据表
+
+        Args:
+            table: 表名（工作表名）
+            columns: 需要的列，为None时读取全部列
+
+        Returns:
+            DataFrame，文件中不存在的列忽略，工作表不存在时为空
+        """
+        if table not in self.sheet_names:
+            return pd.DataFrame()
+
+        with self._lock:
+            sheet = self._workbook[table]
+            header = next(sheet.iter_rows(max_row=1, values_only=True), None)
+            if header is None:
+                return pd.DataFrame()
+            header = [f'Unnamed: {i}' if name is None else str(name) for i, name in enumerate(header)]
+
+            wanted = set(header) if columns is None else set(columns)
+            positions = [i for i, name in enumerate(header) if name in wanted]
+            if not positions:
+                return pd.DataFrame()
+
+            # 只取覆盖所需列的最小列区间，再从每行中选出所需列
+            first, last = positions[0], positions[-1]
+            offsets = [i - first for i in positions]
+            rows = [
+                [row[i] for i in offsets]
+                for row in sheet.iter_rows(min_row=2, min_col=first + 1, max_col=last + 1, values_only=True)
+            ]
+
+        # 去掉末尾的空行（工作表范围可能大于实际数据）
+        while rows and all(value is None for value in rows[-1]):
+            rows.pop()
+
+        # 空单元格与 read_excel 一致地读为NaN，各列按取值推断类型
+        df = pd.DataFrame(
+            [[np.nan if value is None else value for value in row] for row in rows],
+            columns=[header[i] for i in positions]
+        )
+        logger.debug(f"读取数据表 {table}: {len(df)} 行, 列 {list(df.columns)}")
+        return df
\ No newline at end of file
@@ -0,0 +1,236 @@
+import time
+import heapq
+import random
+from collections import deque
+from typing import Dict, Any, List, Optional
+import networkx as nx
+from loguru import logger
+
+from config.config import NETWORK_CONFIG
+
+def compute_metrics(G: nx.Graph, mode: Optional[str] = None) -> Dict[str, Any]:
+    """
+    计算网络指标，模块级函数可作为 AnalysisRunner 的进程池任务
+
+    Args:
+        G: 合作网络
+        mode: 计算模式（exact/approximate/auto），默认读取 NETWORK_CONFIG
+
+    Returns:
+        网络分析结果
+    """
+    return NetworkMetrics(mode=mode).compute(G)
+
+class NetworkMetrics:
+    """合作网络指标计算类
+
+    节点数不超过 exact_max_nodes 时计算精确指标；更大的网络使用近似算法：
+    - 介数中心性：随机抽取k个源点（k-pivot）估计，超出时间预算时按已处理的源点停止
+    - 接近中心性：在每个连通分量内抽样源点做BFS估计平均距离，小分量精确计算
+    - 聚类系数：随机抽样节点估计
+    中心性只输出前 top_k 个节点，结果中 approximate 字段标明是否为近似值。
+    """
+
+    def __init__(self, mode: Optional[str] = None, pivots: Optional[int] = None,
+                 closeness_samples: Optional[int] = None, top_k: Optional[int] = None,
+                 time_budget: Optional[float] = None, seed: Optional[int] = None):
+        """
+        初始化网络指标计算器
+
+        Args:
+            mode: 计算模式（exact/approximate/auto），默认读取 NETWORK_CONFIG
+            pivots: 介数中心性抽样源点数，默认读取 NETWORK_CONFIG
+            closeness_samples: 每个连通分量的接近中心性抽样源点数，默认读取 NETWORK_CONFIG
+            top_k: 中心性输出的节点数，默认读取 NETWORK_CONFIG
+            time_budget: 近似计算的时间预算（秒），默认读取 NETWORK_CONFIG
+            seed: 随机种子，默认读取 NETWORK_CONFIG
+        """
+        self.mode = mode or NETWORK_CONFIG.get('mode', 'auto')
+        if self.mode not in ('exact', 'approximate', 'auto'):
+            raise ValueError(f"未知的网络分析模式: {self.mode}")
+        self.exact_max_nodes = NETWORK_CONFIG.get('exact_max_nodes', 2000)
+        self.pivots = pivots or NETWORK_CONFIG.get('betweenness_pivots', 200)
+        self.closeness_samples = closeness_samples or NETWORK_CONFIG.get('closeness_samples', 100)
+        self.clustering_trials = NETWORK_CONFIG.get('clustering_trials', 1000)
+        self.top_k = top_k or NETWORK_CONFIG.get('top_k', 50)
+        self.time_budget = time_budget or NETWORK_CONFIG.get('time_budget', 30)
+        self.seed = seed if seed is not None else NETWORK_CONFIG.get('seed', 42)
+
+    def compute(self, G: nx.Graph) -> Dict[str, Any]:
+        """
+        计算网络指标
+
+        Args:
+            G: 合作网络
+
+        Returns:
+            网络分析结果，approximate 为True时中心性和聚类系数为估计值
+        """
+        node_count = G.number_of_nodes()
+        approximate = self.mode == 'approximate' or (
+            self.mode == 'auto' and node_count > self.exact_max_nodes
+        )
+        components = sorted(nx.connected_components(G), key=len, reverse=True)
+
+        results = {
+            'node_count': node_count,
+            'edge_count': G.number_of_edges(),
+            'average_degree': 2 * G.number_of_edges() / node_count if node_count else 0,
+            'density': nx.density(G),
+            'approximate': approximate
+        }
+
+        if not approximate:
+            results.update({
+                'clustering_coefficient': nx.average_clustering(G) if node_count else 0,
+                'components': components,
+                'centrality': {
+                    'degree': nx.degree_centrality(G),
+                    'betweenness': nx.betweenness_centrality(G),
+                    'closeness': nx.closeness_centrality(G)
+                }
+            })
+            return results
+
+        logger.info(f"网络共 {node_count} 个节点，使用近似算法计算中心性")
+        # 时间预算前一半用于介数中心性，其余用于接近中心性
+        started = time.monotonic()
+        deadline = started + self.time_budget
+        betweenness, pivots_used = self.approximate_betweenness(G, started + self.time_budget / 2)
+        closeness, sampled_sources = self.approximate_closeness(G, components, deadline)
+
+        results.update({
+            'clustering_coefficient': (
+                nx.approximation.average_clustering(G, trials=self.clustering_trials, seed=self.seed)
+                if node_count else 0
+            ),
+            'components': components[:self.top_k],
+            'component_count': len(components),
+            'centrality': {
+                'degree': self._top(nx.degree_centrality(G)),
+                'betweenness': self._top(betweenness),
+                'closeness': self._top(closeness)
+            },
+            'method': {
+                'betweenness_pivots': pivots_used,
+                'closeness_sources': sampled_sources,
+                'clustering_trials': self.clustering_trials,
+                'top_k': self.top_k,
+                'time_budget': self.time_budget,
+                'budget_exhausted': time.monotonic() > deadline
+            }
+        })
+        return results
+
+    def approximate_betweenness(self, G: nx.Graph, deadline: float) -> tuple:
+        """
+        k-pivot抽样估计介数中心性
+
+        随机抽取源点逐个做Brandes累加，按 n/k 缩放得到无偏估计；
+        超过时间预算时停止，以已处理的源点数作为k。
+
+        Args:
+            G: 合作网络
+            deadline: 截止时间（time.monotonic）
+
+        Returns:
+            (介数中心性字典, 实际使用的源点数)
+        """
+        node_count = G.number_of_nodes()
+        betweenness = dict.fromkeys(G, 0.0)
+        if node_count <= 2:
+            return betweenness, 0
+
+        pivots = random.Random(self.seed).sample(list(G), min(self.pivots, node_count))
+        used = 0
+        for source in pivots:
+            if used and time.monotonic() > deadline:
+                break
+            self._accumulate_dependencies(G, source, betweenness)
+            used += 1
+
+        # 与 networkx 的归一化一致：1/((n-1)(n-2))，抽样时再乘以 n/k
+        scale = node_count / (used * (node_count - 1) * (node_count - 2))
+        return {node: value * scale for node, value in betweenness.items()}, used
+
+    @staticmethod
+    def _accumulate_dependencies(G: nx.Graph, source: Any, betweenness: Dict[Any, float]) -> None:
+        """从单个源点做BFS，并按Brandes算法累加各节点的依赖值"""
+        predecessors = {source: []}
+        sigma = {source: 1}
+        distance = {source: 0}
+        order = []
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            next_distance = distance[node] + 1
+            for neighbor in G[node]:
+                if neighbor not in distance:
+                    distance[neighbor] = next_distance
+                    sigma[neighbor] = 0
+                    predecessors[neighbor] = []
+                    queue.append(neighbor)
+                if distance[neighbor] == next_distance:
+                    sigma[neighbor] += sigma[node]
+                    predecessors[neighbor].append(node)
+
+        delta = dict.fromkeys(order, 0.0)
+        for node in reversed(order):
+            coefficient = (1 + delta[node]) / sigma[node]
+            for predecessor in predecessors[node]:
+                delta[predecessor] += sigma[predecessor] * coefficient
+            if node != source:
+                betweenness[node] += delta[node]
+
+    def approximate_closeness(self, G: nx.Graph, components: List[set], deadline: float) -> tuple:
+        """
+        按连通分量抽样估计接近中心性
+
+        在每个分量内抽取源点做BFS，以源点到节点的平均距离估计节点的平均距离，
+        再按 networkx 的 wf_improved 规则以分量大小缩放，使结果与精确值可比。
+        分量不大于抽样数时精确计算；超过时间预算后剩余分量的节点记为0。
+
+        Args:
+            G: 合作网络
+            components: 连通分量（按大小降序）
+            deadline: 截止时间（time.monotonic）
+
+        Returns:
+            (接近中心性字典, 实际使用的源点数)
+        """
+        rng = random.Random(self.seed)
+        node_count = G.number_of_nodes()
+        closeness = dict.fromkeys(G, 0.0)
+        sources_used = 0
+
+        for component in components:
+            size = len(component)
+            if size <= 1:
+                continue
+            if time.monotonic() > deadline and sources_used:
+                break
+
+            nodes = list(component)
+            sources = nodes if size <= self.closeness_samples else rng.sample(nodes, self.closeness_samples)
+            distance_sums = dict.fromkeys(nodes, 0)
+            used = 0
+            for source in sources:
+                if used and time.monotonic() > deadline:
+                    break
+                for node, distance in nx.single_source_shortest_path_length(G, source).items():
+                    distance_sums[node] += distance
+                used += 1
+            sources_used += used
+
+            # 估计的平均距离：源点到该节点的距离和 × (分量大小 / 源点数) / (分量大小 - 1)
+            scale = (size / used) / (size - 1)
+            for node, total in distance_sums.items():
+                if total > 0:
+                    closeness[node] = (1 / (total * scale)) * (size - 1) / (node_count - 1)
+
+        return closeness, sources_used
+
+    def _top(self, values: Dict[Any, float]) -> Dict[Any, float]:
+        """只保留数值最大的 top_k 个节点"""
+        return dict(heapq.nlargest(self.top_k, values.items(), key=lambda item: item[1]))
\ No newline at end of file
@@ -0,0 +1,140 @@
+import threading
+from typing import Any, Optional, Iterable, Tuple
+import numpy as np
+import pandas as pd
+
+from config.config import REGION_CONFIG
+from config.regions import PROVINCES, CITIES, INSTITUTIONS
+
+# 字典树中标记词条结束的键，值为对应的地区
+_END = ''
+
+class RegionResolver:
+    """地区解析类
+
+    由省份、城市、知名机构到省级行政区的词典构建字典树，从左到右扫描机构名称，
+    取最先出现位置上的最长匹配作为地区（如“中国科学院上海XX研究所”匹配“上海”）。
+    同一机构只解析一次，结果按机构名称缓存；批量解析时只处理不重复的机构。
+    """
+
+    def __init__(self, entries: Optional[Iterable[Tuple[str, str]]] = None):
+        """
+        初始化地区解析器
+
+        Args:
+            entries: (名称写法, 地区) 词条，默认由 config.regions 中的词典生成
+        """
+        self.unknown = REGION_CONFIG.get('unknown', '未知')
+        self.unmatched = REGION_CONFIG.get('unmatched', '其他')
+        self._trie = {}
+        self._cache = {}
+        self._lock = threading.Lock()
+
+        for key, region in (self.default_entries() if entries is None else entries):
+            node = self._trie
+            for ch in key:
+                node = node.setdefault(ch, {})
+            node[_END] = region
+
+    @staticmethod
+    def default_entries() -> Iterable[Tuple[str, str]]:
+        """生成默认词条：省份及其全称、城市、知名机构"""
+        for province, aliases in PROVINCES.items():
+            yield province, province
+            for alias in aliases:
+                yield alias, province
+        for province, cities in CITIES.items():
+            for city in cities:
+                yield city, province
+        yield from INSTITUTIONS.items()
+
+    def _match(self, org: str) -> Optional[str]:
+        """从左到右查找最先出现的词条，同一位置取最长的词条"""
+        for start in range(len(org)):
+            node = self._trie
+            region = None
+            for ch in org[start:]:
+                node = node.get(ch)
+                if node is None:
+                    break
+                region = node.get(_END, region)
+            if region is not None:
+                return region
+        return None
+
+    def resolve(self, org: Any) -> str:
+        """
+        解析单个机构的地区
+
+        Args:
+            org: 机构名称
+
+        Returns:
+            省级行政区名称，名称为空时为 unknown，未匹配时为 unmatched
+        """
+        if not isinstance(org, str) or not org.strip():
+            return self.unknown
+        region = self._cache.get(org)
+        if region is None:
+            region = self._match(org.strip()) or self.unmatched
+            with self._lock:
+                self._cache[org] = region
+        return region
+
+    def resolve_series(self, orgs: pd.Series) -> pd.Series:
+        """
+        批量解析机构的地区
+
+        Args:
+            orgs: 机构名称
+
+        Returns:
+            与输入索引对齐的地区
+        """
+        codes, uniques = pd.factorize(orgs)
+        regions = np.array([self.resolve(org) for org in uniques] + [self.unknown], dtype=object)
+        # 缺失值的编码为-1，正好取到末尾的 unknown
+        return pd.Series(regions[codes], index=orgs.index, name='region')
+
+    def region_counts(self, orgs: pd.Series) -> pd.DataFrame:
+        """
+        统计各地区的出现次数
+
+        Args:
+            orgs: 机构名称
+
+        Returns:
+            地区分布DataFrame，列为 地区、获奖次数，按次数降序
+        """
+        return self.rank_counts(self.resolve_series(orgs).value_counts(sort=False))
+
+    @staticmethod
+    def rank_counts(counts: pd.Series) -> pd.DataFrame:
+        """
+        将地区计数整理为地区分布表
+
+        Args:
+            counts: 地区 -> 次数，按地区首次出现的顺序排列
+
+        Returns:
+            地区分布DataFrame，列为 地区、获奖次数，按次数降序，次数相同时按首次出现的顺序
+        """
+        region_stats = counts.sort_values(ascending=False, kind='stable').reset_index()
+        region_stats.columns = ['地区', '获奖次数']
+        return region_stats
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+def get_region_resolver() -> RegionResolver:
+    """
+    获取进程内共享的地区解析器
+
+    Returns:
+        地区解析器
+    """
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = RegionResolver()
+        return _resolver
\ No newline at end of file
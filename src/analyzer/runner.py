@@ -0,0 +1,157 @@
+import time
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any, Callable, Iterable, Optional
+from loguru import logger
+
+from config.config import ANALYSIS_CONFIG
+
+def _run_timed(func: Callable, args: list) -> tuple:
+    """在工作进程中执行任务，返回 (结果, 耗时)"""
+    started = time.perf_counter()
+    return func(*args), time.perf_counter() - started
+
+class AnalysisRunner:
+    """分析任务调度类
+
+    每个分析任务声明所依赖的任务，依赖全部完成后提交到线程池，
+    互不依赖的分析并发执行，总耗时接近最慢的一条依赖链。
+    依赖任务的结果按声明顺序作为位置参数传入；依赖失败的任务不再执行。
+
+    线程池适合释放GIL的numpy/pandas计算；纯Python的计算密集任务可标记为进程池任务，
+    在工作进程中执行，其函数须为模块级函数，参数和结果须可序列化。
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, process_workers: Optional[int] = None):
+        """
+        初始化调度器
+
+        Args:
+            max_workers: 工作线程数，默认读取 ANALYSIS_CONFIG，为1时按添加顺序串行执行（进程池任务也在当前进程执行）
+            process_workers: 进程池任务的工作进程数，默认读取 ANALYSIS_CONFIG
+        """
+        self.max_workers = max(1, max_workers or ANALYSIS_CONFIG.get('max_workers', 4))
+        self.process_workers = max(1, process_workers or ANALYSIS_CONFIG.get('process_workers', 2))
+        self.tasks = OrderedDict()
+
+        # 各任务耗时（秒）及本次运行的总耗时
+        self.timings = {}
+        self.elapsed = 0.0
+
+    def add(self, name: str, func: Callable, depends: Iterable[str] = (),
+            process: bool = False) -> 'AnalysisRunner':
+        """
+        添加分析任务
+
+        依赖的任务必须先添加，因此任务图不会出现环。
+
+        Args:
+            name: 任务名称，即结果字典的键
+            func: 分析函数，参数为依赖任务的结果
+            depends: 依赖的任务名称
+            process: 是否在进程池中执行
+
+        Returns:
+            调度器本身，便于链式调用
+        """
+        depends = tuple(depends)
+        if name in self.tasks:
+            raise ValueError(f"分析任务重复: {name}")
+        missing = [dep for dep in depends if dep not in self.tasks]
+        if missing:
+            raise ValueError(f"分析任务 {name} 依赖未定义的任务: {', '.join(missing)}")
+        self.tasks[name] = (func, depends, process)
+        return self
+
+    def run(self) -> Dict[str, Any]:
+        """
+        执行全部分析任务
+
+        Returns:
+            {任务名称: 结果}，失败或被跳过的任务不在其中
+        """
+        started = time.perf_counter()
+        self.timings = {}
+        results = {}
+        failed = set()
+
+        if self.max_workers == 1:
+            for name, (func, depends, _) in self.tasks.items():
+                if self._blocked(name, depends, failed):
+                    continue
+                ok, value = self._execute(name, func, [results[dep] for dep in depends])
+                if ok:
+                    results[name] = value
+                else:
+                    failed.add(name)
+        else:
+            pending = OrderedDict(self.tasks)
+            processes = None
+            if any(process for _, _, process in self.tasks.values()):
+                # 与分词服务一致，工作进程以spawn启动，避免fork复制其他线程持有的锁
+                processes = ProcessPoolExecutor(max_workers=self.process_workers,
+                                                mp_context=multiprocessing.get_context('spawn'))
+            try:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    running = {}
+                    while pending or running:
+                        # 提交依赖已经全部完成的任务
+                        for name, (func, depends, process) in list(pending.items()):
+                            if self._blocked(name, depends, failed):
+                                del pending[name]
+                            elif all(dep in results for dep in depends):
+                                del pending[name]
+                                args = [results[dep] for dep in depends]
+                                if process:
+                                    running[processes.submit(_run_timed, func, args)] = (name, True)
+                                else:
+                                    running[executor.submit(self._execute, name, func, args)] = (name, False)
+
+                        done, _ = wait(running, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            name, process = running.pop(future)
+                            ok, value = self._collect(name, future) if process else future.result()
+                            if ok:
+                                results[name] = value
+                            else:
+                                failed.add(name)
+            finally:
+                if processes is not None:
+                    processes.shutdown()
+
+        self.elapsed = time.perf_counter() - started
+        logger.info(
+            f"分析任务完成: {len(results)}/{len(self.tasks)} 个成功，总耗时 {self.elapsed:.2f}s，"
+            f"各任务耗时合计 {sum(self.timings.values()):.2f}s"
+        )
+        return results
+
+    def _execute(self, name: str, func: Callable, args: list) -> tuple:
+        """执行单个任务并记录耗时，返回 (是否成功, 结果)"""
+        started = time.perf_counter()
+        try:
+            return True, func(*args)
+        except Exception as e:
+            logger.error(f"分析任务 {name} 失败: {str(e)}")
+            return False, None
+        finally:
+            self.timings[name] = time.perf_counter() - started
+
+    def _collect(self, name: str, future) -> tuple:
+        """取得进程池任务的结果并记录耗时，返回 (是否成功, 结果)"""
+        try:
+            value, self.timings[name] = future.result()
+            return True, value
+        except Exception as e:
+            logger.error(f"分析任务 {name} 失败: {str(e)}")
+            return False, None
+
+    @staticmethod
+    def _blocked(name: str, depends: tuple, failed: set) -> bool:
+        """依赖任务失败时跳过该任务，并将其视为失败以跳过后续任务"""
+        if any(dep in failed for dep in depends):
+            logger.warning(f"分析任务 {name} 的依赖失败，已跳过")
+            failed.add(name)
+            return True
+        return False
\ No newline at end of file
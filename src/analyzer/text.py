@@ -0,0 +1,218 @@
+import os
+import pickle
+import multiprocessing
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from loguru import logger
+
+from config.config import TEXT_CONFIG
+
+def _configure_jieba(dict_cache: str):
+    """将jieba的前缀词典缓存指向配置的文件，返回默认分词器"""
+    import jieba
+
+    directory, filename = os.path.split(os.path.abspath(dict_cache))
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    jieba.dt.tmp_dir = directory
+    jieba.dt.cache_file = filename
+    return jieba.dt
+
+def _init_worker(dict_cache: str) -> None:
+    """工作进程初始化：从序列化的词典缓存加载jieba"""
+    _configure_jieba(dict_cache).initialize()
+
+def _tokenize_chunk(names: List[str]) -> List[Tuple[str, ...]]:
+    """
+    在工作进程中对一个数据块分词
+
+    Args:
+        names: 项目名称列表
+
+    Returns:
+        与输入对齐的分词结果
+    """
+    import jieba
+
+    return [tuple(jieba.cut(name)) for name in names]
+
+class TextAnalysisService:
+    """文本分析服务类
+
+    - 预先加载jieba词典，并将前缀词典序列化缓存到 dict_cache，之后的进程直接读取缓存
+    - 按名称缓存分词结果，重复分析时只对新出现的名称分词
+    - 待分词的名称较多时分块在多个进程中并行分词
+    - 关键词按jieba的TF-IDF规则从缓存的分词结果计算，不需要再次分词
+    """
+
+    def __init__(self, dict_cache: Optional[str] = None, token_cache: Optional[str] = None,
+                 max_workers: Optional[int] = None, chunk_size: Optional[int] = None):
+        """
+        初始化文本分析服务
+
+        Args:
+            dict_cache: jieba前缀词典缓存文件，默认读取 TEXT_CONFIG
+            token_cache: 分词结果缓存文件，默认读取 TEXT_CONFIG
+            max_workers: 分词进程数，默认读取 TEXT_CONFIG
+            chunk_size: 每个进程任务的名称数，默认读取 TEXT_CONFIG
+        """
+        self.dict_cache = dict_cache or TEXT_CONFIG.get('dict_cache', 'data/cache/jieba.cache')
+        self.token_cache = token_cache or TEXT_CONFIG.get('token_cache', 'data/cache/tokens.pkl')
+        self.max_workers = max(1, max_workers or TEXT_CONFIG.get('max_workers', 4))
+        self.chunk_size = max(1, chunk_size or TEXT_CONFIG.get('chunk_size', 2000))
+        self.parallel_threshold = TEXT_CONFIG.get('parallel_threshold', 5000)
+
+        self.tokens = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+
+    def preload(self) -> None:
+        """加载jieba词典，已加载时直接返回"""
+        with self._lock:
+            if self._loaded:
+                return
+            _configure_jieba(self.dict_cache).initialize()
+            self._loaded = True
+
+    def tokenize(self, names: Sequence[str]) -> List[Tuple[str, ...]]:
+        """
+        对名称分词
+
+        Args:
+            names: 项目名称列表
+
+        Returns:
+            与输入对齐的分词结果
+        """
+        self.preload()
+        new_names = list(dict.fromkeys(name for name in names if name not in self.tokens))
+        if new_names:
+            if len(new_names) >= self.parallel_threshold and self.max_workers > 1:
+                tokenized = self._tokenize_parallel(new_names)
+            else:
+                tokenized = _tokenize_chunk(new_names)
+            with self._lock:
+                self.tokens.update(zip(new_names, tokenized))
+                self._dirty = True
+            logger.info(f"新分词 {len(new_names)} 个名称，缓存共 {len(self.tokens)} 个")
+        return [self.tokens[name] for name in names]
+
+    def _tokenize_parallel(self, names: List[str]) -> List[Tuple[str, ...]]:
+        """分块在多个进程中分词，按原始顺序合并结果"""
+        chunks = [names[i:i + self.chunk_size] for i in range(0, len(names), self.chunk_size)]
+        # 分词服务在Web请求线程中调用，fork会复制其他线程持有的锁，工作进程改为spawn启动
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(chunks)),
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker, initargs=(self.dict_cache,)) as executor:
+            tokenized = []
+            for chunk_tokens in executor.map(_tokenize_chunk, chunks):
+                tokenized.extend(chunk_tokens)
+        return tokenized
+
+    def extract_keywords(self, token_lists: Sequence[Sequence[str]], top_k: int = 20) -> Dict[str, float]:
+        """
+        按TF-IDF提取关键词
+
+        与 jieba.analyse.extract_tags 的规则一致：忽略单字和停用词，
+        词频按总词数归一化后乘以IDF，词典中没有的词使用IDF中位数。
+
+        Args:
+            token_lists: 分词结果
+            top_k: 关键词个数
+
+        Returns:
+            {关键词: 权重}，按权重降序
+        """
+        import jieba.analyse
+
+        tfidf = jieba.analyse.default_tfidf
+        freq = Counter(
+            token for tokens in token_lists for token in tokens
+            if len(token.strip()) >= 2 and token.lower() not in tfidf.stop_words
+        )
+        total = sum(freq.values())
+        if not total:
+            return {}
+        weights = {word: count * (tfidf.idf_freq.get(word, tfidf.median_idf) / total) for word, count in freq.items()}
+        top = sorted(weights, key=weights.__getitem__, reverse=True)[:top_k]
+        return {word: weights[word] for word in top}
+
+    def analyze(self, names: Sequence[str], top_k: Optional[int] = None,
+                top_words: Optional[int] = None) -> Dict[str, Any]:
+        """
+        分析名称文本的关键词和词频
+
+        Args:
+            names: 项目名称列表
+            top_k: 关键词个数，默认读取 TEXT_CONFIG
+            top_words: 输出的高频词个数，默认读取 TEXT_CONFIG
+
+        Returns:
+            文本分析结果
+        """
+        token_lists = self.tokenize(names)
+
+        # 空白不计为词
+        word_freq = Counter(token for tokens in token_lists for token in tokens if token.strip())
+        return {
+            'keywords': self.extract_keywords(token_lists, top_k or TEXT_CONFIG.get('keywords', 20)),
+            'word_frequency': dict(word_freq.most_common(top_words or TEXT_CONFIG.get('top_words', 50))),
+            'total_words': sum(word_freq.values()),
+            'unique_words': len(word_freq)
+        }
+
+    def load_tokens(self) -> None:
+        """加载分词结果缓存"""
+        try:
+            if not os.path.exists(self.token_cache):
+                return
+            with open(self.token_cache, 'rb') as f:
+                tokens = pickle.load(f)
+            with self._lock:
+                self.tokens.update(tokens)
+            logger.info(f"分词缓存已加载: {len(tokens)} 个名称")
+
+        except Exception as e:
+            logger.error(f"加载分词缓存失败: {str(e)}")
+
+    def save_tokens(self) -> None:
+        """保存分词结果缓存，没有新分词时跳过"""
+        if not self._dirty:
+            return
+        try:
+            directory = os.path.dirname(self.token_cache)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            with self._lock:
+                tokens = dict(self.tokens)
+                self._dirty = False
+            temp_file = f"{self.token_cache}.tmp"
+            with open(temp_file, 'wb') as f:
+                pickle.dump(tokens, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.token_cache)
+
+            logger.info(f"分词缓存已保存到: {self.token_cache}")
+
+        except Exception as e:
+            logger.error(f"保存分词缓存失败: {str(e)}")
+
+_service = None
+_service_lock = threading.Lock()
+
+def get_text_service() -> TextAnalysisService:
+    """
+    获取进程内共享的文本分析服务，首次调用时加载分词缓存
+
+    Returns:
+        文本分析服务
+    """
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = TextAnalysisService()
+            _service.load_tokens()
+        return _service
\ No newline at end of file
@@ -77,6 +77,139 @@ PROCESSOR_CONFIG = {
     "retry_interval": 5  # 重试间隔（秒）
 }
 
+# 去重配置
+DEDUP_CONFIG = {
+    "shingle_size": 3,  # 字符n-gram长度
+    "num_perm": 64,  # MinHash签名长度
+    "band_rows": 4,  # LSH每段的签名行数
+    "sketch_size": 256,  # 最小哈希草图大小，中间n-gram数不超过它的短文本精确比较
+    "max_missing": 2,  # 短文本中较短记录最多缺失的n-gram数（一处插入造成的缺失）
+    "containment_threshold": 0.95,  # 长文本中较短记录被较长记录包含的最小比例
+    "min_coverage": 0.5,  # 较短记录至少覆盖较长记录的比例
+    "index_file": "data/processed/fingerprints.json"  # 指纹索引文件
+}
+
+# 实体消解配置
+RESOLVER_CONFIG = {
+    "ngram_size": 2,  # 机构名称字符n-gram长度
+    "similarity_threshold": 0.8,  # 机构名称合并的最小Jaccard相似度
+    "max_block_size": 200,  # 分块候选列表上限，超过时视为高频n-gram不参与比较
+    "registry_file": "data/processed/entities.json"  # 实体ID注册表文件
+}
+
+# 存储配置
+STORAGE_CONFIG = {
+    "db_path": "data/awards.db",  # SQLite数据库文件
+    "batch_size": 500  # 每批查询的参数个数
+}
+
+# 影响力评分配置
+IMPACT_CONFIG = {
+    "scheme": "default",  # 使用的权重方案
+    "weight_schemes": {
+        "default": {
+            "特等奖": 5,
+            "一等奖": 4,
+            "二等奖": 3,
+            "三等奖": 2,
+            "优秀奖": 1,
+            "提名奖": 0.5
+        },
+        "exponential": {
+            "特等奖": 16,
+            "一等奖": 8,
+            "二等奖": 4,
+            "三等奖": 2,
+            "优秀奖": 1,
+            "提名奖": 0.5
+        },
+        "count": {}  # 只统计获奖次数
+    },
+    "default_weight": 1,  # 未知等级的权重
+    "half_life": None,  # 时间衰减半衰期（年），为空时不衰减
+    "reference_year": None  # 衰减参照年份，为空时使用数据中的最大年份
+}
+
+# 合作网络分析配置
+NETWORK_CONFIG = {
+    "min_weight": 2,  # 绘图时合作边的最小权重
+    "mode": "auto",  # exact/approximate/auto，auto时按节点数选择
+    "exact_max_nodes": 2000,  # 精确计算的最大节点数
+    "betweenness_pivots": 200,  # 介数中心性抽样源点数
+    "closeness_samples": 100,  # 每个连通分量的接近中心性抽样源点数
+    "clustering_trials": 1000,  # 聚类系数抽样节点数
+    "top_k": 50,  # 中心性输出的节点数
+    "time_budget": 30,  # 近似计算的时间预算（秒）
+    "seed": 42  # 随机种子
+}
+
+# 分析任务调度配置
+ANALYSIS_CONFIG = {
+    "max_workers": 4,  # 并发执行分析的线程数，为1时串行执行
+    "process_workers": 2,  # 进程池任务的工作进程数
+    "network_process": False  # 是否在工作进程中计算网络指标（纯Python计算，受GIL限制；小网络时进程启动开销更大）
+}
+
+# 分析结果缓存配置
+CACHE_CONFIG = {
+    "enabled": True,  # 是否缓存分析结果
+    "max_entries": 128  # 最大缓存条数，按最近使用淘汰
+}
+
+# 增量统计配置
+INCREMENTAL_CONFIG = {
+    "state_file": "data/processed/incremental.pkl"  # 增量统计状态文件
+}
+
+# 文本分析配置
+TEXT_CONFIG = {
+    "dict_cache": "data/cache/jieba.cache",  # jieba前缀词典缓存文件
+    "token_cache": "data/cache/tokens.pkl",  # 项目名称分词结果缓存文件
+    "max_workers": 4,  # 并行分词进程数
+    "chunk_size": 2000,  # 每个分词任务的名称数
+    "parallel_threshold": 5000,  # 新名称达到该数量时并行分词
+    "keywords": 20,  # 关键词个数
+    "top_words": 50  # 输出的高频词个数
+}
+
+# 研究领域分析配置
+FIELD_CONFIG = {
+    "top_n": 20,  # 每个分组输出的关键词数
+    "min_length": 2,  # 关键词最小长度
+    "stop_words": ["研究", "应用", "技术", "及其", "关键技术", "基于"]  # 领域分析中忽略的通用词
+}
+
+# 全文检索配置
+SEARCH_CONFIG = {
+    "weights": {"name": 1.0, "organization": 0.5, "chars": 0.2},  # BM25中名称、机构、逐字字段的权重
+    "batch_size": 500,  # 每批重建索引的奖项数
+    "max_limit": 100  # 每页最大条数
+}
+
+# 名称补全配置
+PREFIX_CONFIG = {
+    "top_k": 10,  # 默认返回的补全个数
+    "max_top_k": 50,  # 返回的补全个数上限
+    "pinyin": False  # 是否支持拼音首字母补全（需要安装pypinyin）
+}
+
+# 地区分析配置
+REGION_CONFIG = {
+    "unknown": "未知",  # 机构名称为空时的地区
+    "unmatched": "其他"  # 地区词典中未匹配到的机构
+}
+
+# 列式缓存配置
+COLUMNAR_CONFIG = {
+    "dirname": "columns",  # 处理结果目录下的列式缓存子目录
+    "keep_versions": 2  # 重新写入后保留的版本数（含当前版本），供仍在读取旧版本的进程使用
+}
+
+# 分块统计配置
+CHUNKED_CONFIG = {
+    "chunk_size": 5000  # 每次从数据库读取的行数，决定分块统计的内存上限
+}
+
 # 输出配置
 OUTPUT_CONFIG = {
     "excel": {
@@ -0,0 +1,138 @@
+"""
+地区词典
+
+机构名称中出现的省份、城市、知名机构到省级行政区的映射，供地区分析使用。
+"""
+
+# 省级行政区：地区名 -> 名称中可能出现的写法（地区名本身总会参与匹配）
+PROVINCES = {
+    "北京": ["北京市"],
+    "天津": ["天津市"],
+    "上海": ["上海市"],
+    "重庆": ["重庆市"],
+    "河北": ["河北省"],
+    "山西": ["山西省"],
+    "辽宁": ["辽宁省"],
+    "吉林": ["吉林省"],
+    "黑龙江": ["黑龙江省"],
+    "江苏": ["江苏省"],
+    "浙江": ["浙江省"],
+    "安徽": ["安徽省"],
+    "福建": ["福建省"],
+    "江西": ["江西省"],
+    "山东": ["山东省"],
+    "河南": ["河南省"],
+    "湖北": ["湖北省"],
+    "湖南": ["湖南省"],
+    "广东": ["广东省"],
+    "海南": ["海南省"],
+    "四川": ["四川省"],
+    "贵州": ["贵州省"],
+    "云南": ["云南省"],
+    "陕西": ["陕西省"],
+    "甘肃": ["甘肃省"],
+    "青海": ["青海省"],
+    "台湾": ["台湾省"],
+    "内蒙古": ["内蒙古自治区"],
+    "广西": ["广西壮族自治区"],
+    "西藏": ["西藏自治区"],
+    "宁夏": ["宁夏回族自治区"],
+    "新疆": ["新疆维吾尔自治区", "新疆生产建设兵团"],
+    "香港": ["香港特别行政区"],
+    "澳门": ["澳门特别行政区"]
+}
+
+# 城市：省级行政区 -> 城市名（省会及主要地级市）
+CITIES = {
+    "河北": ["石家庄", "唐山", "秦皇岛", "邯郸", "邢台", "保定", "张家口", "承德", "沧州", "廊坊", "衡水"],
+    "山西": ["太原", "大同", "阳泉", "长治", "晋城", "朔州", "晋中", "运城", "忻州", "临汾", "吕梁"],
+    "辽宁": ["沈阳", "大连", "鞍山", "抚顺", "本溪", "丹东", "锦州", "营口", "阜新", "辽阳", "盘锦", "铁岭", "朝阳市", "葫芦岛"],
+    "吉林": ["长春", "四平", "辽源", "通化", "白山", "松原", "白城", "延边"],
+    "黑龙江": ["哈尔滨", "齐齐哈尔", "鸡西", "鹤岗", "双鸭山", "大庆", "伊春", "佳木斯", "七台河", "牡丹江", "黑河", "绥化", "大兴安岭"],
+    "江苏": ["南京", "无锡", "徐州", "常州", "苏州", "南通", "连云港", "淮安", "盐城", "扬州", "镇江", "泰州", "宿迁", "昆山", "江阴"],
+    "浙江": ["杭州", "宁波", "温州", "嘉兴", "湖州", "绍兴", "金华", "衢州", "舟山", "台州", "丽水", "义乌"],
+    "安徽": ["合肥", "芜湖", "蚌埠", "淮南", "马鞍山", "淮北", "铜陵", "安庆", "黄山", "滁州", "阜阳", "宿州", "六安", "亳州", "池州", "宣城"],
+    "福建": ["福州", "厦门", "莆田", "三明", "泉州", "漳州", "南平", "龙岩", "宁德"],
+    "江西": ["南昌", "景德镇", "萍乡", "九江", "新余", "鹰潭", "赣州", "吉安", "宜春", "抚州", "上饶"],
+    "山东": ["济南", "青岛", "淄博", "枣庄", "东营", "烟台", "潍坊", "济宁", "泰安", "威海", "日照", "临沂", "德州", "聊城", "滨州", "菏泽"],
+    "河南": ["郑州", "开封", "洛阳", "平顶山", "安阳", "鹤壁", "新乡", "焦作", "濮阳", "许昌", "漯河", "三门峡", "南阳", "商丘", "信阳", "周口", "驻马店"],
+    "湖北": ["武汉", "黄石", "十堰", "宜昌", "襄阳", "鄂州", "荆门", "孝感", "荆州", "黄冈", "咸宁", "随州", "恩施"],
+    "湖南": ["长沙", "株洲", "湘潭", "衡阳", "邵阳", "岳阳", "常德", "张家界", "益阳", "郴州", "永州", "怀化", "娄底", "湘西"],
+    "广东": ["广州", "深圳", "珠海", "汕头", "佛山", "韶关", "湛江", "肇庆", "江门", "茂名", "惠州", "梅州", "汕尾", "河源", "阳江", "清远", "东莞", "中山", "潮州", "揭阳", "云浮"],
+    "海南": ["海口", "三亚", "儋州"],
+    "四川": ["成都", "自贡", "攀枝花", "泸州", "德阳", "绵阳", "广元", "遂宁", "内江", "乐山", "南充", "眉山", "宜宾", "广安", "达州", "雅安", "巴中", "资阳"],
+    "贵州": ["贵阳", "六盘水", "遵义", "安顺", "毕节", "铜仁"],
+    "云南": ["昆明", "曲靖", "玉溪", "保山", "昭通", "丽江", "普洱", "临沧", "大理", "西双版纳"],
+    "陕西": ["西安", "铜川", "宝鸡", "咸阳", "渭南", "延安", "汉中", "榆林", "安康", "商洛", "杨凌"],
+    "甘肃": ["兰州", "嘉峪关", "金昌", "白银", "天水", "武威", "张掖", "平凉", "酒泉", "庆阳", "定西", "陇南"],
+    "青海": ["西宁", "海东", "格尔木"],
+    "内蒙古": ["呼和浩特", "包头", "乌海", "赤峰", "通辽", "鄂尔多斯", "呼伦贝尔", "巴彦淖尔", "乌兰察布"],
+    "广西": ["南宁", "柳州", "桂林", "梧州", "北海", "防城港", "钦州", "贵港", "玉林", "百色", "贺州", "河池", "来宾", "崇左"],
+    "西藏": ["拉萨", "日喀则", "林芝"],
+    "宁夏": ["银川", "石嘴山", "吴忠", "固原", "中卫"],
+    "新疆": ["乌鲁木齐", "克拉玛依", "吐鲁番", "哈密", "石河子", "喀什", "伊犁", "库尔勒", "阿克苏"]
+}
+
+# 名称中不含地名的知名机构：机构名（或其常用前缀） -> 省级行政区
+INSTITUTIONS = {
+    "清华大学": "北京",
+    "中国人民大学": "北京",
+    "中国农业大学": "北京",
+    "中国科学院大学": "北京",
+    "中国科学院院部": "北京",
+    "中国工程物理研究院": "四川",
+    "中国医学科学院": "北京",
+    "中国农业科学院": "北京",
+    "中国林业科学研究院": "北京",
+    "中国地质大学": "湖北",
+    "中国矿业大学": "江苏",
+    "中国石油大学": "山东",
+    "中国海洋大学": "山东",
+    "中国科学技术大学": "安徽",
+    "中国药科大学": "江苏",
+    "中国人民解放军总医院": "北京",
+    "解放军总医院": "北京",
+    "国防科技大学": "湖南",
+    "国防科学技术大学": "湖南",
+    "复旦大学": "上海",
+    "同济大学": "上海",
+    "华东师范大学": "上海",
+    "华东理工大学": "上海",
+    "东华大学": "上海",
+    "南开大学": "天津",
+    "东南大学": "江苏",
+    "河海大学": "江苏",
+    "东北大学": "辽宁",
+    "东北林业大学": "黑龙江",
+    "东北农业大学": "黑龙江",
+    "东北师范大学": "吉林",
+    "中山大学": "广东",
+    "华南理工大学": "广东",
+    "暨南大学": "广东",
+    "华中科技大学": "湖北",
+    "华中农业大学": "湖北",
+    "华中师范大学": "湖北",
+    "中南大学": "湖南",
+    "西南大学": "重庆",
+    "西南交通大学": "四川",
+    "电子科技大学": "四川",
+    "西北工业大学": "陕西",
+    "西北农林科技大学": "陕西",
+    "西北大学": "陕西",
+    "西安电子科技大学": "陕西",
+    "华为技术有限公司": "广东",
+    "中兴通讯": "广东",
+    "腾讯": "广东",
+    "比亚迪": "广东",
+    "阿里巴巴": "浙江",
+    "宝山钢铁": "上海",
+    "宝钢": "上海",
+    "鞍钢": "辽宁",
+    "首钢": "北京",
+    "海尔": "山东",
+    "潍柴": "山东",
+    "格力": "广东",
+    "美的集团": "广东",
+    "中国商用飞机": "上海",
+    "中国商飞": "上海"
+}
\ No newline at end of file
@@ -5,14 +5,33 @@
 1. 数据清洗
 2. 数据验证
 3. 数据转换
+4. 数据类型模式
+5. 批量向量化清洗
+6. 并行分块清洗
+7. 近似重复数据去除
+8. 机构与获奖人实体消解
+9. 整数键关联与分组索引
 """
 
 from .cleaner import DataCleaner
 from .validator import DataValidator
 from .transformer import DataTransformer
+from .schema import DataSchema
+from .vectorized import VectorizedCleaner
+from .parallel import ParallelCleaner
+from .dedup import DuplicateDetector
+from .resolver import EntityResolver
+from .relations import GroupIndex, add_relation_keys
 
 __all__ = [
     'DataCleaner',
     'DataValidator',
-    'DataTransformer'
+    'DataTransformer',
+    'DataSchema',
+    'VectorizedCleaner',
+    'ParallelCleaner',
+    'DuplicateDetector',
+    'EntityResolver',
+    'GroupIndex',
+    'add_relation_keys'
 ] 
\ No newline at end of file
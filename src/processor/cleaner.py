@@ -6,15 +6,30 @@ from loguru import logger
 
 from config.config import MIN_TEXT_LENGTH, MAX_TEXT_LENGTH
 
+# 预编译的清洗正则，逐条清洗和批量清洗共用
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+TEXT_SPECIAL_PATTERN = re.compile(r'[^\w\s\u4e00-\u9fff，。：；！？、（）《》【】""'']+')
+URL_SPECIAL_PATTERN = re.compile(r'[<>"\']+')
+URL_SCHEME_PATTERN = re.compile(r'^https?://')
+NAME_SPECIAL_PATTERN = re.compile(r'[^\w\s\u4e00-\u9fff]+')
+NON_LATIN1_PATTERN = re.compile(r'[^\x00-\xff]')
+
 class DataCleaner:
     """数据清洗类"""
     
-    def clean_file(self, filepath: str) -> List[Dict[str, Any]]:
+    def __init__(self):
+        """初始化数据清洗器"""
+        # 编码修复统计：检查的字符串字段数和实际修复的字段数
+        self.encoding_stats = {'checked': 0, 'repaired': 0}
+    
+    def clean_file(self, filepath: str, vectorized: bool = False) -> List[Dict[str, Any]]:
         """
         清理文件数据
         
         Args:
             filepath: 文件路径
+            vectorized: 是否使用批量向量化清洗
             
         Returns:
             清理后的数据列表
@@ -30,38 +45,94 @@ class DataCleaner:
                 logger.error(f"文件格式错误，应为JSON数组: {filepath}")
                 return []
             
-            # 处理搜索结果数据
-            cleaned_data = []
-            for item in data:
-                # 尝试修复编码问题
-                fixed_item = self._fix_encoding(item)
-                
-                # 构建基本数据结构
-                cleaned_item = {
-                    'title': fixed_item.get('title', ''),
-                    'content': fixed_item.get('description', ''),
-                    'year': self._extract_year(fixed_item),
-                    'award_level': self._extract_award_level(fixed_item),
-                    'award_type': self._extract_award_type(fixed_item),
-                    'source_url': fixed_item.get('url', ''),
-                    'source_title': fixed_item.get('title', ''),
-                    'source_engine': 'search',
-                    'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'projects': self._extract_projects(fixed_item)
-                }
-                
-                # 清理数据
-                cleaned_result = self.clean_award_data(cleaned_item)
-                if cleaned_result:
-                    cleaned_data.append(cleaned_result)
+            cleaned_data = self.clean_records(data, vectorized=vectorized)
             
-            logger.info(f"文件清理完成，共处理 {len(data)} 条数据，有效数据 {len(cleaned_data)} 条")
+            logger.info(
+                f"文件清理完成，共处理 {len(data)} 条数据，有效数据 {len(cleaned_data)} 条，"
+                f"修复编码 {self.encoding_stats['repaired']} 个字段"
+            )
             return cleaned_data
             
         except Exception as e:
             logger.error(f"清理文件失败: {str(e)}")
             return []
     
+    def clean_records(self, data: List[Dict[str, Any]], vectorized: bool = False) -> List[Dict[str, Any]]:
+        """
+        清理原始搜索结果列表
+        
+        Args:
+            data: 原始数据列表
+            vectorized: 是否使用批量向量化清洗
+            
+        Returns:
+            清理后的数据列表
+        """
+        if vectorized:
+            from .vectorized import VectorizedCleaner
+            
+            # 按列批量修复编码后再构建基本数据结构
+            fixed_data = VectorizedCleaner.fix_encoding_batch(data, self.encoding_stats)
+            items = [self.build_award_item(item, fix_encoding=False) for item in fixed_data]
+            return VectorizedCleaner().clean_award_batch(items)
+        
+        # 构建基本数据结构
+        items = [self.build_award_item(item) for item in data]
+        
+        # 逐条清理数据
+        cleaned_data = []
+        for item in items:
+            cleaned_result = self.clean_award_data(item)
+            if cleaned_result:
+                cleaned_data.append(cleaned_result)
+        return cleaned_data
+    
+    def clean_records_frames(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        批量清理原始搜索结果列表并直接输出扁平表
+        
+        与 DataTransformer.to_dataframe(clean_records(data, vectorized=True)) 的结果相同，
+        清洗后不再构建嵌套字典。
+        
+        Args:
+            data: 原始数据列表
+            
+        Returns:
+            包含awards/projects/winners三个DataFrame的字典
+        """
+        from .vectorized import VectorizedCleaner
+        
+        fixed_data = VectorizedCleaner.fix_encoding_batch(data, self.encoding_stats)
+        items = [self.build_award_item(item, fix_encoding=False) for item in fixed_data]
+        return VectorizedCleaner().clean_frames(items)
+    
+    def build_award_item(self, item: Dict[str, Any], fix_encoding: bool = True) -> Dict[str, Any]:
+        """
+        将原始搜索结果构建为待清理的奖项数据
+        
+        Args:
+            item: 原始数据项
+            fix_encoding: 是否修复编码问题，已批量修复过的数据应传入False
+            
+        Returns:
+            待清理的奖项数据
+        """
+        # 尝试修复编码问题
+        fixed_item = self._fix_encoding(item) if fix_encoding else item
+        
+        return {
+            'title': fixed_item.get('title', ''),
+            'content': fixed_item.get('description', ''),
+            'year': self._extract_year(fixed_item),
+            'award_level': self._extract_award_level(fixed_item),
+            'award_type': self._extract_award_type(fixed_item),
+            'source_url': fixed_item.get('url', ''),
+            'source_title': fixed_item.get('title', ''),
+            'source_engine': 'search',
+            'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'projects': self._extract_projects(fixed_item)
+        }
+    
     def _fix_encoding(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """
         修复编码问题
@@ -73,18 +144,51 @@ class DataCleaner:
             修复编码后的数据项
         """
         fixed_item = {}
+        stats = self.encoding_stats
         for key, value in item.items():
             if isinstance(value, str):
-                try:
-                    # 尝试修复编码问题
-                    fixed_value = value.encode('latin1').decode('utf-8')
-                except Exception:
-                    fixed_value = value
-                fixed_item[key] = fixed_value
-            else:
-                fixed_item[key] = value
+                stats['checked'] += 1
+                repaired = self.repair_mojibake(value)
+                if repaired is not None:
+                    value = repaired
+                    stats['repaired'] += 1
+            fixed_item[key] = value
         return fixed_item
     
+    @staticmethod
+    def is_mojibake_candidate(value: str) -> bool:
+        """
+        判断字符串是否可能是被按latin-1误解码的UTF-8文本
+        
+        纯ASCII字符串修复前后不变，含有latin-1范围以外字符的字符串无法按
+        latin-1重新编码，这两类都无需尝试修复。
+        
+        Args:
+            value: 字符串
+            
+        Returns:
+            是否需要尝试修复
+        """
+        return not value.isascii() and NON_LATIN1_PATTERN.search(value) is None
+    
+    @classmethod
+    def repair_mojibake(cls, value: str) -> Optional[str]:
+        """
+        修复乱码字符串
+        
+        Args:
+            value: 字符串
+            
+        Returns:
+            修复后的字符串，无需修复或无法修复时返回None
+        """
+        if not cls.is_mojibake_candidate(value):
+            return None
+        try:
+            return value.encode('latin1').decode('utf-8')
+        except UnicodeDecodeError:
+            return None
+    
     def _extract_year(self, item: Dict[str, Any]) -> Optional[int]:
         """
         提取年份
@@ -202,13 +306,13 @@ class DataCleaner:
             return ""
         
         # 移除HTML标签
-        text = re.sub(r'<[^>]+>', '', text)
+        text = HTML_TAG_PATTERN.sub('', text)
         
         # 移除多余的空白字符
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_PATTERN.sub(' ', text)
         
         # 移除特殊字符
-        text = re.sub(r'[^\w\s\u4e00-\u9fff，。：；！？、（）《》【】""'']+', '', text)
+        text = TEXT_SPECIAL_PATTERN.sub('', text)
         
         return text.strip()
     
@@ -227,10 +331,10 @@ class DataCleaner:
             return None
         
         # 移除URL中的特殊字符
-        url = re.sub(r'[<>"\']+', '', url)
+        url = URL_SPECIAL_PATTERN.sub('', url)
         
         # 验证URL格式
-        if not re.match(r'^https?://', url):
+        if not URL_SCHEME_PATTERN.match(url):
             return None
         
         return url.strip()
@@ -283,7 +387,7 @@ class DataCleaner:
             return None
         
         # 移除特殊字符
-        name = re.sub(r'[^\w\s\u4e00-\u9fff]+', '', name)
+        name = NAME_SPECIAL_PATTERN.sub('', name)
         name = name.strip()
         
         # 验证长度
@@ -307,7 +411,7 @@ class DataCleaner:
             return None
         
         # 移除特殊字符
-        org = re.sub(r'[^\w\s\u4e00-\u9fff]+', '', org)
+        org = NAME_SPECIAL_PATTERN.sub('', org)
         org = org.strip()
         
         # 验证长度
@@ -0,0 +1,363 @@
+import os
+import re
+import json
+import base64
+from typing import Dict, Any, List, Optional
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from config.config import DEDUP_CONFIG
+
+# 计算指纹前移除的字符（空白和标点）
+NORMALIZE_PATTERN = re.compile(r'[\W_]+')
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """splitmix64终结函数，使哈希值各位分布均匀"""
+    with np.errstate(over='ignore'):
+        values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+def _encode(array: np.ndarray) -> str:
+    """将uint32数组编码为base64字符串"""
+    return base64.b64encode(array.astype('<u4').tobytes()).decode('ascii')
+
+def _decode(text: str) -> np.ndarray:
+    """将base64字符串解码为uint32数组"""
+    return np.frombuffer(base64.b64decode(text), dtype='<u4').astype(np.uint32)
+
+class DuplicateDetector:
+    """近似重复数据检测类
+
+    对 title+content 的字符n-gram集合计算两种指纹：
+    - MinHash签名：按 LSH 分段建立索引，只比较至少一段完全相同的候选，整体接近线性时间
+    - 最小哈希草图：中间n-gram哈希中最小的 sketch_size 个，短文本的草图就是完整的中间n-gram集合
+
+    候选按“较短记录的n-gram有多少出现在较长记录中”判定：转载、镜像通常是在原文前后
+    追加来源、在标题后插入站点名或截断正文，较短记录的n-gram几乎全部保留；而奖项等级、
+    年份、机构等字词的替换会使较短记录失去至少 shingle_size 个n-gram。
+    文本首尾补齐边界符，首尾的n-gram单独保存：
+    - 短文本（草图即完整的n-gram集合）精确比较：只缺失首尾n-gram（前后追加、截断），
+      或总共缺失不超过 max_missing 个（一处插入）时视为重复
+    - 长文本按估计的包含度判定
+    每个重复簇保留最先出现的记录作为规范记录，规范记录的指纹可持久化，
+    新采集的数据可增量地与历史数据去重。
+    """
+
+    def __init__(self, index_file: Optional[str] = None, shingle_size: Optional[int] = None,
+                 num_perm: Optional[int] = None, band_rows: Optional[int] = None):
+        """
+        初始化去重器
+
+        Args:
+            index_file: 指纹索引文件路径，默认读取 DEDUP_CONFIG
+            shingle_size: 字符n-gram长度，默认读取 DEDUP_CONFIG
+            num_perm: MinHash签名长度，默认读取 DEDUP_CONFIG
+            band_rows: LSH每段的签名行数，默认读取 DEDUP_CONFIG
+        """
+        self.index_file = index_file or DEDUP_CONFIG.get('index_file')
+        self.shingle_size = shingle_size or DEDUP_CONFIG.get('shingle_size', 3)
+        self.num_perm = num_perm or DEDUP_CONFIG.get('num_perm', 64)
+        self.band_rows = band_rows or DEDUP_CONFIG.get('band_rows', 4)
+        self.sketch_size = DEDUP_CONFIG.get('sketch_size', 256)
+        self.max_missing = DEDUP_CONFIG.get('max_missing', 2)
+        self.containment_threshold = DEDUP_CONFIG.get('containment_threshold', 0.95)
+        self.min_coverage = DEDUP_CONFIG.get('min_coverage', 0.5)
+
+        # MinHash的各个哈希函数由固定种子生成，保证历史索引可复用
+        self._seeds = _mix(np.arange(1, self.num_perm + 1, dtype=np.uint64))
+        self.band_count = self.num_perm // self.band_rows
+
+        # 规范记录索引
+        self.entries: List[Dict[str, Any]] = []
+        self._bands: List[Dict[bytes, List[int]]] = [{} for _ in range(self.band_count)]
+        self._urls: Dict[str, int] = {}
+
+        self.stats = {'total': 0, 'duplicates': 0}
+
+    def fingerprint(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        计算文本的指纹
+
+        Args:
+            text: 文本
+
+        Returns:
+            指纹字典（signature: MinHash签名, sketch: 中间n-gram的最小哈希草图, edges: 首尾n-gram, size: n-gram数），
+            文本为空时返回None
+        """
+        text = NORMALIZE_PATTERN.sub('', (text or '').lower())
+        if not text:
+            return None
+
+        # 首尾各补 shingle_size-1 个边界符（码点0，规范化后的文本中不会出现），
+        # 以码点序列计算每个n-gram的多项式哈希，再混合各位
+        n = self.shingle_size
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+        codes = np.concatenate([np.zeros(n - 1, dtype=np.uint64), codes, np.zeros(n - 1, dtype=np.uint64)])
+        with np.errstate(over='ignore'):
+            hashes = np.zeros(len(codes) - n + 1, dtype=np.uint64)
+            for j in range(n):
+                hashes = hashes * np.uint64(0x100000001B3) + codes[j:len(codes) - n + 1 + j]
+        hashes = _mix(hashes)
+
+        # 取高32位：草图为中间n-gram中最小的 sketch_size 个，签名为全部n-gram在各哈希函数下的最小值
+        short = (hashes >> np.uint64(32)).astype(np.uint32)
+        edges = np.unique(np.concatenate([short[:n - 1], short[-(n - 1):]]))
+        sketch = np.setdiff1d(short[n - 1:len(short) - n + 1], edges)
+        unique = np.unique(hashes)
+        signature = (_mix(unique[:, None] ^ self._seeds[None, :]).min(axis=0) >> np.uint64(32)).astype(np.uint32)
+        return {
+            'signature': signature,
+            'sketch': sketch[:self.sketch_size],
+            'edges': edges,
+            'size': len(sketch) + len(edges)
+        }
+
+    def record_fingerprint(self, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        计算奖项记录的指纹
+
+        Args:
+            record: 清理后的奖项数据
+
+        Returns:
+            指纹字典
+        """
+        return self.fingerprint(f"{record.get('title') or ''} {record.get('content') or ''}")
+
+    def is_duplicate(self, a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+        """
+        判断两个指纹是否为近似重复
+
+        Args:
+            a: 指纹字典
+            b: 指纹字典
+
+        Returns:
+            是否近似重复
+        """
+        small, large = sorted((a['size'], b['size']))
+        exact = all(x['size'] - len(x['edges']) <= self.sketch_size for x in (a, b))
+        if exact:
+            # 草图即完整的中间n-gram集合，首尾n-gram只与首尾n-gram相同
+            inner = len(np.intersect1d(a['sketch'], b['sketch'], assume_unique=True))
+            shared = inner + len(np.intersect1d(a['edges'], b['edges'], assume_unique=True))
+            smaller = a if (a['size'], len(a['sketch'])) <= (b['size'], len(b['sketch'])) else b
+        else:
+            # 并集中最小的 sketch_size 个哈希里两侧共有的比例即为Jaccard相似度的估计
+            union = np.union1d(a['sketch'], b['sketch'])[:self.sketch_size]
+            both = np.isin(union, a['sketch'], assume_unique=True) & np.isin(union, b['sketch'], assume_unique=True)
+            jaccard = both.mean()
+            shared = jaccard * (a['size'] + b['size']) / (1 + jaccard)
+
+        # 较短记录至少覆盖较长记录的一部分，避免短语被当作长文的重复
+        if shared < self.min_coverage * large:
+            return False
+        if exact:
+            return inner == len(smaller['sketch']) or small - shared <= self.max_missing
+        return shared >= self.containment_threshold * small
+
+    def find_duplicate(self, fingerprint: Dict[str, Any]) -> Optional[int]:
+        """
+        在索引中查找近似重复的规范记录
+
+        Args:
+            fingerprint: 指纹字典
+
+        Returns:
+            匹配的规范记录下标，没有时返回None
+        """
+        seen = set()
+        for band, key in zip(self._bands, self._band_keys(fingerprint['signature'])):
+            for idx in band.get(key, []):
+                if idx in seen:
+                    continue
+                seen.add(idx)
+                if self.is_duplicate(fingerprint, self.entries[idx]):
+                    return idx
+        return None
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        """签名按 band_rows 行一段切分后的索引键"""
+        return [
+            signature[i * self.band_rows:(i + 1) * self.band_rows].tobytes()
+            for i in range(self.band_count)
+        ]
+
+    def deduplicate(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        去除近似重复的奖项数据
+
+        与历史索引中同一URL的记录视为同一条数据（重复处理同一文件），不会被去除。
+
+        Args:
+            data: 清理后的奖项数据列表
+
+        Returns:
+            去重后的奖项数据列表
+        """
+        try:
+            unique_data = [record for record in data if self._keep(record)]
+            logger.info(f"去重完成，共 {len(data)} 条数据，保留 {len(unique_data)} 条")
+            return unique_data
+
+        except Exception as e:
+            logger.error(f"去重失败: {str(e)}")
+            return data
+
+    def deduplicate_frames(self, data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """
+        去除扁平表中近似重复的奖项，及其项目和获奖人
+
+        判定规则与 deduplicate 相同，只读取奖项表的标题、正文和来源URL。
+
+        Args:
+            data: 包含awards/projects/winners的DataFrame字典
+
+        Returns:
+            去重后的DataFrame字典
+        """
+        try:
+            awards_df = data.get('awards', pd.DataFrame())
+            if awards_df.empty:
+                return data
+
+            columns = [c for c in ('title', 'content', 'source_url') if c in awards_df.columns]
+            records = awards_df[columns].astype(object).where(awards_df[columns].notna(), None).to_dict('records')
+            keep = np.array([self._keep(record) for record in records], dtype=bool)
+            logger.info(f"去重完成，共 {len(keep)} 条数据，保留 {int(keep.sum())} 条")
+            if keep.all():
+                return data
+
+            result = dict(data)
+            result['awards'] = awards_df[keep].reset_index(drop=True)
+            projects_df = data.get('projects', pd.DataFrame())
+            if 'award_id' in projects_df.columns and 'award_id' in awards_df.columns:
+                projects_df = projects_df[projects_df['award_id'].isin(awards_df.loc[keep, 'award_id'])]
+                result['projects'] = projects_df.reset_index(drop=True)
+            winners_df = data.get('winners', pd.DataFrame())
+            if 'project_id' in winners_df.columns and 'project_id' in projects_df.columns:
+                winners_df = winners_df[winners_df['project_id'].isin(projects_df['project_id'])]
+                result['winners'] = winners_df.reset_index(drop=True)
+            return result
+
+        except Exception as e:
+            logger.error(f"去重失败: {str(e)}")
+            return data
+
+    def _keep(self, record: Dict[str, Any]) -> bool:
+        """判断一条奖项是否保留，保留的新奖项加入索引"""
+        self.stats['total'] += 1
+        url = record.get('source_url')
+
+        # URL相同的记录直接判定为同一条
+        if url and url in self._urls:
+            entry = self.entries[self._urls[url]]
+            if entry.get('batch'):
+                self.stats['duplicates'] += 1
+                return False
+            entry['batch'] = True
+            return True
+
+        fingerprint = self.record_fingerprint(record)
+        if fingerprint is None:
+            return True
+
+        match = self.find_duplicate(fingerprint)
+        if match is not None:
+            self.stats['duplicates'] += 1
+            logger.debug(f"近似重复: {url} -> {self.entries[match].get('source_url')}")
+            return False
+
+        self._add_entry({
+            **fingerprint,
+            'source_url': url,
+            'title': record.get('title'),
+            'batch': True
+        })
+        return True
+
+    def load_index(self, index_file: Optional[str] = None) -> None:
+        """
+        加载历史指纹索引
+
+        Args:
+            index_file: 索引文件路径，默认使用初始化时的路径
+        """
+        index_file = index_file or self.index_file
+        try:
+            if not index_file or not os.path.exists(index_file):
+                return
+
+            with open(index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+
+            if (index.get('shingle_size') != self.shingle_size
+                    or index.get('num_perm') != self.num_perm
+                    or index.get('sketch_size') != self.sketch_size):
+                logger.warning(f"指纹索引参数与当前配置不一致，忽略历史索引: {index_file}")
+                return
+
+            for entry in index.get('entries', []):
+                self._add_entry({
+                    'signature': _decode(entry['signature']),
+                    'sketch': _decode(entry['sketch']),
+                    'edges': _decode(entry['edges']),
+                    'size': entry['size'],
+                    'source_url': entry.get('source_url'),
+                    'title': entry.get('title')
+                })
+
+            logger.info(f"加载指纹索引: {index_file}，共 {len(self.entries)} 条")
+
+        except Exception as e:
+            logger.error(f"加载指纹索引失败: {str(e)}")
+
+    def save_index(self, index_file: Optional[str] = None) -> None:
+        """
+        保存指纹索引
+
+        Args:
+            index_file: 索引文件路径，默认使用初始化时的路径
+        """
+        index_file = index_file or self.index_file
+        try:
+            directory = os.path.dirname(index_file)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            index = {
+                'shingle_size': self.shingle_size,
+                'num_perm': self.num_perm,
+                'sketch_size': self.sketch_size,
+                'entries': [
+                    {
+                        'signature': _encode(entry['signature']),
+                        'sketch': _encode(entry['sketch']),
+                        'edges': _encode(entry['edges']),
+                        'size': entry['size'],
+                        'source_url': entry.get('source_url'),
+                        'title': entry.get('title')
+                    }
+                    for entry in self.entries
+                ]
+            }
+
+            with open(index_file, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False)
+
+            logger.info(f"指纹索引已保存到: {index_file}")
+
+        except Exception as e:
+            logger.error(f"保存指纹索引失败: {str(e)}")
+
+    def _add_entry(self, entry: Dict[str, Any]) -> None:
+        """将规范记录加入索引"""
+        idx = len(self.entries)
+        self.entries.append(entry)
+        for band, key in zip(self._bands, self._band_keys(entry['signature'])):
+            band.setdefault(key, []).append(idx)
+        if entry.get('source_url'):
+            self._urls.setdefault(entry['source_url'], idx)
\ No newline at end of file
@@ -0,0 +1,286 @@
+import json
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from itertools import islice
+from typing import Dict, Any, List, Iterable, Iterator, Optional, Tuple, Callable
+import pandas as pd
+from loguru import logger
+
+from config.config import PROCESSOR_CONFIG
+from .cleaner import DataCleaner
+from .transformer import DataTransformer
+
+def _clean_chunk(chunk: List[Dict[str, Any]], vectorized: bool) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    在工作进程中清理一个数据块
+
+    Args:
+        chunk: 原始数据块
+        vectorized: 是否使用批量向量化清洗
+
+    Returns:
+        (清理后的数据列表, 编码修复统计)
+    """
+    cleaner = DataCleaner()
+    cleaned = cleaner.clean_records(chunk, vectorized=vectorized)
+    return cleaned, cleaner.encoding_stats
+
+def _clean_chunk_frames(chunk: List[Dict[str, Any]]) -> Tuple[Dict[str, pd.DataFrame], Dict[str, int]]:
+    """
+    在工作进程中批量清理一个数据块并输出扁平表
+
+    Args:
+        chunk: 原始数据块
+
+    Returns:
+        (DataFrame字典, 编码修复统计)
+    """
+    cleaner = DataCleaner()
+    frames = cleaner.clean_records_frames(chunk)
+    return frames, cleaner.encoding_stats
+
+class ParallelCleaner:
+    """并行分块数据清洗类
+
+    按 PROCESSOR_CONFIG 中的 batch_size 将原始数据切分为数据块，
+    在 max_workers 个进程中并行清洗，并按原始顺序合并结果。
+    """
+
+    def __init__(self, batch_size: Optional[int] = None, max_workers: Optional[int] = None,
+                 vectorized: bool = False):
+        """
+        初始化并行清洗器
+
+        Args:
+            batch_size: 数据块大小，默认读取 PROCESSOR_CONFIG
+            max_workers: 工作进程数，默认读取 PROCESSOR_CONFIG
+            vectorized: 数据块内是否使用批量向量化清洗
+        """
+        self.batch_size = max(1, batch_size or PROCESSOR_CONFIG.get('batch_size', 100))
+        self.max_workers = max(1, max_workers or PROCESSOR_CONFIG.get('max_workers', 4))
+        self.vectorized = vectorized
+        
+        # 各数据块汇总的编码修复统计
+        self.encoding_stats = {'checked': 0, 'repaired': 0}
+
+    def clean_file(self, filepath: str) -> List[Dict[str, Any]]:
+        """
+        并行清理JSON数组文件
+
+        Args:
+            filepath: 文件路径
+
+        Returns:
+            清理后的数据列表
+        """
+        try:
+            logger.info(f"开始并行清理文件: {filepath}")
+
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if not isinstance(data, list):
+                logger.error(f"文件格式错误，应为JSON数组: {filepath}")
+                return []
+
+            cleaned_data = self.clean_records(data)
+
+            logger.info(
+                f"文件清理完成，共处理 {len(data)} 条数据，有效数据 {len(cleaned_data)} 条，"
+                f"修复编码 {self.encoding_stats['repaired']} 个字段"
+            )
+            return cleaned_data
+
+        except Exception as e:
+            logger.error(f"并行清理文件失败: {str(e)}")
+            return []
+
+    def clean_records(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        并行清理原始数据列表
+
+        Args:
+            data: 原始数据列表
+
+        Returns:
+            清理后的数据列表，顺序与输入一致
+        """
+        return list(self.iter_clean(data))
+
+    def iter_clean(self, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        流式并行清理数据
+
+        同时处理中的数据块数量有上限，内存占用与输入总量无关。
+
+        Args:
+            records: 原始数据迭代器
+
+        Yields:
+            清理后的数据，顺序与输入一致
+        """
+        for result in self._map_chunks(records, _clean_chunk, self.vectorized):
+            yield from self._collect(result)
+
+    def clean_file_frames(self, filepath: str) -> Dict[str, pd.DataFrame]:
+        """
+        并行批量清理JSON数组文件并直接输出扁平表
+
+        Args:
+            filepath: 文件路径
+
+        Returns:
+            包含awards/projects/winners三个DataFrame的字典
+        """
+        try:
+            logger.info(f"开始并行清理文件: {filepath}")
+
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if not isinstance(data, list):
+                logger.error(f"文件格式错误，应为JSON数组: {filepath}")
+                return DataTransformer.to_dataframe([])
+
+            frames = self.clean_frames(data)
+
+            logger.info(
+                f"文件清理完成，共处理 {len(data)} 条数据，有效数据 {len(frames['awards'])} 条，"
+                f"修复编码 {self.encoding_stats['repaired']} 个字段"
+            )
+            return frames
+
+        except Exception as e:
+            logger.error(f"并行清理文件失败: {str(e)}")
+            return DataTransformer.to_dataframe([])
+
+    def clean_frames(self, data: List[Dict[str, Any]]) -> Dict[str, pd.DataFrame]:
+        """
+        并行批量清理原始数据列表并直接输出扁平表
+
+        各数据块在工作进程中清理为扁平表，按原始顺序合并，整数键依次偏移，
+        结果与 DataTransformer.to_dataframe(clean_records(data)) 相同。
+
+        Args:
+            data: 原始数据列表
+
+        Returns:
+            包含awards/projects/winners三个DataFrame的字典
+        """
+        frames = [self._collect(result) for result in self._map_chunks(data, _clean_chunk_frames)]
+        if not frames:
+            return DataTransformer.to_dataframe([])
+        return frames[0] if len(frames) == 1 else DataTransformer.merge_dataframes(frames)
+
+    def _map_chunks(self, records: Iterable[Dict[str, Any]], func: Callable, *args) -> Iterator[Any]:
+        """
+        在工作进程中依次处理各数据块
+
+        Args:
+            records: 原始数据迭代器
+            func: 数据块处理函数，需可被子进程导入
+            *args: 处理函数的其余参数
+
+        Yields:
+            各数据块的处理结果，顺序与输入一致
+        """
+        chunks = self._iter_chunks(records)
+
+        # 只有一个工作进程时直接在当前进程中清理
+        if self.max_workers == 1:
+            for chunk in chunks:
+                yield func(chunk, *args)
+            return
+
+        first = next(chunks, None)
+        if first is None:
+            return
+        second = next(chunks, None)
+        if second is None:
+            yield func(first, *args)
+            return
+
+        max_pending = self.max_workers * 2
+        pending: deque = deque()
+
+        # 清理在Web请求线程中调用，fork会复制其他线程持有的锁，工作进程改为spawn启动
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            def submit(chunk: List[Dict[str, Any]]) -> Future:
+                return executor.submit(func, chunk, *args)
+
+            pending.append(submit(first))
+            pending.append(submit(second))
+
+            for chunk in chunks:
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+                pending.append(submit(chunk))
+
+            while pending:
+                yield pending.popleft().result()
+
+    def _collect(self, result: Tuple[Any, Dict[str, int]]) -> Any:
+        """汇总数据块的编码修复统计并返回清理结果"""
+        cleaned, stats = result
+        for key, value in stats.items():
+            self.encoding_stats[key] = self.encoding_stats.get(key, 0) + value
+        return cleaned
+
+    def clean_jsonl(self, input_path: str, output_path: str) -> int:
+        """
+        流式并行清理JSONL文件，逐行写出清理结果
+
+        Args:
+            input_path: 输入JSONL文件路径
+            output_path: 输出JSONL文件路径
+
+        Returns:
+            写出的有效数据条数
+        """
+        try:
+            logger.info(f"开始流式清理JSONL文件: {input_path}")
+
+            count = 0
+            with open(output_path, 'w', encoding='utf-8') as f:
+                for item in self.iter_clean(self.read_jsonl(input_path)):
+                    f.write(json.dumps(item, ensure_ascii=False) + '\n')
+                    count += 1
+
+            logger.info(f"JSONL文件清理完成，有效数据 {count} 条，已保存到 {output_path}")
+            return count
+
+        except Exception as e:
+            logger.error(f"流式清理JSONL文件失败: {str(e)}")
+            return 0
+
+    @staticmethod
+    def read_jsonl(filepath: str) -> Iterator[Dict[str, Any]]:
+        """
+        逐行读取JSONL文件
+
+        Args:
+            filepath: 文件路径
+
+        Yields:
+            每行解析得到的数据，空行和无法解析的行会被跳过
+        """
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"跳过无法解析的第{line_no}行: {str(e)}")
+
+    def _iter_chunks(self, records: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        """按 batch_size 切分数据块"""
+        iterator = iter(records)
+        while True:
+            chunk = list(islice(iterator, self.batch_size))
+            if not chunk:
+                return
+            yield chunk
\ No newline at end of file
@@ -0,0 +1,127 @@
+from typing import Dict, Any, Optional
+import numpy as np
+import pandas as pd
+
+class GroupIndex:
+    """CSR分组索引
+
+    记录父表每一行对应的子表行号：父表第 i 行的子行为
+    rows[offsets[i]:offsets[i + 1]]，查询为O(1)切片，无需按名称过滤整张子表。
+    """
+
+    def __init__(self, offsets: np.ndarray, rows: np.ndarray, parents: np.ndarray):
+        """
+        初始化分组索引
+
+        Args:
+            offsets: 长度为父表行数+1的偏移数组
+            rows: 按父行分组排列的子表行号
+            parents: 子表每一行对应的父表行号，没有父行时为-1
+        """
+        self.offsets = offsets
+        self.rows = rows
+        self.parents = parents
+
+    @classmethod
+    def build(cls, parent_keys: Any, child_keys: Any) -> 'GroupIndex':
+        """
+        根据父表主键和子表外键构建索引
+
+        Args:
+            parent_keys: 父表主键（取值唯一）
+            child_keys: 子表外键
+
+        Returns:
+            分组索引
+        """
+        parent_keys = pd.Index(parent_keys)
+        parents = parent_keys.get_indexer(pd.Index(child_keys)).astype(np.int64)
+
+        linked = np.flatnonzero(parents >= 0)
+        order = np.argsort(parents[linked], kind='stable')
+        counts = np.bincount(parents[linked], minlength=len(parent_keys))
+
+        offsets = np.zeros(len(parent_keys) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(offsets, linked[order], parents)
+
+    @classmethod
+    def from_frames(cls, parent_df: pd.DataFrame, child_df: pd.DataFrame, key: str) -> Optional['GroupIndex']:
+        """
+        根据DataFrame的主键/外键列构建索引
+
+        Args:
+            parent_df: 父表，key列为主键
+            child_df: 子表，key列为外键
+            key: 键列名（award_id/project_id）
+
+        Returns:
+            分组索引，缺少键列时返回None
+        """
+        if key not in parent_df.columns or key not in child_df.columns:
+            return None
+        return cls.build(parent_df[key], child_df[key])
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def group(self, position: int) -> np.ndarray:
+        """
+        获取父表某一行的子表行号
+
+        Args:
+            position: 父表行号
+
+        Returns:
+            子表行号数组
+        """
+        return self.rows[self.offsets[position]:self.offsets[position + 1]]
+
+    def sizes(self) -> np.ndarray:
+        """
+        获取父表每一行的子行数
+
+        Returns:
+            子行数数组
+        """
+        return np.diff(self.offsets)
+
+def add_relation_keys(data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """
+    为缺少整数键的数据补充 award_id/project_id
+
+    用于旧版本导出的数据文件：项目按 award_title 关联到同名的第一个奖项，
+    获奖人按 project_name 关联到同名的第一个项目，与原先按名称过滤的结果一致。
+
+    Args:
+        data: 包含多个DataFrame的字典
+
+    Returns:
+        补充整数键后的DataFrame字典
+    """
+    result = dict(data)
+    awards_df = data.get('awards', pd.DataFrame())
+    projects_df = data.get('projects', pd.DataFrame())
+    winners_df = data.get('winners', pd.DataFrame())
+
+    if not awards_df.empty and 'award_id' not in awards_df.columns:
+        awards_df = awards_df.assign(award_id=np.arange(len(awards_df), dtype=np.int64))
+        result['awards'] = awards_df
+
+    if not projects_df.empty and 'project_id' not in projects_df.columns:
+        projects_df = projects_df.assign(project_id=np.arange(len(projects_df), dtype=np.int64))
+        if ('award_id' not in projects_df.columns and 'award_title' in projects_df.columns
+                and 'title' in awards_df.columns):
+            first_award = awards_df.drop_duplicates('title').set_index('title')['award_id']
+            projects_df['award_id'] = projects_df['award_title'].map(first_award).astype('Int64')
+        result['projects'] = projects_df
+
+    if (not winners_df.empty and 'project_id' not in winners_df.columns
+            and 'project_name' in winners_df.columns and 'name' in projects_df.columns):
+        first_project = projects_df.drop_duplicates('name').set_index('name')['project_id']
+        winners_df = winners_df.assign(
+            project_id=winners_df['project_name'].map(first_project).astype('Int64')
+        )
+        result['winners'] = winners_df
+
+    return result
\ No newline at end of file
@@ -0,0 +1,379 @@
+import os
+import re
+import json
+import unicodedata
+from collections import Counter
+from typing import Dict, Any, List, Optional, Iterable
+import pandas as pd
+from loguru import logger
+
+from config.config import RESOLVER_CONFIG
+
+# 名称中需要移除的空白、分隔符和括号
+SEPARATOR_PATTERN = re.compile(r'[\s·•・\-_,，、。.;；:："\'“”‘’()\[\]【】<>《》]+')
+
+# 获奖人姓名后的职称
+TITLE_PATTERN = re.compile(r'(副?教授|副?研究员|院士|博士|高级工程师|工程师|副?主任医师)$')
+
+# 独立机构名称的结尾
+INSTITUTION_PATTERN = re.compile(r'(大学|学院|科学院|研究院|研究所|医院|公司|集团|中心|局|厅)$')
+
+# 下属单位名称的结尾
+SUBUNIT_PATTERN = re.compile(r'(系|学院|书院|研究所|研究院|研究室|实验室|中心|分院|分所|分公司|事业部|课题组|部|所|科|处|室)$')
+
+class EntityResolver:
+    """实体消解类
+
+    为机构和获奖人分配稳定的整数ID（org_id / winner_id）：
+    - 机构：规范化名称后，下属单位（如“清华大学计算机系”）归并到已出现的上级机构，
+      写法相近的名称按字符n-gram的Jaccard相似度归并。候选按“名称前缀 + n-gram”分块索引，
+      只比较共享分块的名称，超过 max_block_size 的高频分块不参与比较，整体接近线性时间。
+    - 获奖人：以（机构ID, 规范化姓名）为键，同名不同机构视为不同的人；
+      缺少机构的记录仅在同名实体唯一时归并。
+    已分配的ID保存在注册表文件中，后续批次中同一实体保持相同ID。
+    """
+
+    def __init__(self, registry_file: Optional[str] = None, ngram_size: Optional[int] = None,
+                 similarity_threshold: Optional[float] = None, max_block_size: Optional[int] = None):
+        """
+        初始化实体消解器
+
+        Args:
+            registry_file: 实体ID注册表文件路径，默认读取 RESOLVER_CONFIG
+            ngram_size: 机构名称字符n-gram长度，默认读取 RESOLVER_CONFIG
+            similarity_threshold: 机构名称合并的最小Jaccard相似度，默认读取 RESOLVER_CONFIG
+            max_block_size: 分块候选列表上限，默认读取 RESOLVER_CONFIG
+        """
+        self.registry_file = registry_file or RESOLVER_CONFIG.get('registry_file')
+        self.ngram_size = ngram_size or RESOLVER_CONFIG.get('ngram_size', 2)
+        self.similarity_threshold = similarity_threshold or RESOLVER_CONFIG.get('similarity_threshold', 0.8)
+        self.max_block_size = max_block_size or RESOLVER_CONFIG.get('max_block_size', 200)
+
+        # 规范化机构名称 -> 机构ID，机构ID -> 显示名称
+        self.org_ids: Dict[str, int] = {}
+        self.org_labels: Dict[int, str] = {}
+
+        # 获奖人键（机构ID|姓名）-> 获奖人ID，获奖人ID -> 显示名称
+        self.winner_ids: Dict[str, int] = {}
+        self.winner_labels: Dict[int, str] = {}
+
+        # 姓名 -> 获奖人ID集合，用于归并缺少机构的记录
+        self._name_index: Dict[str, set] = {}
+
+        self._next_org_id = 1
+        self._next_winner_id = 1
+
+    @staticmethod
+    def normalize_organization(org: Any) -> Optional[str]:
+        """
+        规范化机构名称
+
+        Args:
+            org: 原始机构名称
+
+        Returns:
+            规范化后的名称，为空时返回None
+        """
+        if not isinstance(org, str):
+            return None
+        org = SEPARATOR_PATTERN.sub('', unicodedata.normalize('NFKC', org)).lower()
+        return org or None
+
+    @staticmethod
+    def normalize_name(name: Any) -> Optional[str]:
+        """
+        规范化获奖人姓名
+
+        Args:
+            name: 原始姓名
+
+        Returns:
+            规范化后的姓名，为空时返回None
+        """
+        if not isinstance(name, str):
+            return None
+        name = SEPARATOR_PATTERN.sub('', unicodedata.normalize('NFKC', name)).lower()
+        stripped = TITLE_PATTERN.sub('', name)
+        if len(stripped) >= 2:
+            name = stripped
+        return name or None
+
+    def resolve(self, data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """
+        为DataFrame字典添加实体ID列
+
+        projects 和 winners 表添加 org_id，winners 表添加 winner_id。
+
+        Args:
+            data: 包含多个DataFrame的字典
+
+        Returns:
+            添加实体ID后的DataFrame字典
+        """
+        try:
+            result = dict(data)
+            projects_df = data.get('projects', pd.DataFrame())
+            winners_df = data.get('winners', pd.DataFrame())
+
+            orgs = []
+            for df in (projects_df, winners_df):
+                if 'organization' in df.columns:
+                    orgs.extend(pd.unique(df['organization'].dropna()))
+            org_map = self.resolve_organizations(orgs)
+
+            if 'organization' in projects_df.columns:
+                projects_df = projects_df.copy()
+                projects_df['org_id'] = self._map_ids(projects_df['organization'], org_map)
+                result['projects'] = projects_df
+
+            if 'name' in winners_df.columns:
+                winners_df = winners_df.copy()
+                if 'organization' in winners_df.columns:
+                    winners_df['org_id'] = self._map_ids(winners_df['organization'], org_map)
+                else:
+                    winners_df['org_id'] = pd.Series(pd.NA, index=winners_df.index, dtype='Int64')
+                winners_df['winner_id'] = self.resolve_winners(winners_df['name'], winners_df['org_id'])
+                result['winners'] = winners_df
+
+            logger.info(f"实体消解完成，共 {len(self.org_labels)} 个机构, {len(self.winner_labels)} 名获奖人")
+            return result
+
+        except Exception as e:
+            logger.error(f"实体消解失败: {str(e)}")
+            return data
+
+    def resolve_organizations(self, orgs: Iterable[Any]) -> Dict[Any, int]:
+        """
+        消解机构名称
+
+        Args:
+            orgs: 原始机构名称
+
+        Returns:
+            原始机构名称 -> 机构ID 的映射
+        """
+        normalized = {}
+        for org in orgs:
+            if org not in normalized:
+                normalized[org] = self.normalize_organization(org)
+
+        # 已注册的名称也参与聚类，使新的写法能归并到已有机构
+        names = list(self.org_ids)
+        known = set(names)
+        for name in normalized.values():
+            if name and name not in known:
+                known.add(name)
+                names.append(name)
+
+        positions = {name: i for i, name in enumerate(names)}
+        parents = list(range(len(names)))
+
+        def find(i: int) -> int:
+            while parents[i] != i:
+                parents[i] = parents[parents[i]]
+                i = parents[i]
+            return i
+
+        def union(i: int, j: int) -> None:
+            i, j = find(i), find(j)
+            if i != j:
+                parents[max(i, j)] = min(i, j)
+
+        # 下属单位归并到最近的上级机构
+        for i, name in enumerate(names):
+            if not SUBUNIT_PATTERN.search(name):
+                continue
+            for end in range(len(name) - 1, 1, -1):
+                parent = name[:end]
+                if (parent in positions and INSTITUTION_PATTERN.search(parent)
+                        and SUBUNIT_PATTERN.search(name[end:])):
+                    union(i, positions[parent])
+                    break
+
+        # 写法相近的名称按n-gram相似度归并
+        grams = [self._ngrams(name) for name in names]
+        blocks: Dict[tuple, List[int]] = {}
+        for i, name in enumerate(names):
+            shared = Counter()
+            keys = [(name[:2], gram) for gram in grams[i]]
+            for key in keys:
+                block = blocks.get(key)
+                if block is not None and len(block) < self.max_block_size:
+                    shared.update(block)
+            for j, count in shared.items():
+                if count / (len(grams[i]) + len(grams[j]) - count) >= self.similarity_threshold:
+                    union(i, j)
+            for key in keys:
+                blocks.setdefault(key, []).append(i)
+
+        # 分配ID：已注册的名称保持原ID，新名称沿用所在簇的最小ID
+        raw_names = {}
+        for org, name in normalized.items():
+            if name:
+                raw_names.setdefault(name, org)
+
+        clusters: Dict[int, List[str]] = {}
+        for i, name in enumerate(names):
+            clusters.setdefault(find(i), []).append(name)
+
+        for members in clusters.values():
+            ids = [self.org_ids[name] for name in members if name in self.org_ids]
+            if ids:
+                org_id = min(ids)
+            else:
+                # 新机构以最短的写法（通常为上级机构）作为显示名称
+                org_id = self._next_org_id
+                self._next_org_id += 1
+                self.org_labels[org_id] = raw_names[min(members, key=len)]
+            for name in members:
+                self.org_ids.setdefault(name, org_id)
+
+        return {
+            org: self.org_ids[name]
+            for org, name in normalized.items()
+            if name
+        }
+
+    def resolve_winners(self, names: pd.Series, org_ids: pd.Series) -> pd.Series:
+        """
+        消解获奖人
+
+        Args:
+            names: 获奖人姓名列
+            org_ids: 机构ID列
+
+        Returns:
+            获奖人ID列
+        """
+        codes, uniques = pd.factorize(names)
+        normalized = pd.Series(
+            [self.normalize_name(name) for name in uniques] + [None], dtype=object
+        ).take(codes).set_axis(names.index)
+        org_ids = org_ids.astype('Int64')
+
+        has_org = org_ids.notna() & normalized.notna()
+        no_org = org_ids.isna() & normalized.notna()
+        keys = pd.Series(None, index=names.index, dtype=object)
+        keys[has_org] = org_ids[has_org].astype('int64').astype(str) + '|' + normalized[has_org]
+        keys[no_org] = '|' + normalized[no_org]
+
+        # 先处理有机构的记录，再归并缺少机构的记录
+        mapping = {}
+        firsts = pd.DataFrame({'key': keys, 'name': names, 'has_org': has_org}).dropna(subset=['key'])
+        firsts = firsts.drop_duplicates('key').sort_values('has_org', ascending=False, kind='stable')
+        for key, name, with_org in zip(firsts['key'], firsts['name'], firsts['has_org']):
+            winner_id = self.winner_ids.get(key)
+            if winner_id is None and not with_org:
+                candidates = self._name_index.get(key[1:], ())
+                if len(candidates) == 1:
+                    mapping[key] = next(iter(candidates))
+                    continue
+            if winner_id is None:
+                winner_id = self._next_winner_id
+                self._next_winner_id += 1
+                self.winner_ids[key] = winner_id
+                self.winner_labels[winner_id] = name
+                if with_org:
+                    self._name_index.setdefault(key.split('|', 1)[1], set()).add(winner_id)
+            mapping[key] = winner_id
+
+        return keys.map(mapping).astype('Int64')
+
+    def organization_name(self, org_id: int) -> Optional[str]:
+        """
+        获取机构显示名称
+
+        Args:
+            org_id: 机构ID
+
+        Returns:
+            机构名称
+        """
+        return self.org_labels.get(org_id)
+
+    def winner_name(self, winner_id: int) -> Optional[str]:
+        """
+        获取获奖人显示名称
+
+        Args:
+            winner_id: 获奖人ID
+
+        Returns:
+            获奖人姓名
+        """
+        return self.winner_labels.get(winner_id)
+
+    def load_registry(self, registry_file: Optional[str] = None) -> None:
+        """
+        加载实体ID注册表
+
+        Args:
+            registry_file: 注册表文件路径，默认使用初始化时的路径
+        """
+        registry_file = registry_file or self.registry_file
+        try:
+            if not registry_file or not os.path.exists(registry_file):
+                return
+
+            with open(registry_file, 'r', encoding='utf-8') as f:
+                registry = json.load(f)
+
+            organizations = registry.get('organizations', {})
+            self.org_ids = dict(organizations.get('ids', {}))
+            self.org_labels = {int(k): v for k, v in organizations.get('labels', {}).items()}
+
+            winners = registry.get('winners', {})
+            self.winner_ids = dict(winners.get('ids', {}))
+            self.winner_labels = {int(k): v for k, v in winners.get('labels', {}).items()}
+
+            self._next_org_id = max(self.org_labels, default=0) + 1
+            self._next_winner_id = max(self.winner_labels, default=0) + 1
+
+            self._name_index = {}
+            for key, winner_id in self.winner_ids.items():
+                org_id, name = key.split('|', 1)
+                if org_id:
+                    self._name_index.setdefault(name, set()).add(winner_id)
+
+            logger.info(f"加载实体注册表: {registry_file}，共 {len(self.org_labels)} 个机构, {len(self.winner_labels)} 名获奖人")
+
+        except Exception as e:
+            logger.error(f"加载实体注册表失败: {str(e)}")
+
+    def save_registry(self, registry_file: Optional[str] = None) -> None:
+        """
+        保存实体ID注册表
+
+        Args:
+            registry_file: 注册表文件路径，默认使用初始化时的路径
+        """
+        registry_file = registry_file or self.registry_file
+        try:
+            directory = os.path.dirname(registry_file)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            registry = {
+                'organizations': {'ids': self.org_ids, 'labels': self.org_labels},
+                'winners': {'ids': self.winner_ids, 'labels': self.winner_labels}
+            }
+
+            with open(registry_file, 'w', encoding='utf-8') as f:
+                json.dump(registry, f, ensure_ascii=False)
+
+            logger.info(f"实体注册表已保存到: {registry_file}")
+
+        except Exception as e:
+            logger.error(f"保存实体注册表失败: {str(e)}")
+
+    def _ngrams(self, name: str) -> set:
+        """字符n-gram集合，名称短于n时使用整个名称"""
+        n = self.ngram_size
+        if len(name) <= n:
+            return {name}
+        return {name[i:i + n] for i in range(len(name) - n + 1)}
+
+    @staticmethod
+    def _map_ids(values: pd.Series, mapping: Dict[Any, int]) -> pd.Series:
+        """按映射转换为可空整数ID列"""
+        return values.map(mapping).astype('Int64')
\ No newline at end of file
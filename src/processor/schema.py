@@ -0,0 +1,162 @@
+import sys
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from config.config import AWARD_LEVELS, AWARD_TYPES
+
+class DataSchema:
+    """数据类型模式类
+
+    为奖项、项目、获奖人表指定紧凑的列类型：
+    - 取值来自固定词表的列使用分类类型（category）
+    - 年份使用可空的小整数类型（Int16）
+    - 机构名称使用驻留字符串（相同名称共享同一个对象）
+    """
+
+    # 分类列及其基础词表
+    CATEGORY_COLUMNS: Dict[str, Dict[str, List[str]]] = {
+        'awards': {
+            'award_type': AWARD_TYPES,
+            'award_level': AWARD_LEVELS
+        },
+        'projects': {
+            'level': AWARD_LEVELS
+        }
+    }
+
+    # 年份列
+    YEAR_COLUMNS: Dict[str, List[str]] = {
+        'awards': ['year'],
+        'projects': ['year']
+    }
+
+    # 需要驻留的字符串列
+    INTERN_COLUMNS: Dict[str, List[str]] = {
+        'projects': ['organization'],
+        'winners': ['organization']
+    }
+
+    YEAR_DTYPE = 'Int16'
+
+    @classmethod
+    def apply(cls, data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """
+        为DataFrame字典应用数据类型模式
+
+        Args:
+            data: 包含多个DataFrame的字典
+
+        Returns:
+            应用类型后的DataFrame字典
+        """
+        return {
+            name: cls.apply_frame(df, name)
+            for name, df in data.items()
+        }
+
+    @classmethod
+    def apply_frame(cls, df: pd.DataFrame, table: str) -> pd.DataFrame:
+        """
+        为单个DataFrame应用数据类型模式
+
+        Args:
+            df: 数据表
+            table: 表名（awards/projects/winners）
+
+        Returns:
+            应用类型后的DataFrame
+        """
+        if not isinstance(df, pd.DataFrame) or df.empty:
+            return df
+
+        try:
+            df = df.copy()
+
+            for column, categories in cls.CATEGORY_COLUMNS.get(table, {}).items():
+                if column in df.columns:
+                    df[column] = cls.to_category(df[column], categories)
+
+            for column in cls.YEAR_COLUMNS.get(table, []):
+                if column in df.columns:
+                    df[column] = cls.to_year(df[column])
+
+            for column in cls.INTERN_COLUMNS.get(table, []):
+                if column in df.columns:
+                    df[column] = cls.intern_strings(df[column])
+
+            return df
+
+        except Exception as e:
+            logger.error(f"应用数据类型失败({table}): {str(e)}")
+            return df
+
+    @staticmethod
+    def to_category(series: pd.Series, categories: List[str]) -> pd.Series:
+        """
+        转换为分类类型
+
+        词表以外的取值会追加为额外的类别，不会丢失数据。
+
+        Args:
+            series: 原始列
+            categories: 基础词表
+
+        Returns:
+            分类类型的列
+        """
+        values = series.astype('object').where(series.notna(), None)
+        known = set(categories)
+        extra = sorted(v for v in pd.unique(values.dropna()) if v not in known)
+        dtype = pd.CategoricalDtype(categories=list(categories) + extra)
+        return values.astype(dtype)
+
+    @classmethod
+    def to_year(cls, series: pd.Series) -> pd.Series:
+        """
+        转换为可空小整数年份
+
+        Args:
+            series: 原始列
+
+        Returns:
+            Int16类型的年份列，无法解析的值为缺失值
+        """
+        years = pd.to_numeric(series, errors='coerce')
+        years = years.where(years == years.round())
+        return years.astype(cls.YEAR_DTYPE)
+
+    @staticmethod
+    def intern_strings(series: pd.Series) -> pd.Series:
+        """
+        驻留字符串，使相同取值共享同一个字符串对象
+
+        Args:
+            series: 原始列
+
+        Returns:
+            驻留后的字符串列
+        """
+        codes, uniques = pd.factorize(series)
+        interned = np.array(
+            [sys.intern(v) if isinstance(v, str) else v for v in uniques] + [None],
+            dtype=object
+        )
+        return pd.Series(interned.take(codes), index=series.index, name=series.name)
+
+    @staticmethod
+    def value_counts(series: pd.Series) -> pd.Series:
+        """
+        统计取值频次，忽略分类类型中未出现的类别
+
+        按频次降序稳定排序：次数相同的取值，分类类型按类别顺序，其余按首次出现的顺序。
+
+        Args:
+            series: 数据列
+
+        Returns:
+            频次Series
+        """
+        counts = series.value_counts(sort=False).sort_values(ascending=False, kind='stable')
+        return counts[counts > 0]
\ No newline at end of file
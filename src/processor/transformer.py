@@ -2,6 +2,8 @@ from typing import Dict, Any, List
 import pandas as pd
 from loguru import logger
 
+from .schema import DataSchema
+
 class DataTransformer:
     """数据转换类"""
     
@@ -17,57 +19,69 @@ class DataTransformer:
             包含多个DataFrame的字典
         """
         try:
-            # 创建空的DataFrame
-            awards_df = pd.DataFrame()
-            projects_df = pd.DataFrame()
-            winners_df = pd.DataFrame()
+            # 逐行收集到列表，最后一次性构建DataFrame
+            award_rows = []
+            project_rows = []
+            winner_rows = []
             
             # 处理每条数据
             for item in data:
                 try:
-                    # 提取奖项基本信息
-                    award_info = {
-                        'title': item.get('title'),
-                        'content': item.get('content'),
-                        'year': item.get('year'),
-                        'award_level': item.get('award_level'),
-                        'award_type': item.get('award_type'),
-                        'source_url': item.get('source_url'),
-                        'source_title': item.get('source_title'),
-                        'source_engine': item.get('source_engine'),
-                        'crawled_at': item.get('crawled_at')
-                    }
-                    awards_df = pd.concat([awards_df, pd.DataFrame([award_info])], ignore_index=True)
+                    award_id = len(award_rows)
+                    projects = []
+                    winners = []
                     
                     # 处理项目信息
                     for project in item.get('projects', []):
-                        project_info = {
+                        project_id = len(project_rows) + len(projects)
+                        projects.append({
+                            'project_id': project_id,
+                            'award_id': award_id,
                             'award_title': item.get('title'),
                             'year': item.get('year'),
                             'name': project.get('name'),
                             'organization': project.get('organization'),
                             'level': project.get('level')
-                        }
-                        projects_df = pd.concat([projects_df, pd.DataFrame([project_info])], ignore_index=True)
+                        })
                         
                         # 处理获奖人信息
                         for winner in project.get('winners', []):
-                            winner_info = {
+                            winners.append({
+                                'project_id': project_id,
                                 'project_name': project.get('name'),
                                 'name': winner.get('name'),
                                 'organization': winner.get('organization')
-                            }
-                            winners_df = pd.concat([winners_df, pd.DataFrame([winner_info])], ignore_index=True)
+                            })
+                    
+                    # 提取奖项基本信息
+                    award_rows.append({
+                        'award_id': award_id,
+                        'title': item.get('title'),
+                        'content': item.get('content'),
+                        'year': item.get('year'),
+                        'award_level': item.get('award_level'),
+                        'award_type': item.get('award_type'),
+                        'source_url': item.get('source_url'),
+                        'source_title': item.get('source_title'),
+                        'source_engine': item.get('source_engine'),
+                        'crawled_at': item.get('crawled_at')
+                    })
+                    project_rows.extend(projects)
+                    winner_rows.extend(winners)
                             
                 except Exception as e:
                     logger.error(f"转换单条数据失败: {str(e)}")
                     continue
             
-            return {
+            awards_df = pd.DataFrame(award_rows)
+            projects_df = pd.DataFrame(project_rows)
+            winners_df = pd.DataFrame(winner_rows)
+            
+            return DataSchema.apply({
                 'awards': awards_df,
                 'projects': projects_df,
                 'winners': winners_df
-            }
+            })
             
         except Exception as e:
             logger.error(f"数据转换失败: {str(e)}")
@@ -132,6 +146,9 @@ class DataTransformer:
             for df_dict in dfs:
                 keys.update(df_dict.keys())
             
+            # 整数键在各数据集内从0编号，合并时依次偏移避免冲突
+            dfs = DataTransformer._offset_relation_keys(dfs)
+            
             # 合并每个键对应的DataFrame
             for key in keys:
                 frames = [df_dict[key] for df_dict in dfs if key in df_dict]
@@ -140,8 +157,41 @@ class DataTransformer:
                 else:
                     result[key] = pd.DataFrame()
             
-            return result
+            # 合并后分类列的类别可能不一致，重新应用类型
+            return DataSchema.apply(result)
             
         except Exception as e:
             logger.error(f"合并DataFrame失败: {str(e)}")
-            return {} 
\ No newline at end of file
+            return {}
+    
+    @staticmethod
+    def _offset_relation_keys(dfs: List[Dict[str, pd.DataFrame]]) -> List[Dict[str, pd.DataFrame]]:
+        """
+        偏移各数据集的 award_id/project_id，使合并后的整数键保持唯一
+        
+        Args:
+            dfs: DataFrame字典列表
+            
+        Returns:
+            偏移后的DataFrame字典列表
+        """
+        offsets = {'award_id': 0, 'project_id': 0}
+        owners = {'award_id': 'awards', 'project_id': 'projects'}
+        result = []
+        
+        for df_dict in dfs:
+            shifted = {}
+            for name, df in df_dict.items():
+                columns = [key for key in offsets if key in df.columns]
+                if columns and any(offsets[key] for key in columns):
+                    df = df.assign(**{key: df[key] + offsets[key] for key in columns})
+                shifted[name] = df
+            
+            # 下一个数据集从当前最大键之后开始编号
+            for key, owner in owners.items():
+                df = df_dict.get(owner)
+                if isinstance(df, pd.DataFrame) and key in df.columns and df[key].notna().any():
+                    offsets[key] += int(df[key].max()) + 1
+            result.append(shifted)
+        
+        return result
\ No newline at end of file
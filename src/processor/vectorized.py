@@ -0,0 +1,603 @@
+import re
+from itertools import chain, repeat
+from typing import Dict, Any, List, Tuple, Callable, Pattern
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from config.config import MIN_TEXT_LENGTH, MAX_TEXT_LENGTH
+from .cleaner import (
+    DataCleaner,
+    HTML_TAG_PATTERN,
+    WHITESPACE_PATTERN,
+    TEXT_SPECIAL_PATTERN,
+    URL_SPECIAL_PATTERN,
+    URL_SCHEME_PATTERN,
+    NAME_SPECIAL_PATTERN
+)
+from .schema import DataSchema
+
+# 批量替换时拼接唯一值使用的分隔符：属于空白字符，不会被文本、URL、名称中的特殊字符规则删除
+SEPARATOR = '\x1f'
+
+# 会匹配到分隔符的规则，拼接后改用不跨越分隔符的等价规则；
+# 空白替换为单个空格时跳过本来就是单个空格的位置，结果不变而替换次数少得多
+JOINED_PATTERNS = {
+    HTML_TAG_PATTERN: re.compile(r'<[^>\x1f]+>'),
+    WHITESPACE_PATTERN: re.compile(r'[^\S\x1f]{2,}|[^\S \x1f]')
+}
+
+def _substitute(values: pd.Series, rules: List[Tuple[Pattern, str]]) -> pd.Series:
+    """
+    对一列字符串依次执行正则替换
+
+    各取值以分隔符拼接为一个字符串，每条规则只调用一次正则，再按分隔符切回各行；
+    取值中含有分隔符时退回 Series.str 逐个替换。
+
+    Args:
+        values: 字符串Series
+        rules: (正则, 替换文本) 列表
+
+    Returns:
+        替换后的Series
+    """
+    if values.empty:
+        return values
+    strings = values.tolist()
+    joined = SEPARATOR.join(strings)
+    if joined.count(SEPARATOR) != len(strings) - 1:
+        for pattern, repl in rules:
+            values = values.str.replace(pattern, repl, regex=True)
+        return values
+
+    for pattern, repl in rules:
+        joined = JOINED_PATTERNS.get(pattern, pattern).sub(repl, joined)
+    return pd.Series(joined.split(SEPARATOR), index=values.index, dtype=object)
+
+def _truthy(value: Any) -> bool:
+    """取值是否为真值，无法判断真假的取值视为真值"""
+    try:
+        return bool(value)
+    except Exception:
+        return True
+
+def _strip(values: pd.Series) -> pd.Series:
+    """去掉一列字符串首尾的空白字符"""
+    return pd.Series([value.strip() for value in values.tolist()], index=values.index, dtype=object)
+
+def _object_array(values: List[Any]) -> np.ndarray:
+    """将列表转换为一维object数组（元素本身为列表时也保持一维）"""
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+def _is_instance(values: List[Any], types: Any) -> np.ndarray:
+    """每个取值是否为指定类型"""
+    return np.fromiter(map(isinstance, values, repeat(types, len(values))), dtype=bool, count=len(values))
+
+def _lengths(values: List[Any]) -> np.ndarray:
+    """每个取值的长度"""
+    return np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+
+def _field(records: List[Any], is_dict: np.ndarray, key: str, default: Any = None) -> np.ndarray:
+    """
+    按列取出一层记录的字段
+
+    Args:
+        records: 记录列表
+        is_dict: 每条记录是否为字典
+        key: 字段名
+        default: 字段缺失时的取值
+
+    Returns:
+        字段取值数组，非字典记录为None
+    """
+    if is_dict.all():
+        # 全部为字典时由 map 在C层逐条取值
+        return _object_array(list(map(dict.get, records, repeat(key, len(records)), repeat(default, len(records)))))
+    return _object_array([
+        record.get(key, default) if valid else None
+        for record, valid in zip(records, is_dict)
+    ])
+
+def _split(items: List[Any], parents: np.ndarray, size: int) -> List[List[Any]]:
+    """
+    将按父行顺序排列的子记录切分为每个父行的列表
+
+    Args:
+        items: 子记录，已按父行号升序排列
+        parents: 每条子记录的父行号
+        size: 父行数
+
+    Returns:
+        长度为 size 的子记录列表
+    """
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(parents, minlength=size), out=offsets[1:])
+    bounds = offsets.tolist()
+    return [items[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+class VectorizedCleaner(DataCleaner):
+    """批量向量化数据清洗类
+
+    将嵌套的奖项/项目/获奖人记录展开为扁平列，使用 Series.str 批量清洗文本、
+    URL、姓名和机构名称。每列只清洗去重后的取值，再按编码映射回所有行。
+    过滤规则与 DataCleaner.clean_award_data 逐条清洗完全一致。
+    """
+
+    # 展开后的奖项字段
+    AWARD_FIELDS = ['title', 'content', 'year', 'award_level', 'award_type',
+                    'source_url', 'source_title', 'source_engine', 'crawled_at']
+
+    @classmethod
+    def fix_encoding_series(cls, values: pd.Series) -> Tuple[pd.Series, int]:
+        """
+        批量修复一列字符串的编码问题
+
+        只对去重后且处于latin-1范围内的非ASCII字符串尝试修复。
+
+        Args:
+            values: 数据列，非字符串取值保持不变
+
+        Returns:
+            (修复后的数据列, 实际修复的字段数)
+        """
+        if values.empty:
+            return values, 0
+
+        try:
+            codes, uniques = pd.factorize(values)
+        except TypeError:
+            # 存在不可哈希的取值时退回逐个处理
+            repaired = values.map(lambda v: cls.repair_mojibake(v) if isinstance(v, str) else None)
+            mask = repaired.notna()
+            return values.where(~mask, repaired), int(mask.sum())
+
+        repaired = [
+            cls.repair_mojibake(v) if isinstance(v, str) else None
+            for v in uniques
+        ]
+        unique_mask = np.array([v is not None for v in repaired] + [False], dtype=bool)
+        if not unique_mask.any():
+            return values, 0
+
+        fixed_uniques = _object_array(
+            [r if r is not None else u for r, u in zip(repaired, uniques)] + [None]
+        )
+        mask = unique_mask.take(codes)
+        fixed = values.copy()
+        fixed[mask] = fixed_uniques.take(codes[mask])
+        return fixed, int(mask.sum())
+
+    @classmethod
+    def fix_encoding_batch(cls, data: List[Dict[str, Any]],
+                           stats: Dict[str, int] = None) -> List[Dict[str, Any]]:
+        """
+        批量修复原始数据中所有字符串字段的编码问题
+
+        结果与逐条调用 DataCleaner._fix_encoding 相同。
+
+        Args:
+            data: 原始数据列表
+            stats: 编码修复统计字典，会累加checked/repaired计数
+
+        Returns:
+            修复编码后的数据列表
+        """
+        # 将所有字符串字段展开为一列
+        positions = [
+            (item_idx, key)
+            for item_idx, item in enumerate(data) if isinstance(item, dict)
+            for key, value in item.items() if isinstance(value, str)
+        ]
+        values = pd.Series(
+            _object_array([data[item_idx][key] for item_idx, key in positions]),
+            dtype=object
+        )
+        fixed, repaired = cls.fix_encoding_series(values)
+
+        if stats is not None:
+            stats['checked'] = stats.get('checked', 0) + len(positions)
+            stats['repaired'] = stats.get('repaired', 0) + repaired
+
+        fixed_data = [dict(item) if isinstance(item, dict) else item for item in data]
+        if repaired:
+            changed = np.flatnonzero(fixed.to_numpy() != values.to_numpy())
+            for i in changed:
+                item_idx, key = positions[i]
+                fixed_data[item_idx][key] = fixed.iat[i]
+        return fixed_data
+
+    def clean_award_batch(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        批量清理奖项数据，输出与逐条调用 clean_award_data 相同
+
+        Args:
+            data: 奖项数据列表
+
+        Returns:
+            清理后的奖项数据列表
+        """
+        try:
+            awards, projects, winners = self._clean_columns(data)
+
+            # 展开后的获奖人按项目、项目按奖项顺序排列，按偏移量切片归集
+            winner_dicts = [
+                {'name': name, 'organization': org}
+                for name, org in zip(winners['name'].tolist(), winners['organization'].tolist())
+            ]
+            project_winners = _split(winner_dicts, winners['project'], len(projects['award']))
+
+            valid_projects = np.flatnonzero(projects['valid'])
+            project_dicts = [
+                {'name': name, 'winners': project_winners[idx], 'organization': org, 'level': level}
+                for idx, name, org, level in zip(
+                    valid_projects.tolist(),
+                    projects['name'][valid_projects].tolist(),
+                    projects['organization'][valid_projects].tolist(),
+                    projects['level'][valid_projects].tolist()
+                )
+            ]
+            award_projects = _split(project_dicts, projects['award'][valid_projects], len(awards['valid']))
+
+            cleaned_data = []
+            for award_idx in np.flatnonzero(awards['valid']):
+                if not award_projects[award_idx]:
+                    continue
+                item = data[award_idx]
+                cleaned_data.append({
+                    'title': awards['title'][award_idx],
+                    'content': awards['content'][award_idx],
+                    'year': item.get('year'),
+                    'award_level': item.get('award_level'),
+                    'award_type': item.get('award_type'),
+                    'source_url': awards['source_url'][award_idx],
+                    'source_title': awards['source_title'][award_idx],
+                    'source_engine': item.get('source_engine'),
+                    'crawled_at': item.get('crawled_at'),
+                    'projects': award_projects[award_idx]
+                })
+
+            return cleaned_data
+
+        except Exception as e:
+            logger.error(f"批量清理数据失败: {str(e)}")
+            return []
+
+    def clean_frames(self, data: List[Dict[str, Any]]) -> Dict[str, pd.DataFrame]:
+        """
+        批量清理奖项数据并直接输出扁平表
+
+        输出的表结构与 DataTransformer.to_dataframe(clean_award_batch(data)) 相同，
+        省去构建嵌套字典的开销。
+
+        Args:
+            data: 奖项数据列表
+
+        Returns:
+            包含awards/projects/winners三个DataFrame的字典
+        """
+        try:
+            awards, projects, winners = self._clean_columns(data)
+
+            # 没有有效项目的奖项被整体过滤
+            valid_projects = np.flatnonzero(projects['valid'])
+            project_award = projects['award'][valid_projects]
+            has_project = np.zeros(len(awards['valid']), dtype=bool)
+            has_project[project_award] = True
+            kept_awards = np.flatnonzero(awards['valid'] & has_project)
+
+            # 只保留属于有效奖项的项目和获奖人
+            kept = np.zeros(len(awards['valid']), dtype=bool)
+            kept[kept_awards] = True
+            valid_projects = valid_projects[kept[project_award]]
+            project_kept = np.zeros(len(projects['award']), dtype=bool)
+            project_kept[valid_projects] = True
+            kept_winners = project_kept[winners['project']] if len(winners['project']) else np.zeros(0, dtype=bool)
+
+            # 不需要清洗的字段只在有效奖项中按列取值
+            kept_data = [data[i] for i in kept_awards.tolist()]
+            kept_dict = np.ones(len(kept_data), dtype=bool)
+            awards_df = pd.DataFrame({
+                field: (awards[field][kept_awards] if field in awards
+                        else _field(kept_data, kept_dict, field))
+                for field in self.AWARD_FIELDS
+            })
+            if awards_df.empty:
+                return DataSchema.apply({
+                    'awards': pd.DataFrame(),
+                    'projects': pd.DataFrame(),
+                    'winners': pd.DataFrame()
+                })
+
+            # 整数键按输出行顺序从0编号，与 DataTransformer.to_dataframe 一致
+            award_ids = np.full(len(awards['valid']), -1, dtype=np.int64)
+            award_ids[kept_awards] = np.arange(len(kept_awards))
+            project_ids = np.full(len(projects['award']), -1, dtype=np.int64)
+            project_ids[valid_projects] = np.arange(len(valid_projects))
+            awards_df.insert(0, 'award_id', award_ids[kept_awards])
+
+            project_award = projects['award'][valid_projects]
+            projects_df = pd.DataFrame({
+                'project_id': project_ids[valid_projects],
+                'award_id': award_ids[project_award],
+                'award_title': awards['title'][project_award],
+                'year': awards_df['year'].to_numpy(dtype=object)[award_ids[project_award]],
+                'name': projects['name'][valid_projects],
+                'organization': projects['organization'][valid_projects],
+                'level': projects['level'][valid_projects]
+            })
+
+            winners_df = pd.DataFrame({
+                'project_id': project_ids[winners['project'][kept_winners]],
+                'project_name': projects['name'][winners['project'][kept_winners]],
+                'name': winners['name'][kept_winners],
+                'organization': winners['organization'][kept_winners]
+            })
+
+            return DataSchema.apply({
+                'awards': awards_df,
+                'projects': projects_df,
+                'winners': winners_df if not winners_df.empty else pd.DataFrame()
+            })
+
+        except Exception as e:
+            logger.error(f"批量清理数据失败: {str(e)}")
+            return {
+                'awards': pd.DataFrame(),
+                'projects': pd.DataFrame(),
+                'winners': pd.DataFrame()
+            }
+
+    def _clean_columns(self, data: List[Dict[str, Any]]) -> Tuple[Dict[str, np.ndarray], ...]:
+        """
+        展开嵌套记录并批量清洗各列
+
+        Args:
+            data: 奖项数据列表
+
+        Returns:
+            (奖项列, 项目列, 获奖人列)，获奖人列只包含有效获奖人
+        """
+        awards, projects, winners = self._explode(data)
+
+        # 清洗奖项字段
+        title, title_error = self._clean_column(awards['title'], self.clean_title_series, None)
+        content, content_error = self._clean_column(awards['content'], self.clean_content_series, '')
+        source_title, source_title_error = self._clean_column(awards['source_title'], self.clean_text_series, '')
+        source_url, url_error = self._clean_column(awards['source_url'], self.clean_url_series, None)
+        award_valid = (
+            awards['valid']
+            & ~title_error & pd.notna(title)
+            & ~content_error & ~source_title_error
+            & ~url_error & pd.notna(source_url)
+        )
+
+        # 清洗项目字段
+        project_name, name_error = self._clean_column(projects['name'], self.clean_name_series, None)
+        project_org, org_error = self._clean_column(projects['organization'], self.clean_organization_series, None)
+        project_valid = projects['valid'] & ~name_error & pd.notna(project_name) & ~org_error
+
+        # 清洗获奖人字段
+        winner_name, winner_name_error = self._clean_column(winners['name'], self.clean_name_series, None)
+        winner_org, winner_org_error = self._clean_column(winners['organization'], self.clean_organization_series, None)
+        winner_valid = winners['valid'] & ~winner_name_error & pd.notna(winner_name) & ~winner_org_error
+
+        return (
+            {
+                'valid': award_valid,
+                'title': title,
+                'content': content,
+                'source_url': source_url,
+                'source_title': source_title
+            },
+            {
+                'valid': project_valid,
+                'award': projects['award'],
+                'name': project_name,
+                'organization': project_org,
+                'level': projects['level']
+            },
+            {
+                'project': winners['project'][winner_valid],
+                'name': winner_name[winner_valid],
+                'organization': winner_org[winner_valid]
+            }
+        )
+
+    @staticmethod
+    def _explode(data: List[Dict[str, Any]]) -> Tuple[Dict[str, np.ndarray], ...]:
+        """
+        将嵌套记录展开为扁平列
+
+        每一层记录整体展开一次，字段按列批量取出。结构不合法的记录（非字典、
+        项目列表不可迭代等）标记为无效，与逐条清洗时抛出异常后被丢弃的行为一致。
+
+        Args:
+            data: 奖项数据列表
+
+        Returns:
+            (奖项列, 项目列, 获奖人列)
+        """
+        # 奖项层
+        award_dict = _is_instance(data, dict)
+        project_lists = _field(data, award_dict, 'projects', [])
+        award_valid = award_dict & _is_instance(project_lists, (list, tuple))
+
+        # 项目层：展开所有合法的项目列表
+        project_counts = _lengths(project_lists[award_valid])
+        flat_projects = list(chain.from_iterable(project_lists[award_valid]))
+        project_award = np.repeat(np.flatnonzero(award_valid), project_counts)
+        project_dict = _is_instance(flat_projects, dict)
+        winner_lists = _field(flat_projects, project_dict, 'winners', [])
+
+        # 字符串/字典迭代出的元素都不是合法获奖人，等价于空列表
+        project_valid = project_dict & _is_instance(winner_lists, (list, tuple, str, dict))
+        has_winners = project_dict & _is_instance(winner_lists, (list, tuple))
+
+        # 获奖人层：数量最多，整体展开后按列取值
+        winner_counts = _lengths(winner_lists[has_winners])
+        flat_winners = list(chain.from_iterable(winner_lists[has_winners]))
+        winner_project = np.repeat(np.flatnonzero(has_winners), winner_counts)
+        winner_dict = _is_instance(flat_winners, dict)
+
+        return (
+            {
+                'valid': award_valid,
+                'title': _field(data, award_dict, 'title', ''),
+                'content': _field(data, award_dict, 'content', ''),
+                'source_url': _field(data, award_dict, 'source_url'),
+                'source_title': _field(data, award_dict, 'source_title', '')
+            },
+            {
+                'valid': project_valid,
+                'award': project_award,
+                'name': _field(flat_projects, project_dict, 'name'),
+                'organization': _field(flat_projects, project_dict, 'organization'),
+                'level': _field(flat_projects, project_dict, 'level')
+            },
+            {
+                'valid': winner_dict,
+                'project': winner_project,
+                'name': _field(flat_winners, winner_dict, 'name'),
+                'organization': _field(flat_winners, winner_dict, 'organization')
+            }
+        )
+
+    @staticmethod
+    def _clean_column(values: np.ndarray, clean_series: Callable[[pd.Series], pd.Series],
+                      empty_value: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        清洗一列取值，只处理去重后的取值
+
+        与逐条清洗一致：None和其他假值返回 empty_value；
+        非字符串的真值会导致正则调用失败，标记为错误。
+
+        Args:
+            values: 原始取值数组
+            clean_series: 字符串Series的批量清洗函数
+            empty_value: 空值对应的清洗结果
+
+        Returns:
+            (清洗结果数组, 错误标记数组)
+        """
+        try:
+            codes, uniques = pd.factorize(values)
+        except TypeError:
+            # 存在不可哈希的取值（如列表）：空列表等假值视为空值，其余会导致清洗失败
+            hashable = np.array([getattr(v, '__hash__', None) is not None for v in values], dtype=bool)
+            result = np.full(len(values), empty_value, dtype=object)
+            error = np.array([not valid and _truthy(v) for v, valid in zip(values, hashable)], dtype=bool)
+            if hashable.any():
+                result[hashable], error[hashable] = VectorizedCleaner._clean_column(
+                    values[hashable], clean_series, empty_value
+                )
+            return result, error
+
+        # 按唯一值判断类型并清洗
+        is_str = np.array([isinstance(v, str) for v in uniques], dtype=bool)
+        unique_result = np.full(len(uniques) + 1, empty_value, dtype=object)
+        unique_error = np.zeros(len(uniques) + 1, dtype=bool)
+        for i in np.flatnonzero(~is_str):
+            unique_error[i] = _truthy(uniques[i])
+        if is_str.any():
+            cleaned = clean_series(pd.Series(uniques[is_str], dtype=object))
+            unique_result[np.flatnonzero(is_str)] = cleaned.astype(object).where(cleaned.notna(), None).to_numpy()
+
+        result = unique_result.take(codes)
+        error = unique_error.take(codes)
+
+        # 缺失值中只有None是假值，NaN等其他缺失值会导致清洗失败
+        missing = np.flatnonzero(codes == -1)
+        if len(missing):
+            error[missing] = [v is not None for v in values[missing]]
+
+        return result, error
+
+    @staticmethod
+    def clean_text_series(texts: pd.Series) -> pd.Series:
+        """
+        批量清理文本，规则同 DataCleaner.clean_text
+
+        Args:
+            texts: 字符串Series
+
+        Returns:
+            清理后的文本Series
+        """
+        return _strip(_substitute(texts, [
+            (HTML_TAG_PATTERN, ''),
+            (WHITESPACE_PATTERN, ' '),
+            (TEXT_SPECIAL_PATTERN, '')
+        ]))
+
+    @classmethod
+    def clean_title_series(cls, titles: pd.Series) -> pd.Series:
+        """
+        批量清理标题，过短的标题为None（对应逐条清洗时整条奖项被丢弃）
+
+        Args:
+            titles: 字符串Series
+
+        Returns:
+            清理后的标题Series
+        """
+        titles = cls.clean_text_series(titles)
+        return titles.where(_lengths(titles.tolist()) >= max(MIN_TEXT_LENGTH, 1), None)
+
+    @classmethod
+    def clean_content_series(cls, contents: pd.Series) -> pd.Series:
+        """
+        批量清理正文，超长部分截断
+
+        Args:
+            contents: 字符串Series
+
+        Returns:
+            清理后的正文Series
+        """
+        contents = cls.clean_text_series(contents)
+        return pd.Series([content[:MAX_TEXT_LENGTH] for content in contents.tolist()], index=contents.index, dtype=object)
+
+    @staticmethod
+    def clean_url_series(urls: pd.Series) -> pd.Series:
+        """
+        批量清理URL，规则同 DataCleaner.clean_url
+
+        Args:
+            urls: 字符串Series
+
+        Returns:
+            清理后的URL Series，无效URL为None
+        """
+        urls = _substitute(urls, [(URL_SPECIAL_PATTERN, '')])
+        valid = np.array([URL_SCHEME_PATTERN.match(url) is not None for url in urls.tolist()], dtype=bool)
+        return _strip(urls).where(valid, None)
+
+    @staticmethod
+    def clean_name_series(names: pd.Series, min_length: int = 2) -> pd.Series:
+        """
+        批量清理名称，规则同 DataCleaner.clean_name
+
+        Args:
+            names: 字符串Series
+            min_length: 最小长度
+
+        Returns:
+            清理后的名称Series，过短的名称为None
+        """
+        names = _strip(_substitute(names, [(NAME_SPECIAL_PATTERN, '')]))
+        return names.where(_lengths(names.tolist()) >= min_length, None)
+
+    @classmethod
+    def clean_organization_series(cls, orgs: pd.Series) -> pd.Series:
+        """
+        批量清理机构名称，规则同 DataCleaner.clean_organization
+
+        Args:
+            orgs: 字符串Series
+
+        Returns:
+            清理后的机构名称Series，过短的名称为None
+        """
+        return cls.clean_name_series(orgs, min_length=4)
\ No newline at end of file
@@ -154,7 +154,9 @@ class AwardReporter:
         impact_data = self.analyzer.get_impact_analysis()
         
         # 获取网络分析数据
-        network_data = self.analyzer.get_network_analysis()
+        network_data = self.analyzer.get_network_analysis(
+            min_weight=self.analyzer.config['network_min_weight']
+        )
         
         # 获取文本分析数据
         text_data = self.analyzer.get_text_analysis()
@@ -345,9 +347,12 @@ class AwardReporter:
         insights = []
         
         try:
-            # 实现研究领域分析逻辑
-            # 这里可以根据实际需求添加具体的分析逻辑
-            insights.append("研究领域分析逻辑未实现")
+            if isinstance(field_data, pd.DataFrame) and not field_data.empty:
+                top_terms = field_data['关键词'].head(5).tolist()
+                insights.append(f"热点研究领域关键词: {'、'.join(top_terms)}")
+                if '出现次数' in field_data.columns:
+                    top = field_data.iloc[0]
+                    insights.append(f"权重最高的关键词“{top['关键词']}”出现在 {int(top['出现次数'])} 个项目中")
             
         except Exception as e:
             logger.error(f"分析研究领域失败: {str(e)}")
@@ -0,0 +1,24 @@
+"""
+数据存储模块
+
+包含以下功能：
+1. SQLite规范化奖项存储
+2. 全文检索（jieba分词 + FTS5倒排索引）
+3. 获奖人、机构名称前缀补全
+4. 内存映射列式缓存
+"""
+
+from .sqlite import AwardStore
+from .search import SearchIndex
+from .prefix import PrefixIndex, get_prefix_index
+from .columnar import ColumnarStore, get_columnar_store, columnar_dir
+
+__all__ = [
+    'AwardStore',
+    'SearchIndex',
+    'PrefixIndex',
+    'get_prefix_index',
+    'ColumnarStore',
+    'get_columnar_store',
+    'columnar_dir'
+]
\ No newline at end of file
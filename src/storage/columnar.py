@@ -0,0 +1,284 @@
+import os
+import json
+import shutil
+import threading
+import time
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from config.config import COLUMNAR_CONFIG
+
+MANIFEST_FILE = 'manifest.json'
+
+# 版本目录名前缀
+VERSION_PREFIX = 'v'
+
+def _mmap(path: str) -> np.ndarray:
+    """以只读内存映射方式加载 .npy 文件，空数组无法映射时直接读取（同样只读）"""
+    try:
+        return np.load(path, mmap_mode='r')
+    except ValueError:
+        array = np.load(path)
+        array.flags.writeable = False
+        return array
+
+def _codes_dtype(size: int) -> np.dtype:
+    """与 pandas 分类编码一致的整数类型，按此类型保存的编码构造分类数组时无需复制"""
+    for dtype in (np.int8, np.int16, np.int32):
+        if size < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+class ColumnarStore:
+    """内存映射列式缓存类
+
+    每张数据表的每一列保存为独立的 .npy 文件，读取时以 mmap_mode='r' 映射：
+    - 数值、日期列直接映射为数组
+    - 可空整数等带掩码的列分别保存取值和掩码
+    - 分类列保存类别编码，类别写在清单文件中
+    - 字符串列按字典编码：编码数组 + UTF-8 拼接的字典及其偏移量，读取为以映射的编码
+      构造的分类数组
+
+    多个工作进程读取同一份缓存时共享操作系统的页缓存；各列零拷贝且只读，
+    字符串列只在进程内解码一次字典。读取结果已是分析所需的数据类型，无需再应用数据类型模式。
+    实现与 ExcelLoader 相同的 read(表名, 列) 接口，可直接作为分析器的数据读取器。
+
+    每次写入生成新的版本目录，清单文件记录当前版本并以一次原子替换切换，
+    读取方总能看到完整的某个版本；旧版本保留 keep_versions 个，已打开旧清单的进程仍可读取。
+    """
+
+    # 读取结果已应用数据类型模式
+    typed = True
+
+    def __init__(self, directory: str):
+        """
+        初始化列式缓存
+
+        Args:
+            directory: 缓存目录
+        """
+        self.directory = directory
+        self.manifest = {}
+        self.version_dir = directory
+        self._columns = {}
+        self._lock = threading.Lock()
+
+        manifest_path = os.path.join(directory, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                self.manifest = json.load(f)
+            # 没有版本的清单为旧格式，数据直接位于缓存目录下
+            self.version_dir = os.path.join(directory, self.manifest.get('version', ''))
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """缓存中的数据表"""
+        return list(self.manifest.get('tables', {}))
+
+    def exists(self) -> bool:
+        """缓存是否已写入"""
+        return bool(self.manifest)
+
+    @classmethod
+    def write(cls, data: Dict[str, pd.DataFrame], directory: str) -> 'ColumnarStore':
+        """
+        将数据表写入列式缓存
+
+        先写入新的版本目录，再原子替换清单文件切换到新版本，最后清理多余的旧版本。
+
+        Args:
+            data: 包含多个DataFrame的字典
+            directory: 缓存目录
+
+        Returns:
+            写入后的列式缓存
+        """
+        version = f"{VERSION_PREFIX}{time.time_ns():020d}-{os.getpid()}"
+        temp_dir = os.path.join(directory, version)
+        os.makedirs(temp_dir)
+
+        tables = {}
+        for table, df in data.items():
+            if not isinstance(df, pd.DataFrame):
+                continue
+            os.makedirs(os.path.join(temp_dir, table))
+            columns = []
+            for position, column in enumerate(df.columns):
+                prefix = os.path.join(temp_dir, table, str(position))
+                meta = cls._write_column(df[column], prefix)
+                meta['name'] = column
+                columns.append(meta)
+            tables[table] = {'rows': len(df), 'columns': columns}
+
+        manifest = {'version': version, 'tables': tables}
+        temp_manifest = os.path.join(directory, f"{MANIFEST_FILE}.tmp{os.getpid()}")
+        with open(temp_manifest, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+
+        # 原子替换清单文件，切换到新版本
+        os.replace(temp_manifest, os.path.join(directory, MANIFEST_FILE))
+        cls._remove_old_versions(directory, version)
+
+        logger.info(f"列式缓存已写入: {temp_dir}")
+        return cls(directory)
+
+    @staticmethod
+    def _remove_old_versions(directory: str, current: str) -> None:
+        """删除较早的版本目录，保留当前版本及之前最近的 keep_versions-1 个"""
+        keep = max(1, COLUMNAR_CONFIG.get('keep_versions', 2))
+        versions = sorted(
+            name for name in os.listdir(directory)
+            if name.startswith(VERSION_PREFIX) and name != current
+            and os.path.isdir(os.path.join(directory, name))
+        )
+        # 比当前版本新的目录可能是其他进程正在写入的版本，不删除
+        older = [name for name in versions if name < current]
+        for name in older[:max(0, len(older) - (keep - 1))]:
+            shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+
+    @staticmethod
+    def _write_column(series: pd.Series, prefix: str) -> Dict[str, Any]:
+        """保存一列，返回清单中的列描述"""
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            np.save(f"{prefix}.codes.npy", series.cat.codes.to_numpy())
+            return {'kind': 'category', 'categories': series.cat.categories.tolist()}
+
+        array = series.array
+        if hasattr(array, '_data') and hasattr(array, '_mask'):
+            # 可空整数、可空布尔等带掩码的扩展类型
+            np.save(f"{prefix}.values.npy", array._data)
+            np.save(f"{prefix}.mask.npy", array._mask)
+            return {'kind': 'masked', 'dtype': str(dtype)}
+
+        if isinstance(dtype, np.dtype) and dtype.kind in 'biufmM':
+            np.save(f"{prefix}.npy", series.to_numpy())
+            return {'kind': 'numeric'}
+
+        # 其余列按字典编码
+        codes, uniques = pd.factorize(series.astype(object))
+        np.save(f"{prefix}.codes.npy", codes.astype(_codes_dtype(len(uniques))))
+        uniques = np.asarray(uniques, dtype=object)
+        if all(isinstance(value, str) for value in uniques):
+            encoded = [value.encode('utf-8') for value in uniques]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(value) for value in encoded], out=offsets[1:])
+            np.save(f"{prefix}.dict.npy", np.frombuffer(b''.join(encoded), dtype=np.uint8))
+            np.save(f"{prefix}.offsets.npy", offsets)
+            return {'kind': 'string'}
+
+        np.save(f"{prefix}.objects.npy", uniques, allow_pickle=True)
+        return {'kind': 'object'}
+
+    def _read_column(self, table: str, position: int, meta: Dict[str, Any]) -> Any:
+        """以内存映射方式读取一列"""
+        prefix = os.path.join(self.version_dir, table, str(position))
+        kind = meta['kind']
+        if kind == 'numeric':
+            return _mmap(f"{prefix}.npy")
+        if kind == 'masked':
+            array_type = pd.api.types.pandas_dtype(meta['dtype']).construct_array_type()
+            return array_type(_mmap(f"{prefix}.values.npy"),
+                              _mmap(f"{prefix}.mask.npy"))
+        if kind == 'category':
+            return pd.Categorical.from_codes(
+                _mmap(f"{prefix}.codes.npy"),
+                dtype=pd.CategoricalDtype(meta['categories'])
+            )
+
+        if kind == 'string':
+            buffer = _mmap(f"{prefix}.dict.npy")
+            offsets = _mmap(f"{prefix}.offsets.npy")
+            data = buffer.tobytes()
+            uniques = [data[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+        else:
+            uniques = list(np.load(f"{prefix}.objects.npy", allow_pickle=True))
+        # 以映射的编码（-1为缺失值）直接构造分类数组，字典在进程内只有一份，编码只读
+        codes = _mmap(f"{prefix}.codes.npy")
+        codes = codes.astype(_codes_dtype(len(uniques)), copy=False)
+        return pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(pd.Index(uniques, dtype=object)))
+
+    def column(self, table: str, name: str) -> Any:
+        """
+        读取一列，进程内缓存读取结果
+
+        Args:
+            table: 表名
+            name: 列名
+
+        Returns:
+            列数据（内存映射数组或扩展数组），不存在时返回None
+        """
+        key = (table, name)
+        if key not in self._columns:
+            with self._lock:
+                if key not in self._columns:
+                    columns = self.manifest.get('tables', {}).get(table, {}).get('columns', [])
+                    self._columns[key] = next(
+                        (self._read_column(table, position, meta)
+                         for position, meta in enumerate(columns) if meta['name'] == name),
+                        None
+                    )
+        return self._columns[key]
+
+    def read(self, table: str, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        读取一张数据表
+
+        Args:
+            table: 表名
+            columns: 需要的列，为None时读取全部列
+
+        Returns:
+            由内存映射列组成的DataFrame（不复制数据），缓存中不存在的列忽略，表不存在时为空
+        """
+        meta = self.manifest.get('tables', {}).get(table)
+        if meta is None:
+            return pd.DataFrame()
+
+        wanted = None if columns is None else set(columns)
+        names = [column['name'] for column in meta['columns'] if wanted is None or column['name'] in wanted]
+        frame = pd.DataFrame({name: self.column(table, name) for name in names},
+                             index=pd.RangeIndex(meta['rows']), copy=False)
+        logger.debug(f"读取列式缓存 {table}: {len(frame)} 行, 列 {names}")
+        return frame
+
+_stores: Dict[str, Tuple[Any, ColumnarStore]] = {}
+_stores_lock = threading.Lock()
+
+def get_columnar_store(directory: str) -> Optional[ColumnarStore]:
+    """
+    获取进程内共享的列式缓存，缓存被重新写入后重新打开
+
+    Args:
+        directory: 缓存目录
+
+    Returns:
+        列式缓存，尚未写入时返回None
+    """
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        return None
+    version = os.stat(manifest_path).st_mtime_ns
+
+    key = os.path.abspath(directory)
+    with _stores_lock:
+        cached = _stores.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, ColumnarStore(directory))
+            _stores[key] = cached
+        return cached[1]
+
+def columnar_dir(processed_dir: str) -> str:
+    """
+    处理结果目录下的列式缓存目录
+
+    Args:
+        processed_dir: 处理结果目录
+
+    Returns:
+        缓存目录
+    """
+    return os.path.join(processed_dir, COLUMNAR_CONFIG.get('dirname', 'columns'))
\ No newline at end of file
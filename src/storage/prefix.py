@@ -0,0 +1,177 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+import numpy as np
+from loguru import logger
+
+from config.config import PREFIX_CONFIG
+from processor.resolver import EntityResolver
+
+# 大于任何字符的哨兵，前缀 p 的匹配范围为 [p, p + 哨兵)
+_MAX_CHAR = '\U0010ffff'
+
+def pinyin_initials(text: str) -> Optional[str]:
+    """
+    获取文本的拼音首字母
+
+    Args:
+        text: 原始文本
+
+    Returns:
+        小写拼音首字母串，未安装 pypinyin 时返回None
+    """
+    try:
+        from pypinyin import lazy_pinyin, Style
+    except ImportError:
+        return None
+    initials = ''.join(lazy_pinyin(text, style=Style.FIRST_LETTER, errors='ignore')).lower()
+    return initials or None
+
+class PrefixIndex:
+    """前缀补全索引类
+
+    名称规范化（与实体消解一致）后作为键排序保存，查询时二分查找出前缀匹配的连续区间，
+    再在区间内按获奖次数取前K个。可选同时以拼音首字母为键（需要安装 pypinyin）。
+    名称本身只保存一份，键数组只保存指向名称的下标。
+    """
+
+    def __init__(self, names: Iterable[str], counts: Iterable[int], pinyin: Optional[bool] = None):
+        """
+        构建前缀索引
+
+        Args:
+            names: 显示名称（不重复）
+            counts: 与名称对齐的获奖次数（获奖的奖项数）
+            pinyin: 是否以拼音首字母为键，默认读取 PREFIX_CONFIG
+        """
+        self.names = list(names)
+        self.counts = np.asarray(list(counts), dtype=np.int64)
+        pinyin = PREFIX_CONFIG.get('pinyin', False) if pinyin is None else pinyin
+        self.pinyin = False
+
+        keyed = []
+        for position, name in enumerate(self.names):
+            key = EntityResolver.normalize_organization(name)
+            if key:
+                keyed.append((key, position))
+        if pinyin:
+            if pinyin_initials('测试') is None:
+                logger.warning("未安装pypinyin，拼音首字母补全不可用")
+            else:
+                for position, name in enumerate(self.names):
+                    key = pinyin_initials(name)
+                    if key:
+                        keyed.append((key, position))
+                self.pinyin = True
+
+        keyed.sort()
+        self.keys = [key for key, _ in keyed]
+        self.positions = np.fromiter((position for _, position in keyed), dtype=np.int64, count=len(keyed))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def complete(self, prefix: str, top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        前缀补全
+
+        Args:
+            prefix: 输入的前缀（名称或拼音首字母）
+            top_k: 返回个数，默认读取 PREFIX_CONFIG，限制在 [1, max_top_k] 内
+
+        Returns:
+            [{'name': 名称, 'count': 获奖次数}, ...]，按获奖次数降序，次数相同时按名称排序
+        """
+        if top_k is None:
+            top_k = PREFIX_CONFIG.get('top_k', 10)
+        top_k = min(max(int(top_k), 1), PREFIX_CONFIG.get('max_top_k', 50))
+        key = EntityResolver.normalize_organization(prefix)
+        if not key:
+            return []
+
+        lo = bisect_left(self.keys, key)
+        hi = bisect_left(self.keys, key + _MAX_CHAR, lo)
+        if lo >= hi:
+            return []
+
+        # 同一名称可能同时以名称和拼音命中，去重后再取前K个
+        positions = self.positions[lo:hi]
+        if self.pinyin:
+            positions = np.unique(positions)
+        counts = self.counts[positions]
+        if len(positions) > top_k:
+            keep = np.argpartition(-counts, top_k - 1)[:top_k]
+            threshold = counts[keep].min()
+            candidates = positions[counts >= threshold]
+        else:
+            candidates = positions
+
+        ranked = sorted(candidates.tolist(), key=lambda p: (-self.counts[p], self.names[p]))[:top_k]
+        return [{'name': self.names[p], 'count': int(self.counts[p])} for p in ranked]
+
+    @classmethod
+    def from_store(cls, store, kind: str) -> 'PrefixIndex':
+        """
+        从奖项数据库构建索引
+
+        获奖次数按奖项计：同一奖项中出现多次（多个项目，或同时作为项目和获奖人的所属机构）只计一次。
+
+        Args:
+            store: 奖项数据库（AwardStore）
+            kind: 名称类型（winner/organization）
+
+        Returns:
+            前缀索引
+        """
+        sql = {
+            'winner': """
+                SELECT w.name, COUNT(DISTINCT p.award_id) FROM winners w
+                JOIN projects p ON p.id = w.project_id
+                WHERE w.name IS NOT NULL
+                GROUP BY w.name
+            """,
+            'organization': """
+                SELECT o.name, COUNT(DISTINCT r.award_id) FROM (
+                    SELECT award_id, organization_id FROM projects
+                    UNION ALL
+                    SELECT p.award_id, w.organization_id FROM winners w
+                    JOIN projects p ON p.id = w.project_id
+                ) r JOIN organizations o ON o.id = r.organization_id
+                GROUP BY o.name
+            """
+        }
+        if kind not in sql:
+            raise ValueError(f"不支持的补全类型: {kind}")
+
+        with store.connect() as conn:
+            rows = conn.execute(sql[kind]).fetchall()
+        names = [name for name, _ in rows]
+        return cls(names, [count for _, count in rows])
+
+_indexes: Dict[Tuple[str, str], Tuple[int, PrefixIndex]] = {}
+_indexes_lock = threading.Lock()
+
+def get_prefix_index(store, kind: str) -> PrefixIndex:
+    """
+    获取进程内缓存的前缀索引，数据库内容变化后重新构建
+
+    以数据库的写入计数判断是否过期，原地替换已有奖项后同样重新构建。
+
+    Args:
+        store: 奖项数据库（AwardStore）
+        kind: 名称类型（winner/organization）
+
+    Returns:
+        前缀索引
+    """
+    version = store.data_version()
+
+    cache_key = (store.db_path, kind)
+    with _indexes_lock:
+        cached = _indexes.get(cache_key)
+        if cached is None or cached[0] != version:
+            index = PrefixIndex.from_store(store, kind)
+            _indexes[cache_key] = (version, index)
+            logger.info(f"前缀索引已构建: {kind} {len(index)} 个名称")
+            cached = _indexes[cache_key]
+        return cached[1]
\ No newline at end of file
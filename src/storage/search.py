@@ -0,0 +1,274 @@
+import sqlite3
+import time
+from typing import Dict, Any, Optional, Iterable
+from loguru import logger
+
+from config.config import SEARCH_CONFIG
+
+# 全文索引：FTS5保存分词后的文本及位置信息，search_docs 记录每个文档所属的奖项，便于按奖项增量更新。
+# chars 列逐字索引名称和机构，按位置做短语匹配，可检索分词时未切出的片段（如人名的一部分）
+SEARCH_SCHEMA_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+    kind UNINDEXED,
+    ref_id UNINDEXED,
+    award_id UNINDEXED,
+    label UNINDEXED,
+    org_label UNINDEXED,
+    name,
+    organization,
+    chars,
+    tokenize = 'unicode61'
+);
+
+CREATE TABLE IF NOT EXISTS search_docs (
+    rowid INTEGER PRIMARY KEY,
+    award_id INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_search_docs_award ON search_docs(award_id);
+"""
+
+# 可检索的文档类型
+SEARCH_KINDS = ['award', 'project', 'winner']
+
+def tokenize(text: Optional[str]) -> str:
+    """
+    将文本切分为以空格分隔的检索词
+
+    使用jieba的搜索引擎模式，长词同时输出其中的短词，提高召回。
+
+    Args:
+        text: 原始文本
+
+    Returns:
+        空格分隔的小写检索词
+    """
+    import jieba
+
+    if not text:
+        return ''
+    return ' '.join(token.lower() for token in jieba.cut_for_search(str(text)) if token.strip())
+
+def split_chars(*texts: Optional[str]) -> str:
+    """
+    将文本拆为以空格分隔的单字，用于逐字短语匹配
+
+    Args:
+        *texts: 原始文本
+
+    Returns:
+        空格分隔的小写单字
+    """
+    return ' '.join(ch for text in texts if text for ch in str(text).lower() if not ch.isspace())
+
+class SearchIndex:
+    """全文检索类
+
+    在奖项数据库中以 SQLite FTS5 建立倒排索引，文档为奖项标题、项目名称、获奖人，
+    每个文档同时索引所属机构。文本先经jieba分词再写入，查询词使用相同的分词，
+    结果按BM25排序并分页返回。
+    AwardStore 写入数据时在同一事务中重建所写奖项的文档，索引随数据增量更新；
+    建立索引之前写入的数据由 rebuild/backfill 显式补建。
+    """
+
+    def __init__(self, store=None):
+        """
+        初始化全文检索
+
+        Args:
+            store: 奖项数据库（AwardStore），默认使用 STORAGE_CONFIG 中的数据库
+        """
+        if store is None:
+            from .sqlite import AwardStore
+            store = AwardStore()
+        self.store = store
+        self.weights = SEARCH_CONFIG.get('weights', {'name': 1.0, 'organization': 0.5, 'chars': 0.2})
+
+    @staticmethod
+    def ensure_schema(conn: sqlite3.Connection) -> None:
+        """创建索引表"""
+        conn.executescript(SEARCH_SCHEMA_SQL)
+
+    @classmethod
+    def index_awards(cls, conn: sqlite3.Connection, award_ids: Iterable[int]) -> int:
+        """
+        重建指定奖项的索引文档
+
+        Args:
+            conn: 数据库连接（调用方的事务内）
+            award_ids: 奖项主键
+
+        Returns:
+            写入的文档数
+        """
+        award_ids = list(award_ids)
+        batch_size = SEARCH_CONFIG.get('batch_size', 500)
+        count = 0
+        for start in range(0, len(award_ids), batch_size):
+            batch = award_ids[start:start + batch_size]
+            placeholders = ', '.join('?' * len(batch))
+
+            conn.execute(f"""
+                DELETE FROM search_index WHERE rowid IN (
+                    SELECT rowid FROM search_docs WHERE award_id IN ({placeholders})
+                )
+            """, batch)
+            conn.execute(f'DELETE FROM search_docs WHERE award_id IN ({placeholders})', batch)
+
+            rows = conn.execute(f"""
+                SELECT 'award', a.id, a.id, a.title, NULL FROM awards a
+                WHERE a.id IN ({placeholders})
+                UNION ALL
+                SELECT 'project', p.id, p.award_id, p.name, o.name FROM projects p
+                LEFT JOIN organizations o ON o.id = p.organization_id
+                WHERE p.award_id IN ({placeholders})
+                UNION ALL
+                SELECT 'winner', w.id, p.award_id, w.name, o.name FROM winners w
+                JOIN projects p ON p.id = w.project_id
+                LEFT JOIN organizations o ON o.id = w.organization_id
+                WHERE p.award_id IN ({placeholders})
+            """, batch * 3).fetchall()
+            rows = [row for row in rows if row[3] or row[4]]
+            if not rows:
+                continue
+
+            first_rowid = conn.execute('SELECT COALESCE(MAX(rowid), 0) + 1 FROM search_docs').fetchone()[0]
+            conn.executemany(
+                'INSERT INTO search_docs (rowid, award_id) VALUES (?, ?)',
+                [(first_rowid + i, row[2]) for i, row in enumerate(rows)]
+            )
+            conn.executemany(
+                """
+                INSERT INTO search_index (rowid, kind, ref_id, award_id, label, org_label, name, organization, chars)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (first_rowid + i, kind, ref_id, award_id, label, org_label,
+                     tokenize(label), tokenize(org_label), split_chars(label, org_label))
+                    for i, (kind, ref_id, award_id, label, org_label) in enumerate(rows)
+                ]
+            )
+            count += len(rows)
+        return count
+
+    def rebuild(self) -> int:
+        """
+        重建全部索引
+
+        Returns:
+            写入的文档数
+        """
+        try:
+            with self.store.connect() as conn:
+                conn.execute('BEGIN IMMEDIATE')
+                conn.execute('DELETE FROM search_index')
+                conn.execute('DELETE FROM search_docs')
+                award_ids = [row[0] for row in conn.execute('SELECT id FROM awards ORDER BY id')]
+                count = self.index_awards(conn, award_ids)
+
+            logger.info(f"全文索引重建完成: {count} 个文档")
+            return count
+
+        except Exception as e:
+            logger.error(f"重建全文索引失败: {str(e)}")
+            return 0
+
+    def backfill(self) -> int:
+        """
+        数据库中已有奖项而索引为空时（如建立索引之前的数据库）补建索引
+
+        分词较慢，应在后台线程或离线任务中调用，不要放在请求路径上。
+
+        Returns:
+            写入的文档数，无需补建时为0
+        """
+        try:
+            with self.store.connect() as conn:
+                missing = conn.execute("""
+                    SELECT NOT EXISTS (SELECT 1 FROM search_docs) AND EXISTS (SELECT 1 FROM awards)
+                """).fetchone()[0]
+            return self.rebuild() if missing else 0
+
+        except Exception as e:
+            logger.error(f"补建全文索引失败: {str(e)}")
+            return 0
+
+    def search(self, query: str, kind: Optional[str] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """
+        全文检索
+
+        Args:
+            query: 查询文本，分词后的各词全部出现在名称或机构中，或以空格分隔的各片段逐字出现
+            kind: 文档类型（award/project/winner），为空时检索全部
+            limit: 每页条数
+            offset: 偏移量
+
+        Returns:
+            {'total': 命中总数, 'hits': 命中列表, 'took_ms': 耗时}，按相关度排序
+        """
+        started = time.perf_counter()
+        result = {'total': 0, 'hits': [], 'took_ms': 0.0}
+        try:
+            if kind and kind not in SEARCH_KINDS:
+                raise ValueError(f"不支持的文档类型: {kind}")
+
+            expression = self._match_expression(query)
+            if not expression:
+                return result
+
+            where = 'search_index MATCH ?'
+            params = [expression]
+            if kind:
+                where += ' AND s.kind = ?'
+                params.append(kind)
+
+            limit = max(1, min(int(limit), SEARCH_CONFIG.get('max_limit', 100)))
+            with self.store.connect() as conn:
+                result['total'] = conn.execute(
+                    f'SELECT COUNT(*) FROM search_index s WHERE {where}', params
+                ).fetchone()[0]
+                rows = conn.execute(f"""
+                    SELECT s.kind, s.ref_id, s.award_id, s.label, s.org_label,
+                           a.title, a.year, a.award_type, a.award_level,
+                           bm25(search_index, 0, 0, 0, 0, 0, ?, ?, ?) AS score
+                    FROM search_index s
+                    LEFT JOIN awards a ON a.id = s.award_id
+                    WHERE {where}
+                    ORDER BY score
+                    LIMIT ? OFFSET ?
+                """, [self.weights.get('name', 1.0), self.weights.get('organization', 0.5), self.weights.get('chars', 0.2)]
+                     + params + [limit, max(0, int(offset))]).fetchall()
+
+            columns = ['kind', 'id', 'award_id', 'name', 'organization',
+                       'award_title', 'year', 'award_type', 'award_level', 'score']
+            # bm25 分数越小越相关，输出时取负值使分数越大越相关
+            result['hits'] = [dict(zip(columns, row[:-1] + (-row[-1],))) for row in rows]
+            return result
+
+        except Exception as e:
+            logger.error(f"全文检索失败: {str(e)}")
+            return result
+
+        finally:
+            result['took_ms'] = round((time.perf_counter() - started) * 1000, 2)
+
+    @staticmethod
+    def _match_expression(query: str) -> str:
+        """
+        将查询文本转为FTS5表达式
+
+        分词后的各词须全部出现在名称或机构中，或者查询的每个片段按顺序逐字出现；
+        每个词和短语都加引号，避免被解析为运算符。
+        """
+        def quote(text: str) -> str:
+            return '"' + text.replace('"', '""') + '"'
+
+        words = list(dict.fromkeys(tokenize(query).split()))
+        phrases = [split_chars(segment) for segment in query.split()]
+        phrases = [phrase for phrase in phrases if phrase]
+        if not words or not phrases:
+            return ''
+        return (
+            f"({{name organization}} : ({' AND '.join(quote(word) for word in words)})) "
+            f"OR (chars : ({' AND '.join(quote(phrase) for phrase in phrases)}))"
+        )
\ No newline at end of file
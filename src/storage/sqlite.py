@@ -0,0 +1,618 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+import pandas as pd
+from loguru import logger
+
+from config.config import STORAGE_CONFIG, CHUNKED_CONFIG
+from processor.schema import DataSchema
+from .search import SearchIndex
+
+# 表结构：整数代理主键，子表通过外键关联，删除奖项时级联删除项目和获奖人
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS organizations (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS awards (
+    id INTEGER PRIMARY KEY,
+    award_key TEXT NOT NULL UNIQUE,
+    title TEXT,
+    content TEXT,
+    year INTEGER,
+    award_level TEXT,
+    award_type TEXT,
+    source_url TEXT,
+    source_title TEXT,
+    source_engine TEXT,
+    crawled_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    award_id INTEGER NOT NULL REFERENCES awards(id) ON DELETE CASCADE,
+    name TEXT,
+    organization_id INTEGER REFERENCES organizations(id),
+    level TEXT
+);
+
+CREATE TABLE IF NOT EXISTS winners (
+    id INTEGER PRIMARY KEY,
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    name TEXT,
+    organization_id INTEGER REFERENCES organizations(id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_awards_year ON awards(year);
+CREATE INDEX IF NOT EXISTS idx_awards_type ON awards(award_type);
+CREATE INDEX IF NOT EXISTS idx_awards_level ON awards(award_level);
+CREATE INDEX IF NOT EXISTS idx_projects_award ON projects(award_id);
+CREATE INDEX IF NOT EXISTS idx_projects_level ON projects(level);
+CREATE INDEX IF NOT EXISTS idx_projects_org ON projects(organization_id);
+CREATE INDEX IF NOT EXISTS idx_winners_project ON winners(project_id);
+CREATE INDEX IF NOT EXISTS idx_winners_name ON winners(name);
+CREATE INDEX IF NOT EXISTS idx_winners_org ON winners(organization_id);
+
+-- 元数据：data_version 为写入计数，每次写入事务加一，只增不减
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# 奖项表中可写入的字段（award_key 以外）
+AWARD_COLUMNS = [
+    'title', 'content', 'year', 'award_level', 'award_type',
+    'source_url', 'source_title', 'source_engine', 'crawled_at'
+]
+
+# 奖项表支持的过滤条件
+AWARD_FILTERS = ['year', 'award_type', 'award_level']
+
+# 加载各数据表的查询：(主键列, 查询列, FROM子句)，列与 DataTransformer.to_dataframe 一致，按主键顺序读取
+FRAME_QUERIES = {
+    'awards': (
+        'a.id',
+        f"a.id AS award_id, a.{', a.'.join(AWARD_COLUMNS)}",
+        "FROM awards a"
+    ),
+    'projects': (
+        'p.id',
+        "p.id AS project_id, p.award_id, a.title AS award_title, a.year, p.name, o.name AS organization, p.level",
+        """FROM projects p
+        JOIN awards a ON a.id = p.award_id
+        LEFT JOIN organizations o ON o.id = p.organization_id"""
+    ),
+    'winners': (
+        'w.id',
+        "w.project_id, p.name AS project_name, w.name, o.name AS organization",
+        """FROM winners w
+        JOIN projects p ON p.id = w.project_id
+        JOIN awards a ON a.id = p.award_id
+        LEFT JOIN organizations o ON o.id = w.organization_id"""
+    )
+}
+
+# 本进程中已创建表结构的数据库文件
+_initialized = set()
+_initialized_lock = threading.Lock()
+
+class AwardStore:
+    """SQLite奖项数据存储类
+
+    以规范化的 awards/projects/winners/organizations 四张表保存清理后的数据，
+    奖项以 source_url（缺失时为标题）作为业务键批量写入：已存在的奖项更新字段，
+    其下的项目和获奖人整体替换。分析器和Web接口可以按年份、类型、等级等条件
+    直接查询，不必读取整个数据文件。
+    """
+
+    def __init__(self, db_path: Optional[str] = None, batch_size: Optional[int] = None):
+        """
+        初始化存储
+
+        Args:
+            db_path: 数据库文件路径，默认读取 STORAGE_CONFIG
+            batch_size: 每批写入/查询的记录数，默认读取 STORAGE_CONFIG
+        """
+        self.db_path = db_path or STORAGE_CONFIG.get('db_path', 'data/awards.db')
+        self.batch_size = batch_size or STORAGE_CONFIG.get('batch_size', 500)
+
+        directory = os.path.dirname(self.db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        # 每个进程对同一数据库只建一次表，之后的实例直接复用
+        path = os.path.abspath(self.db_path)
+        with _initialized_lock:
+            if path not in _initialized or not os.path.exists(path):
+                with self.connect() as conn:
+                    conn.executescript(SCHEMA_SQL)
+                    SearchIndex.ensure_schema(conn)
+                _initialized.add(path)
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        打开数据库连接，退出时提交事务，出错时回滚
+
+        Yields:
+            数据库连接
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute('PRAGMA foreign_keys = ON')
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA synchronous = NORMAL')
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    @contextmanager
+    def snapshot(self) -> Iterator[sqlite3.Connection]:
+        """
+        打开读事务，事务内的多次查询读取同一份数据快照
+
+        WAL 模式下读事务不阻塞写入，事务期间其他连接提交的写入不可见。
+
+        Yields:
+            处于读事务中的数据库连接
+        """
+        with self.connect() as conn:
+            # BEGIN 推迟到第一次读取时才建立快照，立即读取一次以固定快照
+            conn.execute('BEGIN')
+            conn.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()
+            yield conn
+
+    def upsert_records(self, data: List[Dict[str, Any]]) -> int:
+        """
+        批量写入清理后的奖项数据
+
+        Args:
+            data: 清理后的奖项数据列表（包含嵌套的 projects/winners）
+
+        Returns:
+            写入的奖项数量
+        """
+        try:
+            # 同一批中业务键重复时保留最后一条
+            records = {}
+            for item in data:
+                key = self.award_key(item)
+                if key:
+                    records[key] = item
+
+            awards = {key: [item.get(column) for column in AWARD_COLUMNS] for key, item in records.items()}
+            projects = []
+            winners = []
+            for key, item in records.items():
+                for project in item.get('projects') or []:
+                    projects.append((key, project.get('name'), project.get('organization'), project.get('level')))
+                    for winner in project.get('winners') or []:
+                        winners.append((len(projects) - 1, winner.get('name'), winner.get('organization')))
+
+            return self._write(awards, projects, winners)
+
+        except Exception as e:
+            logger.error(f"写入数据库失败: {str(e)}")
+            return 0
+
+    def upsert_frames(self, data: Dict[str, pd.DataFrame]) -> int:
+        """
+        批量写入清理后的扁平表
+
+        写入内容与对同一批数据调用 upsert_records 相同，批量清洗直接输出扁平表时
+        不必再构建嵌套字典。
+
+        Args:
+            data: 包含awards/projects/winners的DataFrame字典，按 award_id/project_id 关联
+
+        Returns:
+            写入的奖项数量
+        """
+        try:
+            awards_df = self._plain(data.get('awards'), ['award_id'] + AWARD_COLUMNS)
+            projects_df = self._plain(data.get('projects'), ['project_id', 'award_id', 'name', 'organization', 'level'])
+            winners_df = self._plain(data.get('winners'), ['project_id', 'name', 'organization'])
+
+            # 同一批中业务键重复时保留最后一条，位置与 upsert_records 一样取第一次出现的位置
+            awards = {}
+            award_keys = {}
+            for award_id, *values in awards_df.itertuples(index=False, name=None):
+                key = self.award_key(dict(zip(AWARD_COLUMNS, values)))
+                if key:
+                    awards[key] = values
+                    award_keys[key] = award_id
+            owners = {award_id: key for key, award_id in award_keys.items()}
+            positions = {key: i for i, key in enumerate(awards)}
+
+            projects = []
+            project_ids = []
+            for project_id, award_id, name, organization, level in projects_df.itertuples(index=False, name=None):
+                key = owners.get(award_id)
+                if key is not None:
+                    projects.append((key, name, organization, level))
+                    project_ids.append(project_id)
+            order = sorted(range(len(projects)), key=lambda i: positions[projects[i][0]])
+            projects = [projects[i] for i in order]
+            project_index = {project_ids[i]: n for n, i in enumerate(order)}
+
+            winners = [
+                (project_index[project_id], name, organization)
+                for project_id, name, organization in winners_df.itertuples(index=False, name=None)
+                if project_id in project_index
+            ]
+            winners.sort(key=lambda winner: winner[0])
+
+            return self._write(awards, projects, winners)
+
+        except Exception as e:
+            logger.error(f"写入数据库失败: {str(e)}")
+            return 0
+
+    def _write(self, awards: Dict[str, List[Any]], projects: List[Tuple[Any, ...]],
+               winners: List[Tuple[Any, ...]]) -> int:
+        """
+        在一个写事务中写入奖项，并整体替换其下的项目和获奖人
+
+        Args:
+            awards: 业务键 -> AWARD_COLUMNS 对应的取值
+            projects: (业务键, 项目名称, 机构名称, 等级) 列表
+            winners: (项目在 projects 中的位置, 姓名, 机构名称) 列表
+
+        Returns:
+            写入的奖项数量
+        """
+        if not awards:
+            return 0
+
+        with self.connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+
+            names = {project[2] for project in projects} | {winner[2] for winner in winners}
+            org_ids = self._upsert_organizations(conn, names)
+
+            conn.executemany(
+                f"""
+                INSERT INTO awards (award_key, {', '.join(AWARD_COLUMNS)})
+                VALUES (?, {', '.join('?' * len(AWARD_COLUMNS))})
+                ON CONFLICT(award_key) DO UPDATE SET
+                {', '.join(f'{column} = excluded.{column}' for column in AWARD_COLUMNS)}
+                """,
+                [[key] + list(values) for key, values in awards.items()]
+            )
+            award_ids = self._select_ids(conn, 'awards', 'award_key', list(awards))
+
+            # 替换奖项下的项目和获奖人（级联删除获奖人）
+            conn.executemany(
+                'DELETE FROM projects WHERE award_id = ?',
+                [(award_id,) for award_id in award_ids.values()]
+            )
+
+            # 在写锁内预先分配项目主键，获奖人可直接引用
+            first_project_id = conn.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM projects').fetchone()[0]
+            conn.executemany(
+                'INSERT INTO projects (id, award_id, name, organization_id, level) VALUES (?, ?, ?, ?, ?)',
+                [
+                    (first_project_id + i, award_ids[key], name, org_ids.get(organization), level)
+                    for i, (key, name, organization, level) in enumerate(projects)
+                ]
+            )
+            conn.executemany(
+                'INSERT INTO winners (project_id, name, organization_id) VALUES (?, ?, ?)',
+                [
+                    (first_project_id + index, name, org_ids.get(organization))
+                    for index, name, organization in winners
+                ]
+            )
+
+            # 在同一事务中更新这些奖项的全文索引
+            SearchIndex.index_awards(conn, award_ids.values())
+
+            # 写入计数加一，基于数据库构建的缓存据此判断是否过期
+            conn.execute("""
+                INSERT INTO meta (key, value) VALUES ('data_version', 1)
+                ON CONFLICT(key) DO UPDATE SET value = value + 1
+            """)
+
+        logger.info(
+            f"数据已写入数据库: {len(awards)} 条奖项, {len(projects)} 个项目, "
+            f"{len(winners)} 名获奖人"
+        )
+        return len(awards)
+
+    @staticmethod
+    def _plain(df: Optional[pd.DataFrame], columns: List[str]) -> pd.DataFrame:
+        """取出指定列并转换为Python原生取值，缺失值为None"""
+        if not isinstance(df, pd.DataFrame) or df.empty:
+            return pd.DataFrame(columns=columns)
+        df = df.reindex(columns=columns)
+        return df.astype(object).where(df.notna(), None)
+
+    def query_awards(self, limit: Optional[int] = None, offset: int = 0, **filters) -> pd.DataFrame:
+        """
+        按条件查询奖项
+
+        Args:
+            limit: 返回条数上限
+            offset: 偏移量
+            **filters: 过滤条件（year/award_type/award_level）
+
+        Returns:
+            奖项DataFrame
+        """
+        try:
+            where, params = self._where(filters, 'a')
+            sql = f"""
+                SELECT a.id AS award_id, a.{', a.'.join(AWARD_COLUMNS)}
+                FROM awards a {where}
+                ORDER BY a.id
+            """
+            if limit is not None:
+                sql += ' LIMIT ? OFFSET ?'
+                params += [int(limit), int(offset)]
+
+            with self.connect() as conn:
+                awards_df = pd.read_sql_query(sql, conn, params=params)
+            return DataSchema.apply_frame(awards_df, 'awards')
+
+        except Exception as e:
+            logger.error(f"查询奖项失败: {str(e)}")
+            return pd.DataFrame()
+
+    def count_awards(self, **filters) -> int:
+        """
+        按条件统计奖项数量
+
+        Args:
+            **filters: 过滤条件（year/award_type/award_level）
+
+        Returns:
+            奖项数量
+        """
+        try:
+            where, params = self._where(filters, 'a')
+            with self.connect() as conn:
+                return conn.execute(f"SELECT COUNT(*) FROM awards a {where}", params).fetchone()[0]
+
+        except Exception as e:
+            logger.error(f"统计奖项数量失败: {str(e)}")
+            return 0
+
+    def load_frames(self, **filters) -> Dict[str, pd.DataFrame]:
+        """
+        按条件加载奖项、项目、获奖人表
+
+        返回的DataFrame与 DataTransformer.to_dataframe 的列一致，并附带代理主键。
+
+        Args:
+            **filters: 过滤条件（year/award_type/award_level）
+
+        Returns:
+            包含多个DataFrame的字典
+        """
+        try:
+            where, params = self._where(filters, 'a')
+            data = {}
+            with self.connect() as conn:
+                for table, (key, columns, source) in FRAME_QUERIES.items():
+                    data[table] = pd.read_sql_query(
+                        f"SELECT {columns} {source} {where} ORDER BY {key}", conn, params=params
+                    )
+
+            return DataSchema.apply(data)
+
+        except Exception as e:
+            logger.error(f"从数据库加载数据失败: {str(e)}")
+            return {
+                'awards': pd.DataFrame(),
+                'projects': pd.DataFrame(),
+                'winners': pd.DataFrame()
+            }
+
+    def iter_frames(self, table: str, chunk_size: Optional[int] = None,
+                    conn: Optional[sqlite3.Connection] = None, **filters) -> Iterator[pd.DataFrame]:
+        """
+        按主键顺序分块读取一张数据表
+
+        以主键分页（WHERE 主键 > 上一块的最大主键），每块最多读取 chunk_size 行，
+        依次拼接的结果与 load_frames 中的同名表一致。获奖人表不在同一项目中间分块，
+        保证同一项目的获奖人位于同一块。全部分块在同一个读事务中读取，
+        读取期间的写入不会使各块来自不同的数据版本。
+
+        Args:
+            table: 表名（awards/projects/winners）
+            chunk_size: 每块行数，默认读取 CHUNKED_CONFIG
+            conn: 处于读事务中的连接（见 snapshot），多张表需读取同一快照时传入，默认新建
+            **filters: 过滤条件（year/award_type/award_level）
+
+        Yields:
+            应用了数据类型模式的DataFrame
+        """
+        if table not in FRAME_QUERIES:
+            raise ValueError(f"不支持的数据表: {table}")
+        key, columns, source = FRAME_QUERIES[table]
+        chunk_size = chunk_size or CHUNKED_CONFIG.get('chunk_size', 5000)
+        where, params = self._where(filters, 'a')
+        where = f"{where} AND" if where else "WHERE"
+
+        if conn is None:
+            with self.snapshot() as conn:
+                yield from self.iter_frames(table, chunk_size, conn, **filters)
+            return
+
+        last_key = None
+        while True:
+            keyset = f"{key} > ?" if last_key is not None else "1 = 1"
+            chunk = pd.read_sql_query(
+                f"SELECT {key} AS chunk_key, {columns} {source} {where} {keyset} ORDER BY {key} LIMIT ?",
+                conn, params=params + ([last_key] if last_key is not None else []) + [chunk_size]
+            )
+            if len(chunk) == chunk_size and table == 'winners':
+                # 补齐最后一个项目的其余获奖人
+                rest = pd.read_sql_query(
+                    f"SELECT {key} AS chunk_key, {columns} {source} {where} {key} > ? AND w.project_id = ? ORDER BY {key}",
+                    conn, params=params + [int(chunk['chunk_key'].iloc[-1]), int(chunk['project_id'].iloc[-1])]
+                )
+                if not rest.empty:
+                    chunk = pd.concat([chunk, rest], ignore_index=True)
+            if chunk.empty:
+                return
+
+            last_key = int(chunk['chunk_key'].iloc[-1])
+            yield DataSchema.apply_frame(chunk.drop(columns='chunk_key'), table)
+            if len(chunk) < chunk_size:
+                return
+
+    def collaboration_stats(self, conn: Optional[sqlite3.Connection] = None, **filters) -> Dict[str, int]:
+        """
+        按项目名称统计参与机构数，得到单机构、多机构项目数及最多参与机构数
+
+        分组在数据库中完成，结果与 AwardAnalyzer.get_collaboration_analysis 中的
+        collaboration_stats 一致。
+
+        Args:
+            conn: 处于读事务中的连接（见 snapshot），默认新建
+            **filters: 过滤条件（year/award_type/award_level）
+
+        Returns:
+            {'single_org': 单机构项目数, 'multi_org': 多机构项目数, 'max_orgs': 最多参与机构数}
+        """
+        try:
+            if conn is None:
+                with self.connect() as conn:
+                    return self.collaboration_stats(conn, **filters)
+
+            where, params = self._where(filters, 'a')
+            where = f"{where} AND" if where else "WHERE"
+            single, multi, most = conn.execute(f"""
+                SELECT COALESCE(SUM(n = 1), 0), COALESCE(SUM(n > 1), 0), COALESCE(MAX(n), 0)
+                FROM (
+                    SELECT COUNT(DISTINCT p.organization_id) AS n
+                    FROM projects p JOIN awards a ON a.id = p.award_id
+                    {where} p.name IS NOT NULL
+                    GROUP BY p.name
+                )
+            """, params).fetchone()
+            return {'single_org': single, 'multi_org': multi, 'max_orgs': most}
+
+        except Exception as e:
+            logger.error(f"统计多机构合作项目失败: {str(e)}")
+            return {'single_org': 0, 'multi_org': 0, 'max_orgs': 0}
+
+    def count_by(self, column: str, **filters) -> Dict[Any, int]:
+        """
+        按奖项字段分组计数
+
+        Args:
+            column: 分组字段（year/award_type/award_level）
+            **filters: 过滤条件
+
+        Returns:
+            取值 -> 奖项数量 的字典
+        """
+        try:
+            if column not in AWARD_FILTERS:
+                raise ValueError(f"不支持的分组字段: {column}")
+
+            where, params = self._where(filters, 'a')
+            with self.connect() as conn:
+                rows = conn.execute(f"""
+                    SELECT a.{column}, COUNT(*) FROM awards a {where}
+                    GROUP BY a.{column} ORDER BY a.{column}
+                """, params).fetchall()
+            return {value: count for value, count in rows if value is not None}
+
+        except Exception as e:
+            logger.error(f"分组计数失败: {str(e)}")
+            return {}
+
+    def get_summary(self) -> Dict[str, int]:
+        """
+        获取各表记录数
+
+        Returns:
+            表名 -> 记录数 的字典
+        """
+        try:
+            with self.connect() as conn:
+                return {
+                    table: conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                    for table in ('awards', 'projects', 'winners', 'organizations')
+                }
+
+        except Exception as e:
+            logger.error(f"获取数据库统计失败: {str(e)}")
+            return {}
+
+    def data_version(self) -> int:
+        """
+        获取数据版本，用于判断基于数据库构建的缓存是否过期
+
+        版本为写入计数，与数据写入在同一事务中加一。替换已有奖项时项目和获奖人
+        可能重新分配到相同的主键，因此不能用各表的最大主键判断数据是否变化。
+
+        Returns:
+            写入计数，从未写入时为0
+        """
+        with self.connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()
+        return row[0] if row else 0
+
+    @staticmethod
+    def award_key(item: Dict[str, Any]) -> Optional[str]:
+        """
+        奖项业务键：来源URL，缺失时使用标题
+
+        Args:
+            item: 奖项数据
+
+        Returns:
+            业务键
+        """
+        return item.get('source_url') or item.get('title')
+
+    def _upsert_organizations(self, conn: sqlite3.Connection, names: set) -> Dict[str, int]:
+        """写入机构名称并返回 名称 -> 主键 的映射"""
+        names = set(names)
+        names.discard(None)
+        names.discard('')
+
+        conn.executemany(
+            'INSERT OR IGNORE INTO organizations (name) VALUES (?)',
+            [(name,) for name in names]
+        )
+        return self._select_ids(conn, 'organizations', 'name', list(names))
+
+    def _select_ids(self, conn: sqlite3.Connection, table: str, column: str, values: List[Any]) -> Dict[Any, int]:
+        """分批按唯一字段查询主键"""
+        ids = {}
+        for start in range(0, len(values), self.batch_size):
+            batch = values[start:start + self.batch_size]
+            rows = conn.execute(
+                f"SELECT {column}, id FROM {table} WHERE {column} IN ({', '.join('?' * len(batch))})",
+                batch
+            ).fetchall()
+            ids.update(rows)
+        return ids
+
+    @staticmethod
+    def _where(filters: Dict[str, Any], alias: str) -> Tuple[str, List[Any]]:
+        """根据过滤条件生成WHERE子句"""
+        clauses = []
+        params = []
+        for column in AWARD_FILTERS:
+            value = filters.get(column)
+            if value is None or value == '':
+                continue
+            if column == 'year':
+                value = int(value)
+            clauses.append(f"{alias}.{column} = ?")
+            params.append(value)
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ''), params
\ No newline at end of file
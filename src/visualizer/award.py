@@ -287,10 +287,9 @@ class AwardVisualizer(BaseVisualizer):
             save_dir: 保存目录
         """
         try:
-            # 获取网络分析数据
-            network_data = self.analyzer.get_network_analysis(
-                min_weight=self.analyzer.config.get('network_min_weight', 2)
-            )
+            # 获取网络分析数据，与分析器共用同一个缓存的网络图
+            min_weight = self.analyzer.config.get('network_min_weight', 2)
+            network_data = self.analyzer.get_network_analysis(min_weight=min_weight)
             
             if not network_data:
                 return
@@ -298,18 +297,16 @@ class AwardVisualizer(BaseVisualizer):
             # 创建图形
             plt.figure(figsize=(12, 8))
             
-            # 构建网络图
-            G = nx.Graph()
+            # 近似模式下只绘制度中心性最高的节点
+            G = self.analyzer.build_network(min_weight)
             centrality = network_data['centrality']['degree']
-            
-            # 添加节点和边
-            for component in network_data['components']:
-                for node in component:
-                    G.add_node(node)
+            if network_data.get('approximate'):
+                G = G.subgraph(centrality)
             
             # 设置节点大小和颜色
-            node_size = [v * 3000 for v in centrality.values()]
-            node_color = list(centrality.values())
+            node_values = [centrality.get(node, 0) for node in G.nodes]
+            node_size = [v * 3000 for v in node_values]
+            node_color = node_values
             
             # 绘制网络图
             pos = nx.spring_layout(G)
@@ -317,6 +314,7 @@ class AwardVisualizer(BaseVisualizer):
                     node_color=node_color,
                     node_size=node_size,
                     cmap=plt.cm.viridis,
+                    labels=network_data.get('labels'),
                     with_labels=True,
                     font_size=8,
                     font_color='black')
@@ -10,6 +10,8 @@ Web展示界面模块
 
 import os
 import sys
+import threading
+import multiprocessing
 from datetime import datetime
 from flask import Flask, render_template, request, redirect, url_for, flash, send_from_directory, jsonify, send_file
 from loguru import logger
@@ -21,9 +23,18 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # 导入项目模块
 from crawler.search import SearchEngine
 from crawler.search.factory import SearchEngineFactory
-from processor.cleaner import DataCleaner
+from processor.parallel import ParallelCleaner
+from processor.dedup import DuplicateDetector
+from processor.resolver import EntityResolver
 from processor.transformer import DataTransformer
+from storage.sqlite import AwardStore
+from storage.search import SearchIndex
+from storage.prefix import get_prefix_index
+from storage.columnar import ColumnarStore, MANIFEST_FILE, columnar_dir
 from analyzer.award import AwardAnalyzer
+from analyzer.incremental import IncrementalAggregator
+from analyzer.text import get_text_service
+from analyzer.cube import DIMENSIONS, get_store_cube
 from visualizer.award import AwardVisualizer
 from reporter.award import AwardReporter
 from utils.logger import setup_logger
@@ -49,6 +60,16 @@ ensure_dir_exists("data/output")
 ensure_dir_exists("reports")
 ensure_dir_exists("reports/charts")
 
+# 后台任务只在主进程中启动（spawn启动的工作进程也会导入本模块）
+if multiprocessing.parent_process() is None:
+    # 后台预先加载分词词典，避免首次文本分析时等待
+    threading.Thread(target=get_text_service().preload, daemon=True).start()
+    # 后台为建立索引之前写入的数据补建全文索引，不阻塞请求
+    threading.Thread(target=lambda: SearchIndex().backfill(), daemon=True).start()
+
+# 数据分析页面中表示数据库数据源的选项值
+STORE_INPUT = '__store__'
+
 # 首页路由
 @app.route('/')
 def index():
@@ -101,13 +122,36 @@ def process():
             # 执行数据处理
             input_path = os.path.join("data/raw", input_file)
             
-            # 数据清洗
-            cleaner = DataCleaner()
-            cleaned_data = cleaner.clean_file(input_path)
+            # 数据清洗：批量清洗直接输出扁平表，不再构建嵌套字典
+            cleaner = ParallelCleaner()
+            dataframes = cleaner.clean_file_frames(input_path)
+            
+            # 近似重复去除，并与历史数据增量去重
+            detector = DuplicateDetector()
+            detector.load_index()
+            dataframes = detector.deduplicate_frames(dataframes)
+            detector.save_index()
+            
+            # 写入数据库
+            AwardStore().upsert_frames(dataframes)
             
-            # 数据转换
             transformer = DataTransformer()
-            dataframes = transformer.to_dataframe(cleaned_data)
+            
+            # 实体消解，为机构和获奖人分配稳定ID
+            resolver = EntityResolver()
+            resolver.load_registry()
+            dataframes = resolver.resolve(dataframes)
+            resolver.save_registry()
+            
+            # 合并到增量统计状态，只处理本批新增的奖项；
+            # 重新抓取的奖项内容有变化时，由数据库中的全部数据重建
+            aggregator = IncrementalAggregator.load()
+            if aggregator.changed_awards(dataframes):
+                aggregator = IncrementalAggregator()
+                aggregator.update(resolver.resolve(AwardStore().load_frames()))
+            else:
+                aggregator.update(dataframes)
+            aggregator.save()
             
             # 保存处理后的数据
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -119,6 +163,9 @@ def process():
             excel_path = os.path.join(output_dir, "award_data.xlsx")
             transformer.to_excel(dataframes, excel_path)
             
+            # 写入内存映射列式缓存，供分析时按列共享读取
+            ColumnarStore.write(dataframes, columnar_dir(output_dir))
+            
             flash(f"数据处理成功，结果已保存到 {output_dir}", "success")
             return redirect(url_for('process'))
             
@@ -149,13 +196,18 @@ def analyze():
                 flash("请选择输入目录", "warning")
                 return redirect(url_for('analyze'))
             
-            # 执行数据分析
-            input_path = os.path.join("data/processed", input_dir)
-            excel_path = os.path.join(input_path, "award_data.xlsx")
-            
-            # 创建分析器
+            # 创建分析器，选择数据库时直接从数据库加载
             analyzer = AwardAnalyzer()
-            analyzer.load_data(excel_path)
+            if input_dir == STORE_INPUT:
+                analyzer.load_store()
+            else:
+                # 优先读取列式缓存，旧的处理结果只有Excel文件
+                input_path = os.path.join("data/processed", input_dir)
+                cache_dir = columnar_dir(input_path)
+                if os.path.exists(os.path.join(cache_dir, MANIFEST_FILE)):
+                    analyzer.load_columns(cache_dir)
+                else:
+                    analyzer.load_data(os.path.join(input_path, "award_data.xlsx"))
             
             # 执行分析
             analyzer.analyze()
@@ -190,7 +242,8 @@ def analyze():
     output_dirs.sort(reverse=True)
     
     return render_template('analyze.html', title="数据分析", 
-                          processed_dirs=processed_dirs, output_dirs=output_dirs)
+                          processed_dirs=processed_dirs, output_dirs=output_dirs,
+                          store_input=STORE_INPUT)
 
 # 报告生成页面
 @app.route('/report', methods=['GET', 'POST'])
@@ -289,6 +342,102 @@ def api_stats(output_dir):
         logger.error(f"获取统计信息失败: {str(e)}")
         return jsonify({"success": False, "error": str(e)})
 
+# API路由 - 数据库统计信息
+@app.route('/api/store/stats')
+def api_store_stats():
+    try:
+        store = AwardStore()
+        filters = {key: request.args.get(key) for key in ('year', 'award_type', 'award_level')}
+        
+        stats = {
+            'tables': store.get_summary(),
+            'year': store.count_by('year', **filters),
+            'award_type': store.count_by('award_type', **filters),
+            'award_level': store.count_by('award_level', **filters)
+        }
+        return jsonify({"success": True, "data": stats})
+        
+    except Exception as e:
+        logger.error(f"获取数据库统计信息失败: {str(e)}")
+        return jsonify({"success": False, "error": str(e)})
+
+# API路由 - 按条件查询奖项
+@app.route('/api/store/awards')
+def api_store_awards():
+    try:
+        store = AwardStore()
+        filters = {key: request.args.get(key) for key in ('year', 'award_type', 'award_level')}
+        limit = request.args.get('limit', 50, type=int)
+        offset = request.args.get('offset', 0, type=int)
+        
+        awards_df = store.query_awards(limit=limit, offset=offset, **filters)
+        data = awards_df.astype(object).where(awards_df.notna(), None).to_dict('records')
+        return jsonify({
+            "success": True,
+            "data": data,
+            "total": store.count_awards(**filters),
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        })
+        
+    except Exception as e:
+        logger.error(f"查询奖项失败: {str(e)}")
+        return jsonify({"success": False, "error": str(e)})
+
+# API路由 - 全文检索
+@app.route('/api/search')
+def api_search():
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({"success": False, "error": "缺少查询参数q"})
+        
+        limit = request.args.get('limit', 20, type=int)
+        offset = request.args.get('offset', 0, type=int)
+        result = SearchIndex().search(query, kind=request.args.get('kind') or None, limit=limit, offset=offset)
+        return jsonify({"success": True, **result})
+        
+    except Exception as e:
+        logger.error(f"全文检索失败: {str(e)}")
+        return jsonify({"success": False, "error": str(e)})
+
+# API路由 - 获奖人、机构名称补全
+@app.route('/api/autocomplete')
+def api_autocomplete():
+    try:
+        prefix = request.args.get('q', '').strip()
+        kind = request.args.get('kind', 'winner')
+        limit = request.args.get('limit', 10, type=int)
+        
+        index = get_prefix_index(AwardStore(), kind)
+        return jsonify({"success": True, "data": index.complete(prefix, top_k=limit) if prefix else []})
+        
+    except Exception as e:
+        logger.error(f"名称补全失败: {str(e)}")
+        return jsonify({"success": False, "error": str(e)})
+
+# API路由 - 预聚合数据立方体的筛选汇总
+@app.route('/api/cube')
+def api_cube():
+    try:
+        cube = get_store_cube(AwardStore())
+        by = [column for column in request.args.get('by', '').split(',') if column]
+        
+        # 各维度的筛选取值以逗号分隔，年份范围为闭区间
+        filters = {}
+        for column in DIMENSIONS:
+            values = [value for value in request.args.get(column, '').split(',') if value]
+            if values:
+                filters[column] = [int(value) for value in values] if column == 'year' else values
+        year_range = (request.args.get('year_from', type=int), request.args.get('year_to', type=int))
+        
+        result = cube.rollup(by, year_range=year_range, **filters)
+        data = result.astype(object).where(result.notna(), None).to_dict('records')
+        return jsonify({"success": True, "data": data, "total": len(data)})
+        
+    except Exception as e:
+        logger.error(f"数据立方体查询失败: {str(e)}")
+        return jsonify({"success": False, "error": str(e)})
+
 @app.route('/network_analysis/<output_dir>')
 def network_analysis(output_dir):
     """网络分析页面"""
@@ -301,9 +450,9 @@ def network_analysis(output_dir):
         analyzer.load_results(input_path)
         
         # 获取网络分析数据
-        network_data = analyzer.get_network_analysis()
+        network_data = analyzer.get_network_analysis(min_weight=analyzer.config['network_min_weight'])
         
-        # 生成网络图
+        # 生成网络图（复用分析时构建的网络）
         charts_dir = os.path.join(input_path, "charts")
         ensure_dir_exists(charts_dir)
         
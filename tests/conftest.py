@@ -0,0 +1,57 @@
+import os
+import random
+import sys
+
+import pytest
+
+# 源码以 src 为根目录导入（与 main.py 的运行方式一致）
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from config.config import AWARD_LEVELS, AWARD_TYPES
+
+# 覆盖多个地区的机构，同一奖项的项目和获奖人常来自不同机构
+ORGANIZATIONS = [
+    '北京大学', '清华大学', '北京理工大学', '上海交通大学', '复旦大学', '浙江大学',
+    '杭州电子科技大学', '南京大学', '广州中医药大学', '深圳大学', '某某研究所'
+]
+# 词表以外的类型和等级（分类列追加为额外类别）
+EXTRA_TYPES = ['突出贡献中关村奖', '国际合作中关村奖']
+EXTRA_LEVELS = ['金奖']
+NAMES = ['张伟', '王芳', '李娜', '刘洋', '陈静', '杨磊', '赵敏', '黄勇', '周杰', '吴霞', '徐强', '孙丽']
+
+def make_records(count: int, seed: int = 0):
+    """生成与清理结果结构一致的奖项数据（含缺失的年份、类型、等级和机构）"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        projects = []
+        for j in range(rng.randint(0, 3)):
+            winners = [
+                {'name': rng.choice(NAMES), 'organization': rng.choice(ORGANIZATIONS + [None])}
+                for _ in range(rng.randint(0, 4))
+            ]
+            projects.append({
+                'name': f'项目{i}-{j}',
+                'organization': rng.choice(ORGANIZATIONS + [None]),
+                'level': rng.choice(AWARD_LEVELS),
+                'winners': winners
+            })
+        records.append({
+            'title': f'奖项{i}',
+            'content': '',
+            'year': rng.choice([2018, 2019, 2020, 2021, None]),
+            'award_type': rng.choice(AWARD_TYPES + EXTRA_TYPES + [None]),
+            'award_level': rng.choice(AWARD_LEVELS + EXTRA_LEVELS + [None]),
+            'source_url': f'http://example.com/award/{i}',
+            'projects': projects
+        })
+    return records
+
+@pytest.fixture(scope='session')
+def award_store(tmp_path_factory):
+    """写入了500条生成数据的奖项数据库"""
+    from storage.sqlite import AwardStore
+
+    store = AwardStore(str(tmp_path_factory.mktemp('store') / 'awards.db'))
+    store.upsert_records(make_records(500))
+    return store
\ No newline at end of file
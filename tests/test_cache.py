@@ -0,0 +1,92 @@
+import pandas as pd
+import pytest
+
+from config.config import CACHE_CONFIG
+from analyzer.award import AwardAnalyzer
+from analyzer.cache import AnalysisCache, analysis_cache, frame_fingerprint
+from storage.sqlite import AwardStore
+from conftest import make_records
+
+@pytest.fixture
+def frames(award_store):
+    analysis_cache.clear()
+    return award_store.load_frames()
+
+def _uncached(monkeypatch, data, method, *args, **kwargs):
+    """原实现：不经缓存直接计算"""
+    monkeypatch.setitem(CACHE_CONFIG, 'enabled', False)
+    try:
+        return getattr(AwardAnalyzer(data), method)(*args, **kwargs)
+    finally:
+        monkeypatch.setitem(CACHE_CONFIG, 'enabled', True)
+
+def test_frame_fingerprint_follows_content():
+    df = pd.DataFrame({'name': ['张伟', '王芳'], 'year': [2020, 2021], 'tags': [['a'], ['b']]})
+    assert frame_fingerprint(df) == frame_fingerprint(df.copy())
+    assert frame_fingerprint(df) != frame_fingerprint(df.assign(year=[2020, 2022]))
+    assert frame_fingerprint(df) != frame_fingerprint(df.iloc[::-1].reset_index(drop=True))
+    assert frame_fingerprint(df) != frame_fingerprint(df.rename(columns={'year': 'yr'}))
+    assert frame_fingerprint(df) != frame_fingerprint(df.astype({'year': 'float64'}))
+
+def test_cache_evicts_least_recently_used():
+    cache = AnalysisCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == (True, 1)
+    cache.put('c', 3)
+    assert cache.get('b') == (False, None)
+    assert cache.get('a') == (True, 1)
+    assert cache.stats() == {'entries': 2, 'hits': 2, 'misses': 1}
+
+def test_repeated_analysis_hits_cache(frames, monkeypatch):
+    analyzer = AwardAnalyzer(frames)
+    first = analyzer.get_winner_stats(top_n=5)
+    assert analyzer.get_winner_stats(top_n=5) is first
+    assert analyzer.get_winner_stats(top_n=3) is not first
+    # 内容相同的另一个分析器共用缓存
+    assert AwardAnalyzer(frames).get_winner_stats(top_n=5) is first
+    pd.testing.assert_frame_equal(first, _uncached(monkeypatch, frames, 'get_winner_stats', top_n=5))
+
+def test_replaced_frame_invalidates_results(frames, monkeypatch):
+    analyzer = AwardAnalyzer(frames)
+    before = analyzer.get_basic_stats()
+    analyzer.winners_df = frames['winners'].iloc[:-10]
+    after = analyzer.get_basic_stats()
+    assert after['total_winners'] == before['total_winners'] - 10
+    assert after == _uncached(monkeypatch, {**frames, 'winners': frames['winners'].iloc[:-10]}, 'get_basic_stats')
+    
+    # 重新加载内容相同的数据时仍然命中
+    analyzer.winners_df = frames['winners'].copy()
+    assert analyzer.get_basic_stats() is before
+
+def test_in_place_change_needs_invalidate(frames, monkeypatch):
+    analyzer = AwardAnalyzer({name: df.copy() for name, df in frames.items()})
+    before = analyzer.get_organization_stats(top_n=None)
+    winners = analyzer.winners_df
+    winners.loc[winners.index[:50], 'organization'] = '新机构'
+    assert analyzer.get_organization_stats(top_n=None) is before
+    
+    analyzer.invalidate_cache()
+    after = analyzer.get_organization_stats(top_n=None)
+    assert '新机构' in after['机构名称'].tolist()
+    expected = _uncached(monkeypatch, {**frames, 'winners': winners}, 'get_organization_stats', top_n=None)
+    pd.testing.assert_frame_equal(after, expected)
+
+def test_disabled_cache_recomputes(frames, monkeypatch):
+    monkeypatch.setitem(CACHE_CONFIG, 'enabled', False)
+    analyzer = AwardAnalyzer(frames)
+    assert analyzer.get_winner_stats() is not analyzer.get_winner_stats()
+    assert analysis_cache.stats()['entries'] == 0
+
+def test_analyze_matches_uncached_after_reload(tmp_path, monkeypatch):
+    analysis_cache.clear()
+    store = AwardStore(str(tmp_path / 'reload.db'))
+    store.upsert_records(make_records(80))
+    analyzer = AwardAnalyzer(store.load_frames())
+    analyzer.analyze()
+    
+    # 写入新数据后重新加载，结果按新数据重新计算
+    store.upsert_records(make_records(120, seed=1)[80:])
+    analyzer = AwardAnalyzer(store.load_frames())
+    analyzer.analyze()
+    assert analyzer.results['basic_stats'] == _uncached(monkeypatch, store.load_frames(), 'get_basic_stats')
\ No newline at end of file
@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+
+from config.config import AWARD_LEVELS
+from analyzer.award import AwardAnalyzer
+from analyzer.cache import analysis_cache
+from analyzer.chunked import ChunkedAnalyzer
+from analyzer.incremental import IncrementalAggregator
+from storage.sqlite import AwardStore
+from conftest import make_records
+
+FILTERS = [{}, {'year': 2020}, {'award_type': '科技进步奖'}, {'award_level': '一等奖'}]
+CHUNK_SIZES = [1, 7, 13, 50, 100000]
+
+def _assert_same(expected, actual, path='results'):
+    """逐项比较结果，字典的键顺序、DataFrame的列顺序和类型都须一致"""
+    if isinstance(expected, dict):
+        assert list(actual) == list(expected), path
+        for key in expected:
+            _assert_same(expected[key], actual[key], f"{path}[{key!r}]")
+    elif isinstance(expected, pd.DataFrame):
+        pd.testing.assert_frame_equal(actual, expected, obj=path)
+        for column in expected.columns:
+            if expected[column].map(lambda value: isinstance(value, dict)).any():
+                assert [list(d) for d in actual[column]] == [list(d) for d in expected[column]], path
+    elif isinstance(expected, (list, tuple)):
+        assert len(actual) == len(expected), path
+        for i, (a, b) in enumerate(zip(expected, actual)):
+            _assert_same(a, b, f"{path}[{i}]")
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, nan_ok=True), path
+    else:
+        assert actual == expected, path
+
+@pytest.fixture(scope='module', params=FILTERS, ids=lambda f: ','.join(f'{k}={v}' for k, v in f.items()) or 'all')
+def full_results(request, award_store):
+    analysis_cache.clear()
+    analyzer = AwardAnalyzer()
+    analyzer.load_store(award_store.db_path, **request.param)
+    analyzer.analyze()
+    return request.param, analyzer.results
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_chunked_matches_full_analysis(award_store, full_results, chunk_size):
+    filters, expected = full_results
+    results = ChunkedAnalyzer(award_store, chunk_size).analyze(**filters)
+    for key, value in results.items():
+        _assert_same(expected[key], value, key)
+
+def test_trend_columns_keep_schema_order(award_store):
+    # 各块出现的词表外类别不同，合并后仍是词表顺序在前、其余类别在后
+    trends = ChunkedAnalyzer(award_store, 7).analyze(network=False)['trend_analysis']
+    levels = [c for c in trends['level_trends'].columns if c != 'year']
+    assert levels == [level for level in AWARD_LEVELS if level in levels] + ['金奖']
+
+def test_iter_frames_reads_one_snapshot(tmp_path):
+    store = AwardStore(str(tmp_path / 'snapshot.db'))
+    store.upsert_records(make_records(100))
+
+    chunks = store.iter_frames('awards', 10)
+    first = next(chunks)
+    # 读取过程中写入的新奖项不出现在本次读取的结果中
+    AwardStore(store.db_path).upsert_records(make_records(150)[100:])
+    rows = len(first) + sum(len(chunk) for chunk in chunks)
+
+    assert rows == 100
+    assert store.count_awards() == 150
+
+def test_chunked_mode_keeps_no_per_record_state(award_store):
+    aggregator = IncrementalAggregator(chunked=True)
+    for table in ('awards', 'projects', 'winners'):
+        for chunk in award_store.iter_frames(table, 50):
+            aggregator.update({table: chunk})
+    assert not aggregator.award_keys
+    assert not aggregator.project_org_sets
+    assert aggregator.totals['awards'] == award_store.count_awards()
\ No newline at end of file
@@ -0,0 +1,84 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzer.award import AwardAnalyzer
+from config.config import COLUMNAR_CONFIG
+from processor.schema import DataSchema
+from processor.transformer import DataTransformer
+from storage.columnar import ColumnarStore, VERSION_PREFIX, get_columnar_store
+from conftest import make_records
+
+@pytest.fixture
+def frames():
+    return DataSchema.apply(DataTransformer().to_dataframe(make_records(200)))
+
+def _versions(directory):
+    return sorted(name for name in os.listdir(directory) if name.startswith(VERSION_PREFIX))
+
+def test_round_trip(tmp_path, frames):
+    store = ColumnarStore.write(frames, str(tmp_path / 'columns'))
+    for table, df in frames.items():
+        got = store.read(table)
+        for column in df.columns:
+            expected = df[column].astype(object).where(df[column].notna(), None).tolist()
+            actual = got[column].astype(object).where(got[column].notna(), None).tolist()
+            assert actual == expected, (table, column)
+
+def test_strings_are_shared_and_read_only(tmp_path, frames):
+    directory = str(tmp_path / 'columns')
+    ColumnarStore.write(frames, directory)
+    store = get_columnar_store(directory)
+
+    names = store.read('winners')['name']
+    assert isinstance(names.dtype, pd.CategoricalDtype)
+    assert np.shares_memory(names.cat.codes.to_numpy(), store.column('winners', 'name').codes)
+
+    analyzer = AwardAnalyzer()
+    analyzer.load_columns(directory)
+    expected = analyzer.winners_df['name'].iloc[0]
+    with pytest.raises((TypeError, ValueError)):
+        analyzer.winners_df.loc[0, 'name'] = 'XXX'
+    with pytest.raises(ValueError):
+        analyzer.winners_df.loc[0, 'name'] = analyzer.winners_df['name'].iloc[1]
+
+    other = AwardAnalyzer()
+    other.load_columns(directory)
+    assert other.winners_df['name'].iloc[0] == expected
+
+def test_rewrite_keeps_open_versions(tmp_path, frames):
+    directory = str(tmp_path / 'columns')
+    ColumnarStore.write(frames, directory)
+    # 已读取清单、尚未映射任何列的进程
+    opened = ColumnarStore(directory)
+
+    changed = {table: df.iloc[:10] for table, df in frames.items()}
+    ColumnarStore.write(changed, directory)
+    assert len(opened.read('winners')) == len(frames['winners'])
+    assert len(ColumnarStore(directory).read('winners')) == 10
+
+    for _ in range(3):
+        ColumnarStore.write(changed, directory)
+    assert len(_versions(directory)) == COLUMNAR_CONFIG.get('keep_versions', 2)
+    assert ColumnarStore(directory).version_dir.endswith(_versions(directory)[-1])
+
+def _normalized(df):
+    """缺失值统一为None（列式缓存的字符串列为分类类型，缺失值读出为NaN）"""
+    return df.astype(object).where(df.notna(), None)
+
+@pytest.mark.parametrize('analysis', [
+    'get_organization_stats', 'get_winner_stats', 'get_regional_analysis', 'get_yearly_stats'
+])
+def test_analysis_matches_in_memory(tmp_path, frames, analysis):
+    directory = str(tmp_path / 'columns')
+    ColumnarStore.write(frames, directory)
+
+    cached = AwardAnalyzer()
+    cached.load_columns(directory)
+    in_memory = AwardAnalyzer(frames)
+
+    pd.testing.assert_frame_equal(
+        _normalized(getattr(cached, analysis)()), _normalized(getattr(in_memory, analysis)())
+    )
\ No newline at end of file
@@ -0,0 +1,69 @@
+import random
+from itertools import combinations
+
+import pandas as pd
+import pytest
+
+from analyzer.cooccurrence import CooccurrenceMatrix
+
+def _naive_pairs(df, group_column, entity_column):
+    """原实现：逐个分组枚举实体对计数，同一分组中的重复实体只计一次"""
+    pairs = {}
+    for _, group in df.groupby(group_column):
+        entities = group[entity_column].dropna().unique()
+        for a, b in combinations(entities, 2):
+            pair = frozenset((a, b))
+            pairs[pair] = pairs.get(pair, 0) + 1
+    return pairs
+
+def make_frame(count, seed=0):
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        'project_id': [rng.choice([rng.randrange(300), None]) if rng.random() < 0.02 else rng.randrange(300)
+                       for _ in range(count)],
+        'winner_id': [rng.choice([rng.randrange(150), None]) if rng.random() < 0.02 else rng.randrange(150)
+                      for _ in range(count)],
+        'name': [f'获奖人{rng.randrange(1000)}' for _ in range(count)]
+    })
+
+@pytest.fixture(scope='module')
+def frame():
+    return make_frame(2000)
+
+def test_edges_match_naive_pair_count(frame):
+    matrix = CooccurrenceMatrix.from_frame(frame, 'project_id', 'winner_id', 'name')
+    edges = matrix.edges()
+    assert {frozenset((a, b)): w for a, b, w in edges} == _naive_pairs(frame, 'project_id', 'winner_id')
+    # 没有自环，每对实体只出现一次
+    assert all(a != b for a, b, _ in edges)
+    assert len({frozenset((a, b)) for a, b, _ in edges}) == len(edges)
+
+@pytest.mark.parametrize('min_weight', [None, 0, 1, 2, 3])
+def test_edges_min_weight(frame, min_weight):
+    matrix = CooccurrenceMatrix.from_frame(frame, 'project_id', 'winner_id')
+    expected = {pair: w for pair, w in _naive_pairs(frame, 'project_id', 'winner_id').items()
+                if not min_weight or w >= min_weight}
+    assert {frozenset((a, b)): w for a, b, w in matrix.edges(min_weight)} == expected
+
+def test_top_pairs_order_and_labels(frame):
+    matrix = CooccurrenceMatrix.from_frame(frame, 'project_id', 'winner_id', 'name')
+    naive = _naive_pairs(frame, 'project_id', 'winner_id')
+    top = matrix.top_pairs(20)
+    assert [pair['count'] for pair in top] == sorted(naive.values(), reverse=True)[:20]
+    
+    # 显示名称取实体最后一次出现的名称
+    names = frame.dropna(subset=['project_id', 'winner_id']).groupby('winner_id')['name'].last()
+    labelled = {(tuple(sorted([names[a], names[b]], key=str)), w) for a, b, w in matrix.edges()}
+    assert all((tuple(pair['pair']), pair['count']) in labelled for pair in top)
+
+def test_group_sizes_count_distinct_entities(frame):
+    matrix = CooccurrenceMatrix.from_frame(frame, 'project_id', 'winner_id')
+    linked = frame.dropna(subset=['project_id', 'winner_id'])
+    expected = linked.groupby('project_id', sort=False)['winner_id'].nunique()
+    assert sorted(matrix.group_sizes().tolist()) == sorted(expected.tolist())
+    assert matrix.entity_count == frame['winner_id'].nunique()
+
+def test_empty_frame():
+    matrix = CooccurrenceMatrix.from_frame(pd.DataFrame({'project_id': [], 'winner_id': []}), 'project_id', 'winner_id')
+    assert matrix.edges() == []
+    assert matrix.top_pairs() == []
\ No newline at end of file
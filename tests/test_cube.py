@@ -0,0 +1,82 @@
+import pandas as pd
+import pytest
+
+from analyzer.cube import AggregateCube, get_store_cube
+from analyzer.region import get_region_resolver
+from storage.sqlite import AwardStore
+from conftest import make_records
+
+@pytest.fixture(scope='module')
+def frames(award_store):
+    return award_store.load_frames()
+
+@pytest.fixture(scope='module')
+def cube(frames):
+    return AggregateCube.from_frames(frames['awards'], frames['projects'], frames['winners'])
+
+@pytest.fixture(scope='module')
+def award_orgs(frames):
+    """直接由明细计算的 奖项-地区-机构 关联（项目和获奖人的机构）"""
+    awards = frames['awards'].set_index('award_id')
+    projects = frames['projects'][['project_id', 'award_id', 'organization']]
+    winners = frames['winners'][['project_id', 'organization']].merge(
+        projects[['project_id', 'award_id']], on='project_id'
+    )
+    pairs = pd.concat([projects[['award_id', 'organization']], winners[['award_id', 'organization']]], ignore_index=True)
+    pairs = pairs.join(awards[['year', 'award_type', 'award_level']], on='award_id')
+    pairs['region'] = get_region_resolver().resolve_series(pairs['organization']).to_numpy()
+    return pairs
+
+def _expected(pairs, by):
+    return pairs.groupby(by, observed=True, dropna=False).award_id.nunique()
+
+@pytest.mark.parametrize('by', [['region'], ['organization'], ['year', 'region'], ['award_type', 'region']])
+def test_award_counts_by_region_and_organization(cube, award_orgs, by):
+    rolled = cube.rollup(by).set_index(by)['awards']
+    expected = _expected(award_orgs, by)
+    pd.testing.assert_series_equal(
+        rolled.sort_index(), expected.reindex(rolled.index).sort_index().astype('int64'),
+        check_names=False, check_index_type=False
+    )
+
+def test_award_counts_with_region_filter(cube, award_orgs):
+    rolled = cube.rollup(['year'], region='北京').set_index('year')['awards']
+    expected = _expected(award_orgs[award_orgs['region'] == '北京'], ['year'])
+    assert rolled.to_dict() == expected.to_dict()
+
+    total = cube.rollup(region=['北京', '上海'], year_range=(2019, 2020))['awards'].iloc[0]
+    subset = award_orgs[award_orgs['region'].isin(['北京', '上海']) & award_orgs['year'].between(2019, 2020)]
+    assert total == subset['award_id'].nunique()
+
+def test_award_counts_with_organization_filter(cube, award_orgs):
+    organizations = ['北京大学', '清华大学']
+    rolled = cube.rollup(['region'], organization=organizations).set_index('region')['awards']
+    expected = _expected(award_orgs[award_orgs['organization'].isin(organizations)], ['region'])
+    assert rolled.to_dict() == expected.to_dict()
+
+def test_joint_awards_counted_once_per_region(cube, award_orgs):
+    # 生成数据中同一奖项在北京有多个机构，逐单元相加会重复计数
+    beijing = award_orgs[award_orgs['region'] == '北京']
+    assert beijing.groupby('award_id')['organization'].nunique().max() > 1
+    assert cube.rollup(region='北京')['awards'].iloc[0] == beijing['award_id'].nunique()
+
+def test_award_dimensions_unchanged(cube, frames):
+    rolled = cube.rollup(['award_type']).set_index('award_type')['awards']
+    expected = frames['awards'].groupby('award_type', observed=True, dropna=False).size()
+    assert rolled.to_dict() == expected.to_dict()
+
+def test_store_cube_rebuilt_after_replacing_award(tmp_path):
+    store = AwardStore(str(tmp_path / 'cube.db'))
+    last = {'title': '奖项末尾', 'year': 2020, 'award_level': '一等奖', 'source_url': 'http://example.com/award/last',
+            'projects': [{'name': '项目末尾', 'level': '一等奖', 'winners': [{'name': '张伟', 'organization': '北京大学'}]}]}
+    store.upsert_records(make_records(20) + [last])
+    before = get_store_cube(store).rollup(['award_level']).set_index('award_level')['awards']
+
+    # 替换最后写入的奖项时项目和获奖人重新分配到相同的主键，各表的最大主键不变
+    version = store.data_version()
+    store.upsert_records([dict(last, award_level='金奖')])
+    assert store.data_version() > version
+
+    after = get_store_cube(store).rollup(['award_level']).set_index('award_level')['awards']
+    assert after.get('金奖', 0) == before.get('金奖', 0) + 1
+    assert after['一等奖'] == before['一等奖'] - 1
\ No newline at end of file
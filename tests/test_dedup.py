@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from processor.dedup import DuplicateDetector
+
+TITLE = "2020年度国家科学技术进步奖获奖项目公示"
+CONTENT = "经国家科学技术奖励委员会评审，清华大学牵头完成的《高性能计算关键技术研究与应用》项目荣获国家科学技术进步奖一等奖。"
+SNIPPET = "清华大学高性能计算项目获国家科技进步奖一等奖"
+# 超过草图大小的长文本，走估计包含度的分支
+_CHARS = "国家科学技术进步奖自然发明一二等特提名大学研究院所中心工程项目关键理论方法应用材料装备系统网络信息能源环境生物医药农业海洋空间"
+_RNG = random.Random(0)
+ARTICLE = "".join(_RNG.choice(_CHARS) for _ in range(600))
+
+DUPLICATES = {
+    'repost': (TITLE + CONTENT, TITLE + CONTENT + "转载"),
+    'repost_short': (SNIPPET, SNIPPET + "转载"),
+    'source_suffix': (TITLE + CONTENT, TITLE + "_新浪科技 " + CONTENT),
+    'truncated': (TITLE + CONTENT, TITLE + CONTENT[:30] + "..."),
+    'repost_article': (ARTICLE, "来源：科技日报 " + ARTICLE + "（转载请注明出处）"),
+    'truncated_article': (ARTICLE, ARTICLE[:len(ARTICLE) * 3 // 4]),
+}
+
+DISTINCT = {
+    'level': (TITLE + CONTENT, TITLE + CONTENT.replace("一等奖", "二等奖")),
+    'level_short': (SNIPPET, SNIPPET.replace("一等奖", "二等奖")),
+    'year_short': (SNIPPET + "2020年", SNIPPET + "2021年"),
+    'project': (TITLE + CONTENT, TITLE + CONTENT.replace("高性能计算关键技术研究与应用", "深海探测装备研制与产业化")),
+    'organization_short': (SNIPPET, SNIPPET.replace("清华大学", "浙江大学")),
+    'phrase_in_article': (SNIPPET, ARTICLE),
+    'half_article': (ARTICLE, ARTICLE[:len(ARTICLE) // 3]),
+}
+
+@pytest.fixture
+def detector():
+    return DuplicateDetector(index_file='unused.json')
+
+def test_article_exceeds_sketch(detector):
+    assert detector.fingerprint(ARTICLE)['size'] > detector.sketch_size
+
+@pytest.mark.parametrize('name', sorted(DUPLICATES))
+def test_duplicates(detector, name):
+    a, b = DUPLICATES[name]
+    assert detector.is_duplicate(detector.fingerprint(a), detector.fingerprint(b))
+
+@pytest.mark.parametrize('name', sorted(DISTINCT))
+def test_distinct(detector, name):
+    a, b = DISTINCT[name]
+    assert not detector.is_duplicate(detector.fingerprint(a), detector.fingerprint(b))
+
+def test_deduplicate_keeps_first(detector):
+    records = [
+        {'title': TITLE, 'content': CONTENT, 'source_url': 'a'},
+        {'title': TITLE, 'content': CONTENT + "转载", 'source_url': 'b'},
+        {'title': TITLE, 'content': CONTENT.replace("一等奖", "二等奖"), 'source_url': 'c'},
+    ]
+    assert [r['source_url'] for r in detector.deduplicate(records)] == ['a', 'c']
+    assert detector.stats == {'total': 3, 'duplicates': 1}
+
+def test_index_roundtrip(tmp_path):
+    index_file = str(tmp_path / 'fingerprints.json')
+    first = DuplicateDetector(index_file=index_file)
+    first.deduplicate([{'title': TITLE, 'content': CONTENT, 'source_url': 'a'}])
+    first.save_index()
+
+    second = DuplicateDetector(index_file=index_file)
+    second.load_index()
+    kept = second.deduplicate([
+        {'title': TITLE, 'content': CONTENT, 'source_url': 'a'},
+        {'title': TITLE, 'content': CONTENT + "转载", 'source_url': 'b'},
+    ])
+    assert [r['source_url'] for r in kept] == ['a']
\ No newline at end of file
@@ -0,0 +1,82 @@
+import random
+
+import pandas as pd
+import pytest
+
+from processor.cleaner import DataCleaner
+from processor.vectorized import VectorizedCleaner
+
+def _baseline_fix(item):
+    """原实现：对每个字符串字段尝试按latin-1重新编码再按UTF-8解码"""
+    fixed = {}
+    for key, value in item.items():
+        if isinstance(value, str):
+            try:
+                value = value.encode('latin1').decode('utf-8')
+            except Exception:
+                pass
+        fixed[key] = value
+    return fixed
+
+def _mojibake(text):
+    return text.encode('utf-8').decode('latin-1')
+
+PIECES = ['北京大学', '一等奖', 'abc', ' ', 'café', 'Ñ', '\xa0', 'é€', '🎉', '2020年', '\x80', 'Ã©']
+
+def make_items(count, seed=0):
+    rng = random.Random(seed)
+    items = []
+    for _ in range(count):
+        item = {}
+        for key in ('title', 'description', 'url', 'extra'):
+            text = ''.join(rng.choice(PIECES) for _ in range(rng.randint(0, 4)))
+            roll = rng.random()
+            if roll < 0.3:
+                text = _mojibake(text)
+            elif roll < 0.35:
+                text = rng.choice([None, 2020, ['x'], {'a': 1}])
+            item[key] = text
+        items.append(item)
+    return items
+
+@pytest.fixture(scope='module')
+def items():
+    return make_items(3000)
+
+def test_repair_matches_baseline(items):
+    cleaner = DataCleaner()
+    assert [cleaner._fix_encoding(item) for item in items] == [_baseline_fix(item) for item in items]
+
+def test_stats_count_changed_fields(items):
+    cleaner = DataCleaner()
+    for item in items:
+        cleaner._fix_encoding(item)
+    strings = [(item, key) for item in items for key, value in item.items() if isinstance(value, str)]
+    changed = sum(_baseline_fix(item)[key] != item[key] for item, key in strings)
+    assert cleaner.encoding_stats == {'checked': len(strings), 'repaired': changed}
+    assert changed > 0
+
+def test_batch_matches_per_item(items):
+    cleaner = DataCleaner()
+    expected = [cleaner._fix_encoding(item) for item in items]
+    stats = {}
+    assert VectorizedCleaner.fix_encoding_batch(items, stats) == expected
+    assert stats == cleaner.encoding_stats
+    # 输入数据不被修改
+    assert items == make_items(3000)
+
+@pytest.mark.parametrize('value, expected', [
+    (_mojibake('国家科学技术奖'), '国家科学技术奖'),
+    ('国家科学技术奖', None),
+    ('plain ascii', None),
+    ('café', None),
+    (_mojibake('北京') + '北京', None),
+])
+def test_repair_mojibake(value, expected):
+    assert DataCleaner.repair_mojibake(value) == expected
+
+def test_series_repair_keeps_non_strings():
+    values = pd.Series([_mojibake('一等奖'), None, 3, _mojibake('一等奖'), 'ok'], dtype=object)
+    fixed, repaired = VectorizedCleaner.fix_encoding_series(values)
+    assert fixed.tolist() == ['一等奖', None, 3, '一等奖', 'ok']
+    assert repaired == 2
\ No newline at end of file
@@ -0,0 +1,106 @@
+import math
+import random
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+from analyzer.award import AwardAnalyzer
+from analyzer.field import FieldAnalyzer
+from analyzer.text import get_text_service
+from test_text import make_names
+
+def _reference(names, groups, top_n):
+    """参考实现：逐个项目计算平滑IDF和L2归一化的TF-IDF，再按分组求和"""
+    analyzer = FieldAnalyzer(top_n=top_n)
+    known = [i for i, name in enumerate(names) if pd.notna(name)]
+    terms = [Counter(analyzer._terms(tokens)) for tokens in get_text_service().tokenize([names[i] for i in known])]
+    df = Counter(term for counts in terms for term in counts)
+    idf = {term: math.log((1 + len(terms)) / (1 + n)) + 1 for term, n in df.items()}
+    vectors = []
+    for counts in terms:
+        weights = {term: count * idf[term] for term, count in counts.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1
+        vectors.append({term: w / norm for term, w in weights.items()})
+    
+    def top(rows):
+        totals, presence = Counter(), Counter()
+        for row in rows:
+            for term, w in vectors[row].items():
+                totals[term] += w
+                presence[term] += 1
+        ranked = sorted(totals, key=lambda term: (-round(totals[term], 9), term))[:top_n]
+        return [(term, presence[term], round(totals[term], 4)) for term in ranked]
+    
+    results = {'overall': top(range(len(known)))}
+    for column, values in groups.items():
+        values = [values[i] for i in known]
+        results[column] = {
+            value: top([row for row, v in enumerate(values) if v == value])
+            for value in sorted({v for v in values if pd.notna(v)})
+        }
+    return results
+
+def _rows(df, columns=FieldAnalyzer.COLUMNS):
+    return [(row[0], int(row[1]), pytest.approx(row[2], abs=1e-4)) for row in df[columns].itertuples(index=False)]
+
+@pytest.fixture(scope='module')
+def corpus():
+    rng = random.Random(0)
+    names = make_names(800) + [None, '', '2020', '的研究']
+    years = [rng.choice([2018, 2019, 2020, None]) for _ in names]
+    types = [rng.choice(['自然科学奖', '科技进步奖']) for _ in names]
+    return names, {'年份': years, '奖项类型': types}
+
+@pytest.mark.parametrize('top_n', [1, 5, 20, 1000])
+def test_matches_reference_tfidf(corpus, top_n):
+    names, groups = corpus
+    results = FieldAnalyzer(top_n=top_n).analyze(
+        pd.Series(names, dtype=object), {column: pd.Series(values, dtype=object) for column, values in groups.items()}
+    )
+    expected = _reference(names, groups, top_n)
+    assert _rows(results['overall']) == expected['overall']
+    for column in groups:
+        grouped = results[column]
+        assert sorted(grouped[column].unique().tolist()) == list(expected[column])
+        for value, rows in expected[column].items():
+            assert _rows(grouped[grouped[column] == value]) == rows
+
+@pytest.mark.parametrize('top_n', [1, 2, 3, 5])
+def test_ties_keep_term_order(top_n):
+    names = pd.Series(['水稻育种', '基因治疗', '肿瘤精准', '催化剂', '智能电网', '人工智能', '深度学习', '复合材料'] * 3)
+    full = FieldAnalyzer(top_n=100).analyze(names)['overall']
+    top = FieldAnalyzer(top_n=top_n).analyze(names)['overall']
+    pd.testing.assert_frame_equal(top, full.head(top_n))
+
+def test_filters_stop_words_and_numbers(corpus):
+    names, _ = corpus
+    terms = set(FieldAnalyzer(top_n=1000).analyze(pd.Series(names, dtype=object))['overall']['关键词'])
+    assert terms
+    assert not terms & {'研究', '应用', '关键技术', '及其', '2020', '的'}
+    assert all(len(term) >= 2 for term in terms)
+
+def test_no_terms():
+    results = FieldAnalyzer().analyze(pd.Series(['的', None, '2020']), {'年份': pd.Series([2020, 2021, 2020])})
+    assert results['overall'].empty
+    assert list(results['年份'].columns) == ['年份'] + FieldAnalyzer.COLUMNS
+
+def test_award_analyzer_groups_by_award_year(corpus):
+    names, groups = corpus
+    awards = pd.DataFrame({
+        'award_id': range(len(names)),
+        'year': groups['年份'],
+        'award_type': groups['奖项类型']
+    })
+    # 项目表没有年份和类型，从所属奖项取得
+    projects = pd.DataFrame({'project_id': range(len(names)), 'award_id': range(len(names)), 'name': names})
+    analyzer = AwardAnalyzer({'awards': awards, 'projects': projects, 'winners': pd.DataFrame()})
+    expected = _reference(names, groups, 20)
+    
+    assert _rows(analyzer.get_field_analysis()) == expected['overall']
+    by_year = analyzer.get_field_analysis(group_by='year')
+    for year, rows in expected['年份'].items():
+        assert _rows(by_year[by_year['年份'] == year]) == rows
+    by_type = analyzer.get_field_analysis(group_by='award_type')
+    assert set(by_type['奖项类型']) == set(expected['奖项类型'])
+    assert analyzer.get_field_analysis(group_by='level').empty
\ No newline at end of file
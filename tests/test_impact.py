@@ -0,0 +1,75 @@
+import pandas as pd
+import pytest
+
+from config.config import IMPACT_CONFIG
+from analyzer.impact import ImpactScorer
+
+def _baseline(projects_df, winners_df, weights):
+    """原逐行实现：没有等级的项目不计入机构得分，获奖人按所在项目等级计分"""
+    org_scores, winner_scores = {}, {}
+    for _, row in projects_df.iterrows():
+        org, level = row.get('organization'), row.get('level')
+        if pd.notna(org) and pd.notna(level) and level:
+            org_scores[org] = org_scores.get(org, 0) + weights.get(level, 1)
+    levels = projects_df.set_index('project_id')['level']
+    for _, row in winners_df.iterrows():
+        if row['project_id'] in levels.index:
+            level = levels[row['project_id']]
+            score = weights.get(level, 1) if pd.notna(level) else 1
+            winner_scores[row['name']] = winner_scores.get(row['name'], 0) + score
+    return org_scores, winner_scores
+
+@pytest.fixture
+def frames():
+    projects = pd.DataFrame({
+        'project_id': [1, 2, 3, 4, 5],
+        'organization': ['北京大学', '北京大学', '清华大学', '清华大学', None],
+        'level': ['一等奖', None, '二等奖', '金奖', '特等奖'],
+        'year': [2020, 2020, 2018, 2020, 2019]
+    })
+    winners = pd.DataFrame({
+        'project_id': [1, 2, 2, 3, 4, 5, 9],
+        'name': ['张伟', '张伟', '王芳', '王芳', '李娜', '李娜', '刘洋']
+    })
+    return projects, winners
+
+def _scores(result, key):
+    return {row[key]: row['影响力得分'] for row in result}
+
+@pytest.mark.parametrize('scheme', list(IMPACT_CONFIG['weight_schemes']))
+@pytest.mark.parametrize('categorical', [False, True])
+def test_scores_match_baseline(frames, scheme, categorical):
+    projects, winners = frames
+    if categorical:
+        projects = projects.assign(level=projects['level'].astype('category'))
+    weights = IMPACT_CONFIG['weight_schemes'][scheme]
+    result = ImpactScorer(scheme=scheme, half_life=None).analyze(projects, winners, top_n=None)
+
+    org_scores, winner_scores = _baseline(projects, winners, weights)
+    assert _scores(result['top_organizations'], '机构') == pytest.approx(org_scores)
+    assert _scores(result['top_winners'], '获奖人') == pytest.approx(winner_scores)
+
+def test_projects_without_level_skip_organizations(frames):
+    projects, winners = frames
+    result = ImpactScorer(scheme='default', half_life=None).analyze(projects.assign(level=''), winners, top_n=None)
+    assert result['top_organizations'] == []
+    assert ImpactScorer(scheme='default').analyze(projects.drop(columns='level'), winners)['top_organizations'] == []
+
+def test_year_decay_halves_per_half_life(frames):
+    projects, winners = frames
+    scorer = ImpactScorer(scheme='count', half_life=1)
+    # 参照年份为数据中的最大年份2020，2018年的项目衰减为四分之一
+    assert scorer.project_scores(projects).tolist() == [1, 1, 0.25, 1, 0.5]
+    scorer = ImpactScorer(scheme='count', half_life=2, reference_year=2022)
+    assert scorer.project_scores(projects).tolist() == pytest.approx([0.5, 0.5, 0.25, 0.5, 2 ** -1.5])
+
+def test_top_n_orders_by_score(frames):
+    projects, winners = frames
+    result = ImpactScorer(scheme='exponential', half_life=None).analyze(projects, winners, top_n=1)
+    # 北京大学没有等级的项目不计分：8 分，而非 8 + 1
+    assert result['top_organizations'] == [{'机构': '北京大学', '影响力得分': 8.0}]
+    assert [row['获奖人'] for row in result['top_winners']] == ['李娜']
+
+def test_unknown_scheme_rejected():
+    with pytest.raises(ValueError):
+        ImpactScorer(scheme='unknown')
\ No newline at end of file
@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+
+from analyzer.award import AwardAnalyzer
+from analyzer.cache import analysis_cache
+from analyzer.incremental import IncrementalAggregator
+from processor.transformer import DataTransformer
+from storage.sqlite import AwardStore
+from conftest import make_records
+
+def _changed(record):
+    """重新抓取后等级、项目和获奖人都有变化的同一奖项"""
+    project = {'name': '新增项目', 'organization': '复旦大学', 'level': '特等奖',
+               'winners': [{'name': '欧阳明', 'organization': '复旦大学'}]}
+    return dict(record, award_level='金奖', projects=record['projects'][1:] + [project])
+
+def _full_results(data):
+    analysis_cache.clear()
+    analyzer = AwardAnalyzer(data)
+    analyzer.analyze()
+    return analyzer.results
+
+def _assert_matches(aggregator, expected):
+    """增量结果与全量结果逐项一致，DataFrame不比较列的存储类型"""
+    for key, value in aggregator.results().items():
+        if isinstance(value, pd.DataFrame):
+            pd.testing.assert_frame_equal(value, expected[key], check_dtype=False, check_categorical=False, obj=key)
+        else:
+            assert value == expected[key], key
+
+def test_unchanged_recrawl_is_skipped(tmp_path):
+    records = make_records(120)
+    aggregator = IncrementalAggregator(str(tmp_path / 'state.pkl'))
+    for batch in (records[:50], records[50:] + records[10:30]):
+        assert aggregator.changed_awards(DataTransformer.to_dataframe(batch)) == []
+        aggregator.update(DataTransformer.to_dataframe(batch))
+    _assert_matches(aggregator, _full_results(DataTransformer.to_dataframe(records)))
+
+def test_changed_recrawl_is_refused(tmp_path):
+    records = make_records(60)
+    aggregator = IncrementalAggregator(str(tmp_path / 'state.pkl'))
+    aggregator.update(DataTransformer.to_dataframe(records))
+    totals = dict(aggregator.totals)
+
+    batch = DataTransformer.to_dataframe([_changed(records[3])])
+    assert aggregator.changed_awards(batch) == [AwardStore.award_key(records[3])]
+    with pytest.raises(ValueError):
+        aggregator.update(batch)
+    assert dict(aggregator.totals) == totals
+
+def test_changed_recrawl_matches_full_recompute(tmp_path):
+    # 重新抓取的奖项在数据库中被替换，增量结果须与对数据库全部数据重新计算一致
+    store = AwardStore(str(tmp_path / 'awards.db'))
+    state_file = str(tmp_path / 'state.pkl')
+    records = make_records(150)
+    batches = [records[:80], records[80:] + [_changed(records[i]) for i in (3, 40, 79)]]
+
+    for batch in batches:
+        store.upsert_records(batch)
+        aggregator = AwardAnalyzer().analyze_incremental(DataTransformer.to_dataframe(batch), state_file, store.db_path)
+    assert aggregator.award_keys[AwardStore.award_key(records[3])] is not None
+
+    analysis_cache.clear()
+    expected = AwardAnalyzer()
+    expected.load_store(store.db_path)
+    expected.analyze()
+    _assert_matches(aggregator, expected.results)
+
+    # 重建后再次抓取内容不变的奖项，按存储类型不同的数据计算的哈希值一致
+    assert IncrementalAggregator.load(state_file).changed_awards(DataTransformer.to_dataframe(batches[1])) == []
\ No newline at end of file
@@ -0,0 +1,94 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzer.base import BaseAnalyzer
+
+def _ranking(keys):
+    """参考实现：按次数降序，次数相同时按首次出现的顺序"""
+    counts, first = {}, {}
+    for i, key in enumerate(keys):
+        if pd.isna(key):
+            continue
+        counts[key] = counts.get(key, 0) + 1
+        first.setdefault(key, i)
+    return sorted(counts, key=lambda key: (-counts[key], first[key])), counts
+
+def _baseline_winners(winners_df, key, top_n):
+    """原实现：value_counts 取前N个，逐个查找最近一条记录"""
+    counts = winners_df[key].value_counts().nlargest(top_n)
+    return pd.DataFrame({
+        '获奖人': [winners_df[winners_df[key] == x]['name'].iloc[-1] for x in counts.index],
+        '获奖次数': counts.values,
+        '最近获奖机构': [winners_df[winners_df[key] == x]['organization'].iloc[-1] for x in counts.index]
+    })
+
+@pytest.fixture(scope='module')
+def frames():
+    rng = random.Random(0)
+    names = [f'获奖人{i}' for i in range(60)]
+    orgs = [f'机构{i}' for i in range(25)]
+    projects = pd.DataFrame({
+        'project_id': range(400),
+        'name': [f'项目{i}' for i in range(400)],
+        'organization': [rng.choice(orgs + [None]) for _ in range(400)]
+    })
+    winners = pd.DataFrame({
+        'project_id': [rng.randrange(400) for _ in range(1500)],
+        'name': [rng.choice(names + [None]) for _ in range(1500)],
+        'organization': [rng.choice(orgs) for _ in range(1500)]
+    })
+    return {'awards': pd.DataFrame(), 'projects': projects, 'winners': winners}
+
+@pytest.mark.parametrize('counts', [
+    np.array([3, 1, 3, 2, 3, 1]),
+    np.array([5]),
+    np.array([], dtype=np.int64),
+    np.random.default_rng(0).integers(0, 5, 1000)
+])
+@pytest.mark.parametrize('top_n', [None, 0, 1, 2, 3, 10, 2000])
+def test_top_n_matches_stable_sort(counts, top_n):
+    expected = np.argsort(-counts, kind='stable')
+    if top_n is not None:
+        expected = expected[:top_n]
+    assert BaseAnalyzer._top_n(counts, top_n).tolist() == expected.tolist()
+
+@pytest.mark.parametrize('top_n', [1, 5, 10, 59, None])
+def test_winner_stats_match_baseline(frames, top_n):
+    winners = frames['winners']
+    result = BaseAnalyzer(frames).get_winner_stats(top_n=top_n)
+    key = BaseAnalyzer(frames)._winner_key()
+    baseline = _baseline_winners(winners, key, top_n if top_n is not None else len(winners))
+    # 次数序列与原实现一致
+    assert result['获奖次数'].tolist() == baseline['获奖次数'].tolist()
+    
+    # 次数相同的获奖人按首次出现的顺序排列，姓名和机构取最近一条记录
+    ranking, _ = _ranking(winners[key])
+    expected = ranking[:top_n] if top_n is not None else ranking
+    last = winners.dropna(subset=[key]).groupby(key, sort=False).tail(1).set_index(key, drop=False)
+    assert result['获奖人'].tolist() == [last.loc[k, 'name'] for k in expected]
+    assert result['最近获奖机构'].tolist() == [last.loc[k, 'organization'] for k in expected]
+
+@pytest.mark.parametrize('top_n', [1, 10, None])
+def test_organization_stats_match_baseline(frames, top_n):
+    result = BaseAnalyzer(frames).get_organization_stats(top_n=top_n)
+    baseline = pd.concat([
+        frames['projects']['organization'].value_counts(),
+        frames['winners']['organization'].value_counts()
+    ]).groupby(level=0).sum()
+    baseline = baseline.nlargest(top_n if top_n is not None else len(baseline))
+    assert result['获奖次数'].tolist() == baseline.tolist()
+    
+    keys = pd.concat([frames['projects']['organization'], frames['winners']['organization']], ignore_index=True)
+    ranking, counts = _ranking(keys)
+    assert result['机构名称'].tolist() == (ranking[:top_n] if top_n is not None else ranking)
+    assert dict(zip(result['机构名称'], result['获奖次数'])) == {k: counts[k] for k in result['机构名称']}
+
+def test_leaderboards_on_empty_frames():
+    frames = {'awards': pd.DataFrame(), 'projects': pd.DataFrame(columns=['project_id', 'name', 'organization']),
+              'winners': pd.DataFrame(columns=['project_id', 'name', 'organization'])}
+    analyzer = BaseAnalyzer(frames)
+    assert analyzer.get_winner_stats().empty
+    assert analyzer.get_organization_stats().empty
\ No newline at end of file
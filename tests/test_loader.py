@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+
+from analyzer.award import AwardAnalyzer
+from analyzer.loader import ExcelLoader
+from processor.transformer import DataTransformer
+from conftest import make_records
+
+@pytest.fixture(scope='module')
+def excel_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('excel') / 'award_data.xlsx')
+    DataTransformer.to_excel(DataTransformer().to_dataframe(make_records(200)), path)
+    return path
+
+def test_read_matches_read_excel(excel_path):
+    loader = ExcelLoader(excel_path)
+    for table in loader.sheet_names:
+        expected = pd.read_excel(excel_path, sheet_name=table)
+        pd.testing.assert_frame_equal(loader.read(table), expected)
+
+        columns = list(expected.columns)[1::2]
+        pd.testing.assert_frame_equal(loader.read(table, columns), expected[columns])
+    loader.close()
+
+def test_missing_sheet_is_empty(excel_path):
+    assert ExcelLoader(excel_path).read('missing').empty
+
+def test_requires_widens_projection(excel_path):
+    full = AwardAnalyzer()
+    full.load_data(excel_path)
+
+    partial = AwardAnalyzer()
+    partial.load_data(excel_path, analyses=['get_yearly_stats'])
+    assert 'winners' not in partial._columns
+
+    # 打开时未计划的分析在调用时读取所需的表和列
+    pd.testing.assert_frame_equal(partial.get_regional_analysis(), full.get_regional_analysis())
+    assert partial.get_basic_stats() == full.get_basic_stats()
+
+def test_undeclared_table_raises(excel_path):
+    analyzer = AwardAnalyzer()
+    analyzer.load_data(excel_path, analyses=['get_yearly_stats'])
+    with pytest.raises(KeyError):
+        analyzer.winners_df
\ No newline at end of file
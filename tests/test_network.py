@@ -0,0 +1,134 @@
+import random
+import time
+
+import networkx as nx
+import pandas as pd
+import pytest
+
+from analyzer.award import AwardAnalyzer
+from analyzer.incremental import IncrementalAggregator
+from analyzer.network import NetworkMetrics, compute_metrics
+
+@pytest.fixture(scope='module')
+def graph():
+    # 多个连通分量，外加孤立节点
+    G = nx.gnp_random_graph(60, 0.06, seed=1)
+    G.add_nodes_from(range(60, 64))
+    return nx.relabel_nodes(G, {node: f'获奖人{node}' for node in G})
+
+def _far_future():
+    return time.monotonic() + 3600
+
+def test_betweenness_with_every_pivot_is_exact(graph):
+    metrics = NetworkMetrics(pivots=graph.number_of_nodes())
+    betweenness, used = metrics.approximate_betweenness(graph, _far_future())
+    assert used == graph.number_of_nodes()
+    assert betweenness == pytest.approx(nx.betweenness_centrality(graph))
+
+def test_closeness_with_every_source_is_exact(graph):
+    metrics = NetworkMetrics(closeness_samples=graph.number_of_nodes())
+    components = sorted(nx.connected_components(graph), key=len, reverse=True)
+    closeness, _ = metrics.approximate_closeness(graph, components, _far_future())
+    assert closeness == pytest.approx(nx.closeness_centrality(graph))
+
+def test_sampled_betweenness_finds_the_hubs():
+    G = nx.barabasi_albert_graph(400, 2, seed=0)
+    exact = nx.betweenness_centrality(G)
+    betweenness, used = NetworkMetrics(pivots=100).approximate_betweenness(G, _far_future())
+    assert used == 100
+    top = sorted(betweenness, key=betweenness.get, reverse=True)[:10]
+    assert max(exact, key=exact.get) in top
+    # 抽样估计无偏，总量与精确值接近
+    assert sum(betweenness.values()) == pytest.approx(sum(exact.values()), rel=0.2)
+
+def test_expired_budget_stops_after_one_pivot(graph):
+    betweenness, used = NetworkMetrics(pivots=30).approximate_betweenness(graph, time.monotonic() - 1)
+    assert used == 1
+    assert set(betweenness) == set(graph)
+
+def test_exact_mode_matches_networkx(graph):
+    results = compute_metrics(graph, mode='exact')
+    assert not results['approximate']
+    assert results['clustering_coefficient'] == pytest.approx(nx.average_clustering(graph))
+    assert results['centrality']['betweenness'] == pytest.approx(nx.betweenness_centrality(graph))
+    assert results['centrality']['closeness'] == pytest.approx(nx.closeness_centrality(graph))
+
+def test_approximate_mode_keeps_top_k(graph):
+    results = NetworkMetrics(mode='approximate', top_k=5, pivots=graph.number_of_nodes()).compute(graph)
+    assert results['approximate']
+    assert results['component_count'] == nx.number_connected_components(graph)
+    exact = nx.betweenness_centrality(graph)
+    betweenness = results['centrality']['betweenness']
+    assert len(betweenness) == 5
+    assert sorted(betweenness.values(), reverse=True) == pytest.approx(sorted(exact.values(), reverse=True)[:5])
+
+def test_auto_mode_switches_on_node_count(graph):
+    metrics = NetworkMetrics(mode='auto')
+    metrics.exact_max_nodes = graph.number_of_nodes()
+    assert not metrics.compute(graph)['approximate']
+    metrics.exact_max_nodes = graph.number_of_nodes() - 1
+    assert metrics.compute(graph)['approximate']
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        NetworkMetrics(mode='fast')
+
+def _baseline_network(winners_df, key, min_weight):
+    """原实现：逐个项目累加获奖人对的边权重，再删除低权重的边"""
+    G = nx.Graph()
+    for _, group in winners_df.groupby('project_id'):
+        winners = group[key].dropna().unique().tolist()
+        for i in range(len(winners)):
+            for j in range(i + 1, len(winners)):
+                if G.has_edge(winners[i], winners[j]):
+                    G[winners[i]][winners[j]]['weight'] += 1
+                else:
+                    G.add_edge(winners[i], winners[j], weight=1)
+    if min_weight:
+        G.remove_edges_from([(u, v) for u, v, d in G.edges(data=True) if d['weight'] < min_weight])
+    return G
+
+def _weights(G):
+    return {frozenset((u, v)): d['weight'] for u, v, d in G.edges(data=True)}
+
+@pytest.fixture(scope='module')
+def frames():
+    # 获奖人较多，合作次数有高有低
+    rng = random.Random(0)
+    winners = pd.DataFrame({
+        'project_id': [rng.randrange(300) for _ in range(1500)],
+        'name': [f'获奖人{min(rng.randrange(200), rng.randrange(200))}' for _ in range(1500)],
+        'organization': '北京大学'
+    })
+    projects = pd.DataFrame({'project_id': range(300), 'name': [f'项目{i}' for i in range(300)]})
+    return {'awards': pd.DataFrame(), 'projects': projects, 'winners': winners}
+
+@pytest.mark.parametrize('min_weight', [None, 0, 1, 2, 3])
+def test_build_network_matches_baseline(frames, min_weight):
+    analyzer = AwardAnalyzer(frames)
+    expected = _baseline_network(analyzer.winners_df, analyzer._winner_key(), min_weight)
+    G = analyzer.build_network(min_weight)
+    # 低于阈值的边被删除，合作过的获奖人仍是网络中的节点
+    assert set(G.nodes) == set(expected.nodes)
+    assert _weights(G) == _weights(expected)
+    
+    results = analyzer.get_network_analysis(min_weight=min_weight, mode='exact')
+    assert results['node_count'] == expected.number_of_nodes()
+    assert results['edge_count'] == expected.number_of_edges()
+    assert results['density'] == pytest.approx(nx.density(expected))
+    assert len(results['components']) == nx.number_connected_components(expected)
+
+@pytest.mark.parametrize('min_weight', [None, 2])
+def test_incremental_network_matches_full(frames, min_weight):
+    aggregator = IncrementalAggregator()
+    aggregator.update(frames)
+    G = aggregator.build_network(min_weight)
+    expected = AwardAnalyzer(frames).build_network(min_weight)
+    assert list(G.nodes) == list(expected.nodes)
+    assert _weights(G) == _weights(expected)
+
+def test_network_is_built_once_per_threshold(frames):
+    analyzer = AwardAnalyzer(frames)
+    G = analyzer.build_network(2)
+    assert analyzer.build_network(2) is G
+    assert analyzer.build_network(3) is not G
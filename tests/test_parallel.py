@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from processor.cleaner import DataCleaner
+from processor.parallel import ParallelCleaner
+from test_vectorized import make_raw
+
+def _strip(records):
+    """去掉清理时写入的抓取时间"""
+    return [{k: v for k, v in record.items() if k != 'crawled_at'} for record in records]
+
+@pytest.fixture(scope='module')
+def raw():
+    data = make_raw(600)
+    # 夹杂乱码字段，检查各数据块的编码修复统计合并正确
+    for item in data[::7]:
+        item['title'] = item['title'].encode('utf-8').decode('latin-1')
+    return data
+
+@pytest.fixture(scope='module')
+def expected(raw):
+    cleaner = DataCleaner()
+    return _strip(cleaner.clean_records(raw)), cleaner.encoding_stats
+
+@pytest.mark.parametrize('batch_size', [1, 37, 1000])
+def test_in_process_chunks_match_single_cleaner(raw, expected, batch_size):
+    cleaner = ParallelCleaner(batch_size=batch_size, max_workers=1)
+    assert _strip(cleaner.clean_records(raw)) == expected[0]
+    assert cleaner.encoding_stats == expected[1]
+
+def test_worker_processes_keep_input_order(raw, expected):
+    cleaner = ParallelCleaner(batch_size=50, max_workers=2)
+    assert _strip(cleaner.clean_records(raw)) == expected[0]
+    assert cleaner.encoding_stats == expected[1]
+
+def test_vectorized_chunks_match_single_cleaner(raw):
+    expected = _strip(DataCleaner().clean_records(raw, vectorized=True))
+    assert _strip(ParallelCleaner(batch_size=64, max_workers=1, vectorized=True).clean_records(raw)) == expected
+
+def test_iter_clean_reads_input_lazily(raw):
+    consumed = []
+
+    def source():
+        for item in raw:
+            consumed.append(item)
+            yield item
+
+    first = next(ParallelCleaner(batch_size=10, max_workers=1).iter_clean(source()))
+    assert first['title'] == _strip(DataCleaner().clean_records(raw[:1]))[0]['title']
+    assert len(consumed) <= 10
+
+def test_clean_jsonl_skips_bad_lines(tmp_path, raw, expected):
+    input_path = tmp_path / 'raw.jsonl'
+    lines = [json.dumps(item, ensure_ascii=False) for item in raw]
+    lines[3:3] = ['', '{not json']
+    input_path.write_text('\n'.join(lines), encoding='utf-8')
+
+    output_path = tmp_path / 'clean.jsonl'
+    count = ParallelCleaner(batch_size=100, max_workers=1).clean_jsonl(str(input_path), str(output_path))
+    written = [json.loads(line) for line in output_path.read_text(encoding='utf-8').splitlines()]
+    assert count == len(written)
+    assert _strip(written) == expected[0]
\ No newline at end of file
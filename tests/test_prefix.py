@@ -0,0 +1,37 @@
+import pandas as pd
+
+from storage.prefix import PrefixIndex, get_prefix_index
+from storage.sqlite import AwardStore
+from conftest import make_records
+
+def test_complete_ranks_by_count_then_name():
+    index = PrefixIndex(['北京大学', '北京理工大学', '北京师范大学', '清华大学'], [3, 5, 3, 9], pinyin=False)
+    assert index.complete('北京', top_k=2) == [
+        {'name': '北京理工大学', 'count': 5}, {'name': '北京大学', 'count': 3}
+    ]
+    assert [item['name'] for item in index.complete('北京')] == ['北京理工大学', '北京大学', '北京师范大学']
+    assert index.complete('复旦') == []
+    assert index.complete('') == []
+
+def test_organization_counts_distinct_awards(award_store):
+    index = get_prefix_index(award_store, 'organization')
+    frames = award_store.load_frames()
+    projects = frames['projects'][['project_id', 'award_id', 'organization']]
+    winners = frames['winners'][['project_id', 'organization']].merge(projects[['project_id', 'award_id']], on='project_id')
+    pairs = pd.concat([projects[['award_id', 'organization']], winners[['award_id', 'organization']]])
+    expected = pairs.dropna().groupby('organization').award_id.nunique()
+    for item in index.complete('北京大学'):
+        assert item['count'] == expected[item['name']]
+
+def test_index_rebuilt_after_replacing_award(tmp_path):
+    store = AwardStore(str(tmp_path / 'prefix.db'))
+    last = {'title': '奖项末尾', 'year': 2020, 'source_url': 'http://example.com/award/last',
+            'projects': [{'name': '项目末尾', 'level': '一等奖', 'winners': [{'name': '张伟', 'organization': '北京大学'}]}]}
+    store.upsert_records(make_records(20) + [last])
+    assert get_prefix_index(store, 'winner').complete('欧阳') == []
+
+    # 替换最后写入的奖项时项目和获奖人重新分配到相同的主键，各表的最大主键不变
+    project = dict(last['projects'][0], winners=[{'name': '欧阳明', 'organization': '北京大学'}])
+    store.upsert_records([dict(last, projects=[project])])
+
+    assert get_prefix_index(store, 'winner').complete('欧阳') == [{'name': '欧阳明', 'count': 1}]
\ No newline at end of file
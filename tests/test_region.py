@@ -0,0 +1,94 @@
+import random
+
+import pandas as pd
+import pytest
+
+from config.config import REGION_CONFIG
+from config.regions import PROVINCES
+from analyzer.region import RegionResolver
+from conftest import ORGANIZATIONS
+
+ENTRIES = dict(RegionResolver.default_entries())
+FILLERS = ['大学', '研究所', '医院', '中国', '科学院', '某某', '第一', '分公司', 'A', ' ']
+
+def _reference(org):
+    """参考实现：逐个位置比较全部词条，取最先出现位置上最长的词条"""
+    if not isinstance(org, str) or not org.strip():
+        return REGION_CONFIG['unknown']
+    org = org.strip()
+    for start in range(len(org)):
+        keys = [key for key in ENTRIES if org.startswith(key, start)]
+        if keys:
+            return ENTRIES[max(keys, key=len)]
+    return REGION_CONFIG['unmatched']
+
+def make_orgs(count, seed=0):
+    rng = random.Random(seed)
+    keys = list(ENTRIES)
+    orgs = []
+    for _ in range(count):
+        parts = [rng.choice(FILLERS) for _ in range(rng.randint(0, 3))]
+        for _ in range(rng.randint(0, 2)):
+            # 截断的词条用于检验前缀不会误匹配
+            key = rng.choice(keys)
+            parts.insert(rng.randint(0, len(parts)), key[:rng.randint(1, len(key))])
+        orgs.append(''.join(parts))
+    return orgs + [None, '', '   ', float('nan')]
+
+@pytest.fixture(scope='module')
+def orgs():
+    return make_orgs(3000)
+
+def test_resolve_matches_reference(orgs):
+    resolver = RegionResolver()
+    assert [resolver.resolve(org) for org in orgs] == [_reference(org) for org in orgs]
+
+def test_resolve_series_matches_resolve(orgs):
+    series = pd.Series(orgs, index=range(10, 10 + len(orgs)), dtype=object)
+    regions = RegionResolver().resolve_series(series)
+    assert regions.index.equals(series.index)
+    assert regions.tolist() == [_reference(org) for org in orgs]
+
+@pytest.mark.parametrize('org, region', [
+    ('中国科学院上海光学精密机械研究所', '上海'),
+    ('内蒙古大学', '内蒙古'),
+    ('黑龙江省农业科学院', '黑龙江'),
+    ('清华大学', '北京'),
+    ('南京大学', '江苏'),
+    ('广州中医药大学', '广东'),
+    ('新疆生产建设兵团第一师', '新疆'),
+    (' 浙江大学 ', '浙江'),
+    ('某某研究所', REGION_CONFIG['unmatched']),
+    (None, REGION_CONFIG['unknown']),
+    ('', REGION_CONFIG['unknown'])
+])
+def test_known_organizations(org, region):
+    assert RegionResolver().resolve(org) == region
+
+def test_agrees_with_prefix_baseline_on_province_names():
+    # 原实现取机构名称前两个字；名称以省份开头时结果不变
+    orgs = ORGANIZATIONS + [f'{province}省人民医院' for province in PROVINCES if len(province) == 2]
+    resolver = RegionResolver()
+    for org in orgs:
+        if org[:2] in PROVINCES:
+            assert resolver.resolve(org) == org[:2]
+
+def test_longest_match_at_leftmost_position():
+    resolver = RegionResolver([('AB', 'x'), ('ABC', 'y'), ('B', 'z'), ('CD', 'w')])
+    assert resolver.resolve('QABCD') == 'y'
+    assert resolver.resolve('QABD') == 'x'
+    assert resolver.resolve('QBCD') == 'z'
+    assert resolver.resolve('QACD') == 'w'
+    assert resolver.resolve('QA') == REGION_CONFIG['unmatched']
+
+def test_region_counts_order(orgs):
+    series = pd.Series(orgs, dtype=object)
+    stats = RegionResolver().region_counts(series)
+    assert list(stats.columns) == ['地区', '获奖次数']
+    
+    regions = [_reference(org) for org in orgs]
+    first = {region: regions.index(region) for region in set(regions)}
+    counts = pd.Series(regions).value_counts()
+    expected = sorted(counts.index, key=lambda region: (-counts[region], first[region]))
+    assert stats['地区'].tolist() == expected
+    assert stats['获奖次数'].tolist() == [counts[region] for region in expected]
\ No newline at end of file
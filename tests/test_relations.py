@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+from processor.relations import GroupIndex, add_relation_keys
+from processor.transformer import DataTransformer
+from conftest import make_records
+
+def test_group_index_offsets_and_parents():
+    # 父键无序，子键含父表中不存在的键；父行 30 没有子行
+    index = GroupIndex.build([20, 10, 30], [10, 20, 99, 10, 20, 20])
+    assert index.offsets.tolist() == [0, 3, 5, 5]
+    assert index.parents.tolist() == [1, 0, -1, 1, 0, 0]
+    assert [index.group(i).tolist() for i in range(len(index))] == [[1, 4, 5], [0, 3], []]
+    assert index.sizes().tolist() == [3, 2, 0]
+
+def test_group_index_matches_groupby():
+    data = DataTransformer.to_dataframe(make_records(200))
+    index = GroupIndex.from_frames(data['projects'], data['winners'], 'project_id')
+    groups = data['winners'].groupby('project_id').indices
+    for position, project_id in enumerate(data['projects']['project_id']):
+        assert index.group(position).tolist() == groups.get(project_id, np.array([], dtype=int)).tolist()
+    assert GroupIndex.from_frames(data['projects'], data['winners'].drop(columns='project_id'), 'project_id') is None
+
+def test_add_relation_keys_links_by_first_name():
+    data = add_relation_keys({
+        'awards': pd.DataFrame({'title': ['奖项A', '奖项B', '奖项A']}),
+        'projects': pd.DataFrame({'name': ['项目1', '项目2', '项目1'], 'award_title': ['奖项A', '奖项C', '奖项B']}),
+        'winners': pd.DataFrame({'name': ['张伟', '王芳', '李娜'], 'project_name': ['项目1', '项目2', '项目3']})
+    })
+    assert data['awards']['award_id'].tolist() == [0, 1, 2]
+    assert data['projects']['project_id'].tolist() == [0, 1, 2]
+    assert data['projects']['award_id'].tolist() == [0, pd.NA, 1]
+    assert data['winners']['project_id'].tolist() == [0, 1, pd.NA]
+
+def test_add_relation_keys_keeps_existing_keys():
+    data = DataTransformer.to_dataframe(make_records(20))
+    result = add_relation_keys(data)
+    for name in ('awards', 'projects', 'winners'):
+        assert result[name] is data[name]
+
+def test_merged_keys_match_single_batch():
+    # 分批转换后合并，整数键与一次转换全部数据的结果一致，各奖项的项目、获奖人不串批
+    records = make_records(90)
+    batches = [records[:40], records[40:41], [dict(record, projects=[]) for record in records[41:50]], records[50:]]
+    merged = DataTransformer.merge_dataframes([DataTransformer.to_dataframe(batch) for batch in batches])
+    expected = DataTransformer.to_dataframe(
+        records[:41] + [dict(record, projects=[]) for record in records[41:50]] + records[50:]
+    )
+    for name, key in (('awards', 'award_id'), ('projects', 'project_id'), ('projects', 'award_id'), ('winners', 'project_id')):
+        assert merged[name][key].tolist() == expected[name][key].tolist(), (name, key)
+
+    index = GroupIndex.from_frames(merged['awards'], merged['projects'], 'award_id')
+    sizes = [len(record['projects']) for record in records]
+    assert index.sizes().tolist() == sizes[:41] + [0] * 9 + sizes[50:]
+    titles = merged['projects']['award_title']
+    for position, title in enumerate(merged['awards']['title']):
+        assert set(titles.iloc[index.group(position)]) <= {title}
+
+def test_offset_relation_keys_skips_batches_without_keys():
+    first = DataTransformer.to_dataframe(make_records(5))
+    empty = {'awards': pd.DataFrame({'award_id': pd.Series([], dtype='int64')})}
+    second = DataTransformer.to_dataframe(make_records(3, seed=1))
+    shifted = DataTransformer._offset_relation_keys([first, empty, second])
+    assert shifted[0]['awards'] is first['awards']
+    assert shifted[2]['awards']['award_id'].tolist() == [5, 6, 7]
+    assert shifted[2]['projects']['project_id'].min() == len(first['projects'])
\ No newline at end of file
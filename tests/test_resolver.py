@@ -0,0 +1,132 @@
+import random
+from itertools import combinations
+
+import pandas as pd
+import pytest
+
+from processor.resolver import EntityResolver, SUBUNIT_PATTERN, INSTITUTION_PATTERN
+
+def test_normalize_names():
+    assert EntityResolver.normalize_organization(' 清华大学（计算机系）') == '清华大学计算机系'
+    assert EntityResolver.normalize_organization('ＡＢＣ 公司') == 'abc公司'
+    assert EntityResolver.normalize_organization(None) is None
+    assert EntityResolver.normalize_organization(' - ') is None
+    assert EntityResolver.normalize_name('张 伟 教授') == '张伟'
+    # 去掉职称后不足两个字时保留原姓名
+    assert EntityResolver.normalize_name('博士') == '博士'
+
+def test_subunits_merge_into_parent():
+    resolver = EntityResolver(registry_file='unused.json')
+    ids = resolver.resolve_organizations(['清华大学计算机系', '清华大学', '清华大学化学系', '北京大学', '清华'])
+    assert ids['清华大学计算机系'] == ids['清华大学'] == ids['清华大学化学系']
+    assert len({ids['清华大学'], ids['北京大学'], ids['清华']}) == 3
+    # 新机构以最短的写法作为显示名称
+    assert resolver.organization_name(ids['清华大学']) == '清华大学'
+
+def _partition(mapping):
+    groups = {}
+    for name, org_id in mapping.items():
+        groups.setdefault(org_id, set()).add(name)
+    return sorted(sorted(group) for group in groups.values())
+
+def _brute_force(resolver, names):
+    """不分块的参照实现：同前缀的名称两两比较相似度，再按下属单位规则归并"""
+    normalized = list(dict.fromkeys(resolver.normalize_organization(name) for name in names))
+    parents = {name: name for name in normalized}
+
+    def find(name):
+        while parents[name] != name:
+            name = parents[name]
+        return name
+
+    def union(a, b):
+        parents[find(a)] = find(b)
+
+    for a, b in combinations(normalized, 2):
+        ga, gb = resolver._ngrams(a), resolver._ngrams(b)
+        if a[:2] == b[:2] and len(ga & gb) / len(ga | gb) >= resolver.similarity_threshold:
+            union(a, b)
+    for name in normalized:
+        if SUBUNIT_PATTERN.search(name):
+            for end in range(len(name) - 1, 1, -1):
+                parent = name[:end]
+                if parent in parents and INSTITUTION_PATTERN.search(parent) and SUBUNIT_PATTERN.search(name[end:]):
+                    union(name, parent)
+                    break
+    return _partition({name: find(name) for name in normalized})
+
+def test_blocking_matches_all_pairs():
+    rng = random.Random(3)
+    stems = ['北京', '清华', '浙江', '中国科学', '上海交通', '华中科技', '复旦']
+    suffixes = ['大学', '理工大学', '科学院', '研究所', '大学计算机系', '大学附属医院', '大学化学研究所']
+    names = []
+    for _ in range(400):
+        name = rng.choice(stems) + rng.choice(['', '省', '市', '工业']) + rng.choice(suffixes)
+        if rng.random() < 0.3:
+            position = rng.randrange(len(name) + 1)
+            name = name[:position] + rng.choice(['·', ' ', '新', '医']) + name[position:]
+        names.append(name)
+
+    resolver = EntityResolver(registry_file='unused.json', max_block_size=10 ** 6)
+    ids = resolver.resolve_organizations(names)
+    normalized = {resolver.normalize_organization(name): org_id for name, org_id in ids.items()}
+    assert _partition(normalized) == _brute_force(resolver, names)
+
+def test_similar_names_merge_unless_block_is_too_large():
+    names = ['浙江大学医学院附属第一医院', '浙江大学医学院附属第一医院院']
+    ids = EntityResolver(registry_file='unused.json').resolve_organizations(names)
+    assert ids[names[0]] == ids[names[1]]
+    # 超过分块上限的高频分块不参与比较
+    ids = EntityResolver(registry_file='unused.json', max_block_size=1).resolve_organizations(names)
+    assert ids[names[0]] != ids[names[1]]
+
+def test_winners_keyed_by_organization():
+    resolver = EntityResolver(registry_file='unused.json')
+    names = pd.Series(['张伟', '张伟教授', '张伟', '王芳', '王芳', '王芳', '李娜'])
+    org_ids = pd.Series([1, 1, 2, 1, None, None, None], dtype='Int64')
+    ids = resolver.resolve_winners(names, org_ids).tolist()
+
+    assert ids[0] == ids[1] != ids[2]
+    # 缺少机构的记录在同名实体唯一时归并，否则视为新的获奖人
+    assert ids[3] == ids[4] == ids[5]
+    assert len(set(ids)) == 4
+    ids = resolver.resolve_winners(pd.Series(['张伟']), pd.Series([None], dtype='Int64')).tolist()
+    assert ids[0] not in (resolver.winner_ids['1|张伟'], resolver.winner_ids['2|张伟'])
+
+def test_resolve_adds_nullable_id_columns():
+    data = {
+        'projects': pd.DataFrame({'name': ['项目1', '项目2'], 'organization': ['清华大学', None]}),
+        'winners': pd.DataFrame({'name': ['张伟', None], 'organization': ['清华大学计算机系', '北京大学']})
+    }
+    result = EntityResolver(registry_file='unused.json').resolve(data)
+    assert str(result['projects']['org_id'].dtype) == 'Int64'
+    assert result['projects']['org_id'].isna().tolist() == [False, True]
+    assert result['winners']['org_id'][0] == result['projects']['org_id'][0]
+    assert result['winners']['winner_id'].isna().tolist() == [False, True]
+    assert 'org_id' not in data['projects'].columns
+
+def test_registry_keeps_ids_across_batches(tmp_path):
+    registry = str(tmp_path / 'entities.json')
+    first = EntityResolver(registry_file=registry)
+    org_ids = first.resolve_organizations(['清华大学', '北京大学'])
+    winner_ids = first.resolve_winners(pd.Series(['张伟', '王芳']), pd.Series([org_ids['清华大学'], org_ids['北京大学']], dtype='Int64'))
+    first.save_registry()
+
+    second = EntityResolver(registry_file=registry)
+    second.load_registry()
+    assert second.org_labels == first.org_labels and second.winner_labels == first.winner_labels
+
+    # 新的写法归并到已注册的机构，新机构、新获奖人的ID接着已有的最大ID分配
+    ids = second.resolve_organizations(['清华大学软件学院', '北京大学', '复旦大学'])
+    assert ids['清华大学软件学院'] == org_ids['清华大学'] and ids['北京大学'] == org_ids['北京大学']
+    assert ids['复旦大学'] == max(org_ids.values()) + 1
+
+    names = pd.Series(['张伟', '王芳', '李娜'])
+    again = second.resolve_winners(names, pd.Series([org_ids['清华大学'], None, org_ids['北京大学']], dtype='Int64'))
+    # 缺少机构的“王芳”经重建的姓名索引归并到已注册的获奖人
+    assert again.tolist() == winner_ids.tolist() + [max(winner_ids) + 1]
+
+def test_missing_registry_is_empty(tmp_path):
+    resolver = EntityResolver(registry_file=str(tmp_path / 'missing.json'))
+    resolver.load_registry()
+    assert resolver.org_ids == {} and resolver.resolve_organizations(['清华大学']) == {'清华大学': 1}
\ No newline at end of file
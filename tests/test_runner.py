@@ -0,0 +1,103 @@
+import os
+import threading
+import time
+
+import networkx as nx
+import pytest
+
+from analyzer.award import AwardAnalyzer
+from analyzer.network import compute_metrics
+from analyzer.runner import AnalysisRunner
+from config.config import ANALYSIS_CONFIG
+
+def _record(log, name, value=None, delay=0.0):
+    def task(*args):
+        log.append(('start', name, args))
+        time.sleep(delay)
+        log.append(('end', name))
+        return value if value is not None else name
+    return task
+
+def _fail(*args):
+    raise RuntimeError('任务失败')
+
+def _pid(*args):
+    return os.getpid()
+
+def _diamond(log, workers):
+    # a -> (b, c) -> d，b 比 c 慢，d 按声明顺序接收 (b, c) 的结果
+    runner = AnalysisRunner(max_workers=workers)
+    runner.add('a', _record(log, 'a', delay=0.01))
+    runner.add('b', _record(log, 'b', delay=0.05), depends=['a'])
+    runner.add('c', _record(log, 'c'), depends=['a'])
+    runner.add('d', _record(log, 'd'), depends=['b', 'c'])
+    return runner
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_dependencies_finish_before_dependents_start(workers):
+    log = []
+    results = _diamond(log, workers).run()
+    assert results == {'a': 'a', 'b': 'b', 'c': 'c', 'd': 'd'}
+
+    position = {(event[0], event[1]): i for i, event in enumerate(log)}
+    for name, depends in (('b', 'a'), ('c', 'a'), ('d', 'b'), ('d', 'c')):
+        assert position[('end', depends)] < position[('start', name)]
+    assert next(event for event in log if event[:2] == ('start', 'd'))[2] == ('b', 'c')
+
+def test_sequential_runs_in_added_order():
+    log = []
+    _diamond(log, 1).run()
+    assert [event[1] for event in log if event[0] == 'start'] == ['a', 'b', 'c', 'd']
+
+def test_independent_tasks_run_concurrently():
+    # 两个任务互相等待对方开始，串行执行时会超时
+    barrier = threading.Barrier(2, timeout=5)
+    runner = AnalysisRunner(max_workers=2)
+    runner.add('x', lambda: barrier.wait() is not None)
+    runner.add('y', lambda: barrier.wait() is not None)
+    assert runner.run() == {'x': True, 'y': True}
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_failure_skips_dependents_only(workers):
+    log = []
+    runner = AnalysisRunner(max_workers=workers)
+    runner.add('a', _fail)
+    runner.add('b', _record(log, 'b'), depends=['a'])
+    runner.add('c', _record(log, 'c'), depends=['b'])
+    runner.add('d', _record(log, 'd'))
+    runner.add('e', _record(log, 'e'), depends=['d'])
+
+    assert runner.run() == {'d': 'd', 'e': 'e'}
+    assert not any(event[1] in ('b', 'c') for event in log)
+    assert set(runner.timings) == {'a', 'd', 'e'}
+
+def test_invalid_graph_rejected():
+    runner = AnalysisRunner().add('a', _pid)
+    with pytest.raises(ValueError):
+        runner.add('a', _pid)
+    with pytest.raises(ValueError):
+        runner.add('b', _pid, depends=['missing'])
+
+def test_process_tasks_run_in_worker_processes():
+    runner = AnalysisRunner(max_workers=2, process_workers=1)
+    runner.add('graph', lambda: nx.karate_club_graph())
+    runner.add('metrics', compute_metrics, depends=['graph'], process=True)
+    runner.add('pid', _pid, process=True)
+    runner.add('failed', _fail, process=True)
+    runner.add('skipped', _pid, depends=['failed'])
+
+    results = runner.run()
+    assert results['pid'] != os.getpid()
+    assert results['metrics'] == compute_metrics(nx.karate_club_graph())
+    assert 'failed' not in results and 'skipped' not in results
+    assert {'metrics', 'pid'} <= set(runner.timings)
+
+def test_network_analysis_in_worker_process(award_store, monkeypatch):
+    analyzer = AwardAnalyzer()
+    analyzer.load_store(award_store.db_path)
+    expected = analyzer.get_network_analysis(min_weight=analyzer.config['network_min_weight'])
+
+    monkeypatch.setitem(ANALYSIS_CONFIG, 'network_process', True)
+    analyzer.analyze()
+    assert analyzer.results['network_analysis'] == expected
+    assert 'network_metrics' in analyzer.timings
\ No newline at end of file
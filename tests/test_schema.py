@@ -0,0 +1,72 @@
+import pandas as pd
+import pytest
+
+from config.config import AWARD_LEVELS, AWARD_TYPES
+from processor.schema import DataSchema
+from processor.transformer import DataTransformer
+from conftest import make_records, EXTRA_LEVELS, EXTRA_TYPES
+
+def _plain(df):
+    """转为object类型并统一缺失值，用于比较取值"""
+    df = df.astype(object)
+    return df.where(df.notna(), None)
+
+@pytest.fixture(scope='module')
+def raw():
+    # 不应用类型模式的原始DataFrame（原先的对象类型列）
+    records = make_records(300)
+    awards = pd.DataFrame([{k: v for k, v in r.items() if k != 'projects'} for r in records])
+    projects = pd.DataFrame([dict(p, award_title=r['title']) for r in records for p in r['projects']]).drop(columns='winners')
+    winners = pd.DataFrame([w for r in records for p in r['projects'] for w in p['winners']])
+    return {'awards': awards, 'projects': projects, 'winners': winners}
+
+def test_dtypes(raw):
+    typed = DataSchema.apply(raw)
+    award_type = typed['awards']['award_type'].dtype
+    assert isinstance(award_type, pd.CategoricalDtype)
+    # 词表在前，词表以外的取值按升序追加
+    assert list(award_type.categories) == AWARD_TYPES + sorted(EXTRA_TYPES)
+    assert list(typed['awards']['award_level'].cat.categories) == AWARD_LEVELS + EXTRA_LEVELS
+    assert list(typed['projects']['level'].cat.categories) == AWARD_LEVELS
+    assert str(typed['awards']['year'].dtype) == 'Int16'
+    assert typed['winners']['organization'].dtype == object
+
+def test_values_unchanged(raw):
+    typed = DataSchema.apply(raw)
+    for name in raw:
+        pd.testing.assert_frame_equal(_plain(typed[name]), _plain(raw[name]), check_dtype=False)
+    assert DataSchema.apply(raw)['awards']['year'].memory_usage(deep=True) < raw['awards']['year'].memory_usage(deep=True)
+
+def test_invalid_years_become_missing():
+    years = DataSchema.to_year(pd.Series([2020, '2019', 2018.0, 2017.5, '2020年', None]))
+    assert years.tolist()[:3] == [2020, 2019, 2018]
+    assert years.isna().tolist()[3:] == [True, True, True]
+
+def test_organizations_are_interned(raw):
+    organizations = DataSchema.apply(raw)['winners']['organization'].dropna()
+    # 由不同对象拼接出的相同名称驻留后共享同一个对象
+    copies = pd.Series([''.join(list(name)) for name in organizations])
+    interned = DataSchema.intern_strings(copies)
+    first = {}
+    for value in interned:
+        assert first.setdefault(value, value) is value
+
+def test_value_counts_order():
+    series = DataSchema.to_category(pd.Series(['二等奖', '一等奖', '金奖', '二等奖', '一等奖', None]), AWARD_LEVELS)
+    # 次数相同时按类别顺序，未出现的类别不输出
+    assert DataSchema.value_counts(series).to_dict() == {'一等奖': 2, '二等奖': 2, '金奖': 1}
+    assert DataSchema.value_counts(pd.Series(['b', 'a', 'a', 'b', 'c'])).index.tolist() == ['b', 'a', 'c']
+
+def test_merge_reapplies_categories():
+    first = DataTransformer.to_dataframe(make_records(20))
+    second = DataTransformer.to_dataframe([dict(r, award_type='新增类型奖') for r in make_records(5, seed=1)])
+    merged = DataTransformer.merge_dataframes([first, second])
+    assert isinstance(merged['awards']['award_type'].dtype, pd.CategoricalDtype)
+    assert '新增类型奖' in merged['awards']['award_type'].cat.categories
+    assert merged['awards']['award_type'].tolist() == first['awards']['award_type'].tolist() + ['新增类型奖'] * 5
+
+def test_empty_and_unknown_tables_pass_through():
+    empty = pd.DataFrame()
+    assert DataSchema.apply_frame(empty, 'awards') is empty
+    other = pd.DataFrame({'year': ['x']})
+    pd.testing.assert_frame_equal(DataSchema.apply_frame(other, 'winners'), other)
\ No newline at end of file
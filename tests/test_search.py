@@ -0,0 +1,139 @@
+import random
+import sqlite3
+
+import pytest
+
+from storage.search import SearchIndex, split_chars, tokenize
+from storage.sqlite import AwardStore
+from conftest import make_records
+from test_text import make_names
+
+QUERIES = ['北京大学', '人工智能', '深度学习 清华', '张伟', '伟', '华大', '基因治疗', '复合材料 上海交通大学',
+           '电子科技', 'ai', '某某研究所 水稻', '不存在的词']
+
+def make_search_records(count, seed=0):
+    """项目名称由领域词组成的奖项数据"""
+    records = make_records(count, seed)
+    names = iter(make_names(4 * count, seed))
+    for record in records:
+        for project in record['projects']:
+            project['name'] = next(names)
+    return records
+
+def _documents(db_path):
+    """原始数据中的全部可检索文档"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("""
+            SELECT 'award', a.id, a.title, NULL FROM awards a
+            UNION ALL
+            SELECT 'project', p.id, p.name, o.name FROM projects p
+            LEFT JOIN organizations o ON o.id = p.organization_id
+            UNION ALL
+            SELECT 'winner', w.id, w.name, o.name FROM winners w
+            LEFT JOIN organizations o ON o.id = w.organization_id
+        """).fetchall()
+    finally:
+        conn.close()
+
+def _scan(documents, query, kind=None):
+    """参考实现：逐个文档做子串匹配，查询的每个片段都出现在名称或机构中"""
+    segments = query.lower().split()
+    return {
+        (doc_kind, doc_id) for doc_kind, doc_id, label, org in documents
+        if (kind is None or doc_kind == kind)
+        and all(segment in (label or '').lower() or segment in (org or '').lower() for segment in segments)
+    }
+
+def _strip(text):
+    """索引的 unicode61 分词器忽略标点符号"""
+    return ''.join(ch for ch in text if ch.isalnum())
+
+def _matches(hit, query):
+    """命中的文档包含全部分词结果，或逐字包含查询的各个片段"""
+    words = set(tokenize(hit['name']).split()) | set(tokenize(hit['organization']).split())
+    chars = _strip(split_chars(hit['name'], hit['organization']))
+    return (all(word in words for word in tokenize(query).split() if _strip(word))
+            or all(_strip(segment.lower()) in chars for segment in query.split()))
+
+def _all_hits(index, query, kind=None):
+    """逐页取出全部命中"""
+    hits = []
+    while True:
+        page = index.search(query, kind=kind, limit=100, offset=len(hits))['hits']
+        hits.extend(page)
+        if len(page) < 100:
+            return hits
+
+@pytest.fixture(scope='module')
+def store(tmp_path_factory):
+    store = AwardStore(str(tmp_path_factory.mktemp('search') / 'search.db'))
+    store.upsert_records(make_search_records(150))
+    return store
+
+@pytest.mark.parametrize('query', QUERIES)
+@pytest.mark.parametrize('kind', [None, 'project', 'winner'])
+def test_search_finds_every_substring_match(store, query, kind):
+    index = SearchIndex(store)
+    hits = _all_hits(index, query, kind)
+    assert len(hits) == index.search(query, kind=kind)['total']
+    assert {(hit['kind'], hit['id']) for hit in hits} >= _scan(_documents(store.db_path), query, kind)
+    assert all(_matches(hit, query) for hit in hits)
+    assert all(kind is None or hit['kind'] == kind for hit in hits)
+
+def test_results_are_ranked_and_paged(store):
+    index = SearchIndex(store)
+    full = index.search('北京大学', limit=100)
+    assert full['total'] > 30
+    scores = [hit['score'] for hit in full['hits']]
+    assert scores == sorted(scores, reverse=True)
+    
+    pages = [index.search('北京大学', limit=10, offset=offset)['hits'] for offset in range(0, 30, 10)]
+    assert [hit['id'] for page in pages for hit in page] == [hit['id'] for hit in full['hits'][:30]]
+    assert len(index.search('北京大学', limit=10 ** 6)['hits']) == min(full['total'], 100)
+
+@pytest.mark.parametrize('query', ['"', 'AND', 'a OR b', 'NEAR(张伟', '北京*', '-', '   '])
+def test_query_syntax_is_not_interpreted(store, query):
+    result = SearchIndex(store).search(query)
+    assert all(_matches(hit, query) for hit in result['hits'])
+
+def test_unknown_kind_returns_nothing(store):
+    assert SearchIndex(store).search('北京大学', kind='organization')['hits'] == []
+
+def test_upsert_reindexes_written_awards(tmp_path):
+    store = AwardStore(str(tmp_path / 'update.db'))
+    records = make_search_records(20)
+    store.upsert_records(records)
+    index = SearchIndex(store)
+    
+    record = dict(records[0], projects=[{'name': '量子通信网络', 'organization': '中国科学技术大学',
+                                         'level': '一等奖', 'winners': [{'name': '欧阳明'}]}])
+    old_names = {project['name'] for project in records[0]['projects']}
+    store.upsert_records([record])
+    
+    assert {hit['name'] for hit in index.search('量子通信', kind='project')['hits']} == {'量子通信网络'}
+    assert index.search('欧阳', kind='winner')['total'] == 1
+    # 被替换的项目不再出现在索引中
+    documents = _documents(store.db_path)
+    for name in old_names - {doc[2] for doc in documents}:
+        assert not any(hit['name'] == name for hit in index.search(name, kind='project', limit=100)['hits'])
+    assert index.search('量子', limit=100)['total'] == len(_scan(documents, '量子'))
+
+def test_backfill_indexes_existing_database(tmp_path):
+    store = AwardStore(str(tmp_path / 'backfill.db'))
+    store.upsert_records(make_search_records(30))
+    index = SearchIndex(store)
+    expected = _all_hits(index, '北京大学')
+    
+    # 模拟建立索引之前的数据库
+    with store.connect() as conn:
+        conn.execute('DELETE FROM search_index')
+        conn.execute('DELETE FROM search_docs')
+    assert index.search('北京大学')['total'] == 0
+    
+    documents = index.backfill()
+    assert documents == len([doc for doc in _documents(store.db_path) if doc[2] or doc[3]])
+    assert _all_hits(index, '北京大学') == expected
+    # 已有索引时不再补建
+    assert index.backfill() == 0
+    assert index.rebuild() == documents
\ No newline at end of file
@@ -0,0 +1,129 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from processor.transformer import DataTransformer
+from storage.sqlite import AwardStore
+from conftest import make_records
+
+@pytest.fixture
+def store(tmp_path):
+    return AwardStore(str(tmp_path / 'awards.db'))
+
+def _nested(store):
+    """按奖项业务键读出 (奖项字段, [(项目名称, 机构, 等级, [(姓名, 机构)])])"""
+    data = store.load_frames()
+    awards = data['awards'].astype(object).where(data['awards'].notna(), None)
+    projects = data['projects'].astype(object).where(data['projects'].notna(), None)
+    winners = data['winners'].astype(object).where(data['winners'].notna(), None)
+    result = {}
+    for award in awards.to_dict('records'):
+        award_projects = []
+        for project in projects[projects['award_id'] == award['award_id']].to_dict('records'):
+            members = winners[winners['project_id'] == project['project_id']]
+            award_projects.append((project['name'], project['organization'], project['level'],
+                                   list(zip(members['name'], members['organization']))))
+        result[AwardStore.award_key(award)] = (award['title'], award['year'], award['award_level'], award_projects)
+    return result
+
+def _expected(records):
+    result = {}
+    for record in records:
+        projects = [
+            (p['name'], p['organization'], p['level'], [(w['name'], w['organization']) for w in p['winners']])
+            for p in record['projects']
+        ]
+        result[AwardStore.award_key(record)] = (record['title'], record['year'], record.get('award_level'), projects)
+    return result
+
+def test_upsert_replaces_awards_in_place(store):
+    records = make_records(30)
+    store.upsert_records(records)
+    award_ids = store.load_frames()['awards']['award_id'].tolist()
+
+    # 重新写入：更新字段并整体替换项目和获奖人，同一批中重复的业务键保留最后一条
+    changed = dict(records[4], award_level='金奖', projects=[
+        {'name': '替换项目', 'organization': '复旦大学', 'level': '一等奖', 'winners': [{'name': '欧阳明', 'organization': None}]}
+    ])
+    assert store.upsert_records([dict(records[4], title='中间版本'), changed, {'title': None, 'source_url': None}]) == 1
+
+    records[4] = changed
+    assert _nested(store) == _expected(records)
+    assert store.load_frames()['awards']['award_id'].tolist() == award_ids
+
+    # 被替换的项目和获奖人不残留，机构名称只保存一份
+    summary = store.get_summary()
+    assert summary['projects'] == sum(len(r['projects']) for r in records)
+    assert summary['winners'] == sum(len(p['winners']) for r in records for p in r['projects'])
+    names = [row[0] for row in sqlite3.connect(store.db_path).execute('SELECT name FROM organizations')]
+    assert len(names) == len(set(names))
+
+def test_failed_write_rolls_back(store):
+    records = make_records(10)
+    store.upsert_records(records)
+    version = store.data_version()
+    before = _nested(store)
+
+    # 无法写入的字段值使整个写事务回滚
+    broken = [dict(records[0], award_level='金奖'), dict(make_records(11)[10], content={'bad': 1})]
+    assert store.upsert_records(broken) == 0
+    assert _nested(store) == before
+    assert store.data_version() == version
+
+def test_filters_and_counts(store):
+    records = make_records(80)
+    store.upsert_records(records)
+    awards = store.load_frames()['awards']
+
+    for column, value in (('year', 2020), ('award_type', '科技进步奖'), ('award_level', '一等奖')):
+        expected = awards[awards[column] == value]
+        data = store.load_frames(**{column: value})
+        assert data['awards']['award_id'].tolist() == expected['award_id'].tolist()
+        assert set(data['projects']['award_id']) <= set(expected['award_id'])
+        assert store.count_awards(**{column: value}) == len(expected)
+
+    counts = awards['year'].value_counts().sort_index()
+    assert store.count_by('year') == {int(year): count for year, count in counts.items()}
+    assert store.query_awards(limit=5, offset=10)['award_id'].tolist() == awards['award_id'].tolist()[10:15]
+
+def test_collaboration_stats_match_frames(award_store):
+    projects = award_store.load_frames()['projects']
+    counts = projects.dropna(subset=['name']).groupby('name')['organization'].nunique()
+    assert award_store.collaboration_stats() == {
+        'single_org': int((counts == 1).sum()), 'multi_org': int((counts > 1).sum()), 'max_orgs': int(counts.max())
+    }
+
+def test_snapshot_hides_concurrent_writes(store):
+    store.upsert_records(make_records(20))
+    with store.snapshot() as conn:
+        AwardStore(store.db_path).upsert_records(make_records(25)[20:])
+        assert conn.execute('SELECT COUNT(*) FROM awards').fetchone()[0] == 20
+    assert store.count_awards() == 25
+
+@pytest.mark.parametrize('chunk_size', [7, 50, 10 ** 6])
+@pytest.mark.parametrize('filters', [{}, {'year': 2019}])
+def test_iter_frames_concatenate_to_load_frames(award_store, chunk_size, filters):
+    expected = award_store.load_frames(**filters)
+    for table in ('awards', 'projects', 'winners'):
+        chunks = list(award_store.iter_frames(table, chunk_size, **filters))
+        # 各块分类列的词表外类别不同，拼接后为object类型，只比较取值
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected[table], check_dtype=False, check_categorical=False)
+        if table == 'winners':
+            # 同一项目的获奖人不跨块
+            seen = [set(chunk['project_id']) for chunk in chunks]
+            assert sum(len(s) for s in seen) == len(set().union(*seen))
+        else:
+            assert all(len(chunk) <= chunk_size for chunk in chunks)
+
+def test_load_frames_columns_match_transformer(store):
+    records = make_records(10)
+    store.upsert_records(records)
+    data = store.load_frames()
+    expected = DataTransformer.to_dataframe(records)
+    for name in ('awards', 'projects', 'winners'):
+        assert list(data[name].columns) == list(expected[name].columns)
+
+def test_unknown_table_rejected(store):
+    with pytest.raises(ValueError):
+        next(store.iter_frames('organizations'))
\ No newline at end of file
@@ -0,0 +1,71 @@
+import random
+from collections import Counter
+
+import jieba
+import jieba.analyse
+import pytest
+
+import analyzer.text as text_module
+from analyzer.text import TextAnalysisService
+
+WORDS = ['人工智能', '深度学习', '新型', '复合材料', '高性能', '催化剂', '基因', '治疗', '肿瘤', '精准',
+         '研究', '应用', '关键技术', '及其', '的', '与', '2020', 'AI', '5G', '水稻', '育种', '智能电网']
+
+def make_names(count, seed=0):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(WORDS) for _ in range(rng.randint(1, 6))) for _ in range(count)]
+
+@pytest.fixture(scope='module')
+def names():
+    return make_names(600)
+
+@pytest.fixture
+def service(tmp_path):
+    return TextAnalysisService(token_cache=str(tmp_path / 'tokens.pkl'), max_workers=1)
+
+def test_keywords_match_extract_tags(service, names):
+    token_lists = service.tokenize(names)
+    # 原实现：对空格拼接的全部名称调用 extract_tags
+    expected = dict(jieba.analyse.extract_tags(' '.join(names), topK=len(names), withWeight=True))
+    keywords = service.extract_keywords(token_lists, top_k=len(names))
+    assert keywords == pytest.approx(expected)
+    assert list(service.extract_keywords(token_lists, top_k=5).values()) == pytest.approx(
+        sorted(expected.values(), reverse=True)[:5]
+    )
+
+def test_word_frequency_matches_joined_cut(service, names):
+    results = service.analyze(names, top_k=10, top_words=len(names))
+    # 原实现对拼接文本分词，拼接用的空格也计为词
+    baseline = Counter(jieba.cut(' '.join(names)))
+    del baseline[' ']
+    assert results['word_frequency'] == dict(baseline)
+    assert results['total_words'] == sum(baseline.values())
+    assert results['unique_words'] == len(baseline)
+    assert len(results['keywords']) == 10
+
+def test_tokens_are_cached_per_name(service, names, monkeypatch):
+    service.tokenize(names[:300])
+    seen = []
+    tokenize_chunk = text_module._tokenize_chunk
+    monkeypatch.setattr(text_module, '_tokenize_chunk', lambda chunk: seen.extend(chunk) or tokenize_chunk(chunk))
+    tokens = service.tokenize(names)
+    assert seen == list(dict.fromkeys(name for name in names[300:] if name not in names[:300]))
+    assert tokens == [tuple(jieba.cut(name)) for name in names]
+
+def test_token_cache_round_trip(service, names, tmp_path):
+    service.tokenize(names)
+    service.save_tokens()
+    restored = TextAnalysisService(token_cache=service.token_cache)
+    restored.load_tokens()
+    assert restored.tokens == service.tokens
+    # 没有新分词时不改写缓存文件
+    assert not restored._dirty
+
+def test_parallel_tokenize_matches_sequential(tmp_path, names):
+    service = TextAnalysisService(token_cache=str(tmp_path / 'tokens.pkl'), max_workers=2, chunk_size=150)
+    service.parallel_threshold = 100
+    assert service.tokenize(names) == [tuple(jieba.cut(name)) for name in names]
+
+def test_empty_names(service):
+    results = service.analyze([])
+    assert results == {'keywords': {}, 'word_frequency': {}, 'total_words': 0, 'unique_words': 0}
\ No newline at end of file
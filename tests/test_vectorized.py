@@ -0,0 +1,148 @@
+import random
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from processor.cleaner import DataCleaner
+from processor.dedup import DuplicateDetector
+from processor.parallel import ParallelCleaner
+from processor.transformer import DataTransformer
+from processor.vectorized import VectorizedCleaner, SEPARATOR
+from storage.sqlite import AwardStore
+
+# 清洗规则涉及的各类字符：HTML标签、各种空白、特殊符号、分隔符本身
+FRAGMENTS = ['北京', '大学', '研究所', '项目', 'abc', '123', ' ', '  ', '\t', '\n', '　', '<b>', '</b>', '<',
+             '>', '&', '-', '《', '》', '"', "'", '_', '，', '。', '!', '@', SEPARATOR]
+ODD_VALUES = [None, '', ' ', float('nan'), 0, 1, 2.5, True, [], ['x'], {}, 'ab', '张']
+
+def _text(rng):
+    if rng.random() < 0.1:
+        return rng.choice(ODD_VALUES)
+    return ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 8)))
+
+def _maybe(rng, value):
+    """随机改为不合法的结构"""
+    return rng.choice([None, 'x', 1, {}, ('a',)]) if rng.random() < 0.05 else value
+
+def make_nested(count, seed=0):
+    """生成包含不合法字段和结构的待清理奖项"""
+    rng = random.Random(seed)
+    data = []
+    for i in range(count):
+        projects = []
+        for _ in range(rng.randint(0, 4)):
+            winners = [_maybe(rng, {'name': _text(rng), 'organization': _text(rng)}) for _ in range(rng.randint(0, 4))]
+            project = {'name': _text(rng), 'winners': _maybe(rng, winners), 'organization': _text(rng),
+                       'level': rng.choice(['一等奖', None, 3])}
+            if rng.random() < 0.05:
+                del project['winners']
+            projects.append(_maybe(rng, project))
+        title = _text(rng)
+        award = {
+            'title': f'{title}奖项{i}' if isinstance(title, str) and rng.random() < 0.9 else title,
+            'content': _text(rng),
+            'year': rng.choice([2019, 2020, None]),
+            'award_level': rng.choice(['一等奖', None]),
+            'award_type': rng.choice(['科技进步奖', None]),
+            'source_url': rng.choice([f'http://example.com/{i}', f' https://example.com/<{i}> ', 'ftp://x', None, _text(rng)]),
+            'source_title': _text(rng),
+            'source_engine': 'search',
+            'crawled_at': '2024-01-01 00:00:00',
+            'projects': _maybe(rng, projects)
+        }
+        if rng.random() < 0.05:
+            del award['content']
+        data.append(_maybe(rng, award))
+    return data
+
+def make_raw(count, seed=0):
+    """生成原始搜索结果，描述中带有书名号项目名称"""
+    rng = random.Random(seed)
+    return [
+        {
+            'title': f'{rng.choice([2019, 2020])}年度科学技术奖{rng.choice(["自然科学奖", "科技进步奖", ""])}公示 {i}',
+            'description': f'{rng.choice(["一等奖", "二等奖", ""])} 《{_text(rng)}项目{i}》 《课题{i % 7}》 {_text(rng)}',
+            'url': f'http://example.com/raw/{i % (count - 5)}'
+        }
+        for i in range(count)
+    ]
+
+@pytest.fixture(scope='module')
+def nested():
+    return make_nested(3000)
+
+def test_batch_matches_per_record(nested):
+    cleaner = DataCleaner()
+    expected = [result for result in map(cleaner.clean_award_data, nested) if result]
+    assert VectorizedCleaner().clean_award_batch(nested) == expected
+
+def test_frames_match_transformed_batch(nested):
+    cleaner = VectorizedCleaner()
+    expected = DataTransformer.to_dataframe(cleaner.clean_award_batch(nested))
+    frames = cleaner.clean_frames(nested)
+    for name in ('awards', 'projects', 'winners'):
+        pd.testing.assert_frame_equal(frames[name], expected[name], check_dtype=False)
+
+@pytest.mark.parametrize('clean', ['clean_text_series', 'clean_name_series', 'clean_url_series'])
+def test_series_rules_match_per_record(clean):
+    rng = random.Random(1)
+    values = [''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 10))) for _ in range(2000)]
+    single = getattr(DataCleaner, clean.replace('_series', ''))
+    expected = [single(value) or None for value in values]
+    # 分别检验拼接后一次替换和取值中含有分隔符时的逐个替换
+    for batch in ([v.replace(SEPARATOR, '') for v in values], values):
+        result = getattr(VectorizedCleaner, clean)(pd.Series(batch, dtype=object))
+        assert [v or None for v in result.tolist()] == [single(v) or None for v in batch]
+    assert len(expected) == len(values)
+
+def test_record_frames_match_records():
+    raw = make_raw(500)
+    expected = DataTransformer.to_dataframe(DataCleaner().clean_records(raw, vectorized=True))
+    frames = DataCleaner().clean_records_frames(raw)
+    for name in ('awards', 'projects', 'winners'):
+        pd.testing.assert_frame_equal(
+            frames[name].drop(columns='crawled_at', errors='ignore'),
+            expected[name].drop(columns='crawled_at', errors='ignore'),
+            check_dtype=False
+        )
+
+def test_parallel_frames_merge_chunks_in_order():
+    raw = make_raw(500)
+    single = ParallelCleaner(max_workers=1, batch_size=1000).clean_frames(raw)
+    chunked = ParallelCleaner(max_workers=1, batch_size=37).clean_frames(raw)
+    for name in ('awards', 'projects', 'winners'):
+        pd.testing.assert_frame_equal(
+            chunked[name].drop(columns='crawled_at', errors='ignore'),
+            single[name].drop(columns='crawled_at', errors='ignore')
+        )
+
+def test_deduplicate_frames_matches_records(tmp_path, nested):
+    records = VectorizedCleaner().clean_award_batch(nested)
+    records += [dict(record, source_url=record['source_url'] + '?copy') for record in records[:20]]
+    expected = DuplicateDetector(index_file=str(tmp_path / 'a.json')).deduplicate(records)
+    frames = DuplicateDetector(index_file=str(tmp_path / 'b.json')).deduplicate_frames(
+        DataTransformer.to_dataframe(records)
+    )
+    assert frames['awards']['source_url'].tolist() == [record['source_url'] for record in expected]
+    assert set(frames['projects']['award_id']) <= set(frames['awards']['award_id'])
+    assert set(frames['winners']['project_id']) <= set(frames['projects']['project_id'])
+
+def _dump(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return {
+            table: conn.execute(f'SELECT * FROM {table} ORDER BY id').fetchall()
+            for table in ('awards', 'projects', 'winners', 'organizations')
+        }
+    finally:
+        conn.close()
+
+def test_upsert_frames_matches_records(tmp_path, nested):
+    records = VectorizedCleaner().clean_award_batch(nested)
+    # 同一批中重复的业务键保留最后一条
+    records += [dict(records[0], title='重复奖项标题')]
+    by_records = AwardStore(str(tmp_path / 'records.db'))
+    by_frames = AwardStore(str(tmp_path / 'frames.db'))
+    assert by_records.upsert_records(records) == by_frames.upsert_frames(DataTransformer.to_dataframe(records))
+    assert _dump(by_records.db_path) == _dump(by_frames.db_path)
\ No newline at end of file